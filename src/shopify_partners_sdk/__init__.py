@@ -4,22 +4,73 @@ Shopify Partners API Client - A Python client for the Shopify Partners API.
 This client provides two simple ways to interact with the Shopify Partners GraphQL API:
 1. Raw Query - Execute GraphQL queries directly
 2. FieldSelector - Build queries dynamically with field selection
+
+Both are available on the blocking ShopifyPartnersClient and on the asyncio
+AsyncShopifyPartnersClient.
 """
 
+from collections.abc import Iterable
 import logging
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 import requests
 
+from .client.async_base import AsyncBaseGraphQLClient
 from .client.base import BaseGraphQLClient
-from .client.field_based_client import FieldBasedShopifyPartnersClient
+from .client.field_based_client import (
+    AsyncFieldBasedShopifyPartnersClient,
+    FieldBasedShopifyPartnersClient,
+)
+from .client.rate_limiter import RequestPriority
 from .config import ShopifyPartnersSDKSettings
-from .queries.fields import CommonFields, FieldSelector
+from .queries.batch import QueryBatch
+from .queries.fields import CommonFields, FieldSelector, FrozenFieldSelector
 from .version import __version__
 
+if TYPE_CHECKING:
+    import httpx
+
+    from .models import EntityStore
+    from .schema import SchemaIndex
+
 logger = logging.getLogger(__name__)
 
 
+def _client_settings(
+    organization_id: int,
+    access_token: str,
+    api_version: Optional[str],
+    settings: Optional[ShopifyPartnersSDKSettings],
+) -> ShopifyPartnersSDKSettings:
+    """Combine explicit credentials with optional base settings.
+
+    Args:
+        organization_id: Shopify Partners organization ID
+        access_token: API access token
+        api_version: API version, or None to keep the settings' version
+        settings: Base settings (defaults when None)
+
+    Returns:
+        Validated settings carrying the credentials
+    """
+    values = settings.model_dump() if settings is not None else {}
+    values.update(organization_id=organization_id, access_token=access_token)
+    if api_version is not None:
+        values["api_version"] = api_version
+    return ShopifyPartnersSDKSettings(**values)
+
+
+def _required_credentials(settings: ShopifyPartnersSDKSettings) -> tuple[int, str]:
+    """Get the organization ID and access token of settings.
+
+    Raises:
+        ValueError: If either is missing
+    """
+    if not settings.organization_id or not settings.access_token:
+        raise ValueError("settings must include organization_id and access_token")
+    return settings.organization_id, settings.access_token
+
+
 class ShopifyPartnersClient:
     """
     Simple, clean interface for the Shopify Partners API.
@@ -33,25 +84,27 @@ class ShopifyPartnersClient:
         self,
         organization_id: int,
         access_token: str,
-        api_version: str = "2025-04",
+        api_version: Optional[str] = None,
         http_client: Optional[requests.Session] = None,
+        settings: Optional[ShopifyPartnersSDKSettings] = None,
     ):
         """Initialize the client.
 
         Args:
             organization_id: Shopify Partners organization ID
             access_token: API access token (must start with 'prtapi_')
-            api_version: API version to use (default: 2025-04)
+            api_version: API version to use (default: the settings' version,
+                2025-04 unless configured)
             http_client: Optional custom HTTP client
+            settings: SDK settings for caching, rate limiting, validation and
+                the other optional features
 
         Raises:
             ValueError: If credentials are invalid
         """
         # Create settings
-        settings = ShopifyPartnersSDKSettings(
-            organization_id=organization_id,
-            access_token=access_token,
-            api_version=api_version,
+        settings = _client_settings(
+            organization_id, access_token, api_version, settings
         )
 
         # Initialize base client
@@ -70,18 +123,54 @@ class ShopifyPartnersClient:
 
         logger.info(
             "Shopify Partners Client initialized",
-            api_version=api_version,
-            organization_id=str(organization_id)[:4] + "***",
+            extra={
+                "api_version": settings.api_version,
+                "organization_id": str(organization_id)[:4] + "***",
+            },
+        )
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: ShopifyPartnersSDKSettings,
+        http_client: Optional[requests.Session] = None,
+    ) -> "ShopifyPartnersClient":
+        """Create a client from settings that include the credentials.
+
+        Args:
+            settings: SDK settings with ``organization_id`` and ``access_token``
+            http_client: Optional custom HTTP client
+
+        Returns:
+            Client instance
+
+        Raises:
+            ValueError: If the settings lack credentials or they are invalid
+
+        Example:
+            >>> settings = ShopifyPartnersSDKSettings(
+            ...     organization_id=123, access_token='prtapi_...', entity_store=True
+            ... )
+            >>> client = ShopifyPartnersClient.from_settings(settings)
+        """
+        organization_id, access_token = _required_credentials(settings)
+        return cls(
+            organization_id, access_token, http_client=http_client, settings=settings
         )
 
     def query(
-        self, query_name: str, fields: FieldSelector, **variables
+        self,
+        query_name: str,
+        fields: FieldSelector,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        **variables,
     ) -> dict[str, Any]:
         """Build and execute a query using FieldSelector.
 
         Args:
             query_name: GraphQL query field name (e.g., 'app', 'publicApiVersions')
             fields: Field selection for the query
+            priority: Rate limiter priority class of the request
             **variables: Query variables
 
         Returns:
@@ -100,16 +189,53 @@ class ShopifyPartnersClient:
             >>> result = client.query('app', app_fields, id='123')
         """
         query_builder = self._field_based.query(query_name, fields, **variables)
-        return self._field_based.execute_query_builder(query_builder)
+        return self._field_based.execute_query_builder(query_builder, priority)
+
+    def query_many(
+        self,
+        query_name: str,
+        fields: FieldSelector,
+        variables: Iterable[dict[str, Any]],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> list[Any]:
+        """Run the same query for many sets of variables in batched requests.
+
+        The queries are merged into aliased documents of up to
+        ``max_batch_size`` queries each, so fan-out lookups take a few
+        requests instead of one per lookup.
+
+        Args:
+            query_name: GraphQL query field name (e.g., 'app')
+            fields: Field selection for the query
+            variables: Variables of each query
+            priority: Rate limiter priority class of the requests
+
+        Returns:
+            Root field value of each query, in the order of ``variables``
+
+        Example:
+            >>> fields = FieldSelector().add_fields('id', 'title')
+            >>> apps = client.query_many('app', fields, [{'id': i} for i in ids])
+        """
+        batch = QueryBatch(
+            self._field_based.query(query_name, fields, **query_variables)
+            for query_variables in variables
+        )
+        return self._field_based.execute_batch(batch, priority)
 
     def connection_query(
-        self, query_name: str, node_fields: FieldSelector, **variables
+        self,
+        query_name: str,
+        node_fields: FieldSelector,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        **variables,
     ) -> dict[str, Any]:
         """Build and execute a connection query using FieldSelector.
 
         Args:
             query_name: GraphQL query field name
             node_fields: Field selection for the nodes
+            priority: Rate limiter priority class of the request
             **variables: Query variables
 
         Returns:
@@ -123,16 +249,21 @@ class ShopifyPartnersClient:
         query_builder = self._field_based.connection_query(
             query_name, node_fields, **variables
         )
-        return self._field_based.execute_query_builder(query_builder)
+        return self._field_based.execute_query_builder(query_builder, priority)
 
     def mutation(
-        self, mutation_name: str, result_fields: FieldSelector, **variables
+        self,
+        mutation_name: str,
+        result_fields: FieldSelector,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        **variables,
     ) -> dict[str, Any]:
         """Build and execute a mutation using FieldSelector.
 
         Args:
             mutation_name: GraphQL mutation field name
             result_fields: Field selection for the mutation result
+            priority: Rate limiter priority class of the request
             **variables: Mutation variables
 
         Returns:
@@ -157,13 +288,14 @@ class ShopifyPartnersClient:
         mutation_builder = self._field_based.mutation(
             mutation_name, result_fields, **variables
         )
-        return self._field_based.execute_mutation_builder(mutation_builder)
+        return self._field_based.execute_mutation_builder(mutation_builder, priority)
 
     def execute_raw(
         self,
         query: str,
         variables: Optional[dict[str, Any]] = None,
         operation_name: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> dict[str, Any]:
         """Execute a raw GraphQL query and return the full response.
 
@@ -171,6 +303,7 @@ class ShopifyPartnersClient:
             query: GraphQL query string
             variables: Query variables
             operation_name: Operation name (for multi-operation queries)
+            priority: Rate limiter priority class of the request
 
         Returns:
             Full GraphQL response including data, errors, and extensions
@@ -191,7 +324,7 @@ class ShopifyPartnersClient:
             >>> else:
             >>>     print("Data:", response["data"]["app"])
         """
-        return self._client.execute_query(query, variables, operation_name)
+        return self._client.execute_query(query, variables, operation_name, priority)
 
     def health_check(self) -> dict[str, Any]:
         """Perform a health check on the API connection.
@@ -259,14 +392,320 @@ class ShopifyPartnersClient:
         """
         return self._client.get_stats()
 
+    @property
+    def organization_id(self) -> Union[int, str]:
+        """Get the organization ID the client is authenticated for."""
+        return self._client.auth.organization_id
+
+    @property
+    def schema(self) -> Optional["SchemaIndex"]:
+        """Get the schema index of the configured API version.
+
+        Returns:
+            Schema index, or None if schema typing is disabled or no schema
+            is available for the version
+        """
+        return self._field_based.schema
+
+    @property
+    def entity_store(self) -> Optional["EntityStore"]:
+        """Get the normalized entity store (None unless ``entity_store`` is set)."""
+        return self._client.entity_store
+
+
+class AsyncShopifyPartnersClient:
+    """Asyncio interface for the Shopify Partners API.
+
+    Offers the same operations as :class:`ShopifyPartnersClient`, with the
+    same authentication, retry, rate-limit and error semantics, on a pooled
+    non-blocking HTTP transport. Requires the ``async`` extra (httpx).
+    """
+
+    def __init__(
+        self,
+        organization_id: int,
+        access_token: str,
+        api_version: Optional[str] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+        settings: Optional[ShopifyPartnersSDKSettings] = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            organization_id: Shopify Partners organization ID
+            access_token: API access token (must start with 'prtapi_')
+            api_version: API version to use (default: the settings' version,
+                2025-04 unless configured)
+            http_client: Optional custom ``httpx.AsyncClient``
+            settings: SDK settings for caching, rate limiting, validation and
+                the other optional features
+
+        Raises:
+            ValueError: If credentials are invalid
+            ImportError: If httpx is not installed
+        """
+        settings = _client_settings(
+            organization_id, access_token, api_version, settings
+        )
+
+        self._client = AsyncBaseGraphQLClient(
+            organization_id=organization_id,
+            access_token=access_token,
+            settings=settings,
+            http_client=http_client,
+        )
+        self._field_based = AsyncFieldBasedShopifyPartnersClient(self._client)
+
+        self._client.auth.validate_credentials()
+
+        logger.info(
+            "Async Shopify Partners Client initialized",
+            extra={
+                "api_version": settings.api_version,
+                "organization_id": str(organization_id)[:4] + "***",
+            },
+        )
+
+    @classmethod
+    def from_settings(
+        cls,
+        settings: ShopifyPartnersSDKSettings,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ) -> "AsyncShopifyPartnersClient":
+        """Create a client from settings that include the credentials.
+
+        Args:
+            settings: SDK settings with ``organization_id`` and ``access_token``
+            http_client: Optional custom ``httpx.AsyncClient``
+
+        Returns:
+            Client instance
+
+        Raises:
+            ValueError: If the settings lack credentials or they are invalid
+            ImportError: If httpx is not installed
+        """
+        organization_id, access_token = _required_credentials(settings)
+        return cls(
+            organization_id, access_token, http_client=http_client, settings=settings
+        )
+
+    async def query(
+        self,
+        query_name: str,
+        fields: FieldSelector,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        **variables,
+    ) -> dict[str, Any]:
+        """Build and execute a query using FieldSelector.
+
+        Args:
+            query_name: GraphQL query field name (e.g., 'app', 'publicApiVersions')
+            fields: Field selection for the query
+            priority: Rate limiter priority class of the request
+            **variables: Query variables
+
+        Returns:
+            GraphQL response data
+
+        Example:
+            >>> fields = FieldSelector().add_fields('id', 'title', 'handle')
+            >>> result = await client.query('app', fields, id='123')
+        """
+        query_builder = self._field_based.query(query_name, fields, **variables)
+        return await self._field_based.execute_query_builder(query_builder, priority)
+
+    async def query_many(
+        self,
+        query_name: str,
+        fields: FieldSelector,
+        variables: Iterable[dict[str, Any]],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> list[Any]:
+        """Run the same query for many sets of variables in batched requests.
+
+        Args:
+            query_name: GraphQL query field name (e.g., 'app')
+            fields: Field selection for the query
+            variables: Variables of each query
+            priority: Rate limiter priority class of the requests
+
+        Returns:
+            Root field value of each query, in the order of ``variables``
+
+        Example:
+            >>> fields = FieldSelector().add_fields('id', 'title')
+            >>> apps = await client.query_many('app', fields, [{'id': i} for i in ids])
+        """
+        batch = QueryBatch(
+            self._field_based.query(query_name, fields, **query_variables)
+            for query_variables in variables
+        )
+        return await self._field_based.execute_batch(batch, priority)
+
+    async def connection_query(
+        self,
+        query_name: str,
+        node_fields: FieldSelector,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        **variables,
+    ) -> dict[str, Any]:
+        """Build and execute a connection query using FieldSelector.
+
+        Args:
+            query_name: GraphQL query field name
+            node_fields: Field selection for the nodes
+            priority: Rate limiter priority class of the request
+            **variables: Query variables
+
+        Returns:
+            GraphQL response data
+
+        Example:
+            >>> app_fields = FieldSelector().add_fields('id', 'title', 'handle')
+            >>> result = await client.connection_query('apps', app_fields, first=25)
+        """
+        query_builder = self._field_based.connection_query(
+            query_name, node_fields, **variables
+        )
+        return await self._field_based.execute_query_builder(query_builder, priority)
+
+    async def mutation(
+        self,
+        mutation_name: str,
+        result_fields: FieldSelector,
+        priority: RequestPriority = RequestPriority.NORMAL,
+        **variables,
+    ) -> dict[str, Any]:
+        """Build and execute a mutation using FieldSelector.
+
+        Args:
+            mutation_name: GraphQL mutation field name
+            result_fields: Field selection for the mutation result
+            priority: Rate limiter priority class of the request
+            **variables: Mutation variables
+
+        Returns:
+            GraphQL response data
+        """
+        mutation_builder = self._field_based.mutation(
+            mutation_name, result_fields, **variables
+        )
+        return await self._field_based.execute_mutation_builder(
+            mutation_builder, priority
+        )
+
+    async def execute_raw(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute a raw GraphQL query and return the full response.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            operation_name: Operation name (for multi-operation queries)
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            Full GraphQL response including data, errors, and extensions
+        """
+        return await self._client.execute_query(
+            query, variables, operation_name, priority
+        )
+
+    async def health_check(self) -> dict[str, Any]:
+        """Perform a health check on the API connection.
+
+        Returns:
+            Health check results
+        """
+        try:
+            query = """
+            query HealthCheck {
+              publicApiVersions {
+                handle
+                supported
+              }
+            }
+            """
+            response = await self.execute_raw(query)
+            result = response.get("data", {})
+
+            return {
+                "status": "healthy",
+                "api_accessible": True,
+                "authentication": "valid",
+                "available_versions": len(result.get("publicApiVersions", [])),
+            }
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "api_accessible": False,
+                "error": str(e),
+            }
+
+    async def close(self):
+        """Close the client and release pooled connections.
+
+        Example:
+            >>> await client.close()
+        """
+        await self._client.close()
+        logger.info("Async Shopify Partners Client closed")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Get client statistics.
+
+        Returns:
+            Dictionary with request stats
+        """
+        return self._client.get_stats()
+
+    @property
+    def organization_id(self) -> Union[int, str]:
+        """Get the organization ID the client is authenticated for."""
+        return self._client.auth.organization_id
+
+    @property
+    def schema(self) -> Optional["SchemaIndex"]:
+        """Get the schema index of the configured API version.
+
+        Returns:
+            Schema index, or None if schema typing is disabled or no schema
+            is available for the version
+        """
+        return self._field_based.schema
+
+    @property
+    def entity_store(self) -> Optional["EntityStore"]:
+        """Get the normalized entity store (None unless ``entity_store`` is set)."""
+        return self._client.entity_store
+
 
 __all__ = [
     "__version__",
     # Main API
     "ShopifyPartnersClient",
+    "AsyncShopifyPartnersClient",
     # Field selection system
     "FieldSelector",
+    "FrozenFieldSelector",
+    "QueryBatch",
     "CommonFields",
     # Configuration
     "ShopifyPartnersSDKSettings",
+    "RequestPriority",
 ]
@@ -1,14 +1,50 @@
 """Client components for the Shopify Partners SDK."""
 
+from .async_base import AsyncBaseGraphQLClient
 from .auth import AuthenticationHandler
 from .base import BaseGraphQLClient
-from .rate_limiter import RateLimiter
+from .cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+)
+from .coordinator import RateLimitCoordinator
+from .limiter_backends import (
+    BucketBackend,
+    FileLockBucketBackend,
+    SharedRateLimiter,
+    SocketBucketBackend,
+)
+from .rate_limiter import (
+    AdaptiveRateLimiter,
+    CostAwareRateLimiter,
+    RateLimiter,
+    RequestPriority,
+    Reservation,
+    create_rate_limiter,
+)
 from .retry import ExponentialBackoff, RetryHandler
 
 __all__ = [
     "AuthenticationHandler",
+    "AsyncBaseGraphQLClient",
     "BaseGraphQLClient",
     "RateLimiter",
+    "RequestPriority",
+    "Reservation",
+    "CostAwareRateLimiter",
+    "AdaptiveRateLimiter",
+    "create_rate_limiter",
+    "SharedRateLimiter",
+    "BucketBackend",
+    "FileLockBucketBackend",
+    "SocketBucketBackend",
+    "RateLimitCoordinator",
+    "ResponseCache",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "SQLiteCacheBackend",
     "RetryHandler",
     "ExponentialBackoff",
 ]
@@ -0,0 +1,388 @@
+"""Async HTTP client for the Shopify Partners GraphQL API."""
+
+import asyncio
+from contextlib import suppress
+import json
+import logging
+from typing import Any, Optional
+
+import requests
+
+from shopify_partners_sdk.client.base import _GraphQLClientCore
+from shopify_partners_sdk.client.coalescing import AsyncSingleFlight
+from shopify_partners_sdk.client.rate_limiter import RequestPriority
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.exceptions.auth import ForbiddenError, UnauthorizedError
+from shopify_partners_sdk.exceptions.graphql import GraphQLResponseError
+from shopify_partners_sdk.exceptions.rate_limit import RateLimitServerError
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBaseGraphQLClient(_GraphQLClientCore):
+    """Asyncio GraphQL client for the Shopify Partners API.
+
+    Mirrors :class:`~shopify_partners_sdk.client.base.BaseGraphQLClient`
+    (authentication, rate limiting, retry and error handling) on top of a
+    pooled ``httpx.AsyncClient``, so many requests can be in flight on one
+    event loop without a thread each. It is used with ``async with``; it is
+    not a blocking context manager.
+
+    Transport failures are reported with the same ``requests`` exception types
+    as the sync client, so retry policies and caller ``except`` clauses behave
+    identically for both.
+    """
+
+    def __init__(
+        self,
+        organization_id: Optional[str] = None,
+        access_token: Optional[str] = None,
+        settings: Optional[ShopifyPartnersSDKSettings] = None,
+        http_client: Optional["httpx.AsyncClient"] = None,
+    ) -> None:
+        """Initialize the async GraphQL client.
+
+        Args:
+            organization_id: Shopify Partners organization ID
+            access_token: Shopify Partners API access token
+            settings: SDK settings instance
+            http_client: Custom ``httpx.AsyncClient`` (optional)
+
+        Raises:
+            ImportError: If httpx is not installed
+        """
+        if httpx is None:
+            raise ImportError(
+                "AsyncBaseGraphQLClient requires httpx. Install it with "
+                "`pip install 'shopify-partners-sdk[async]'`."
+            )
+        super().__init__(organization_id, access_token, settings)
+        self._single_flight = AsyncSingleFlight()
+        self._init_http_client(http_client)
+        self._background_tasks: set[asyncio.Task] = set()
+
+    def _init_http_client(self, http_client: Optional["httpx.AsyncClient"]) -> None:
+        """Set up the pooled async HTTP transport.
+
+        Args:
+            http_client: Custom ``httpx.AsyncClient`` (optional)
+        """
+        if http_client:
+            self._http_client = http_client
+            self._owns_http_client = False
+        else:
+            self._http_client = httpx.AsyncClient(
+                timeout=self._settings.timeout_seconds,
+                limits=httpx.Limits(
+                    max_connections=self._settings.max_connections,
+                    max_keepalive_connections=self._settings.max_keepalive_connections,
+                ),
+            )
+            self._owns_http_client = True
+
+    async def execute_query(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute a GraphQL query.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            operation_name: Operation name (for multi-operation queries)
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            GraphQL response data
+
+        Raises:
+            AuthenticationError: If authentication fails
+            GraphQLError: If GraphQL errors occur, or if the query fails
+                local validation (when ``validate_queries`` is enabled)
+            RateLimitError: If rate limits are exceeded
+            requests.HTTPError: If HTTP errors occur
+        """
+        # Validate authentication
+        self._auth.validate_credentials()
+
+        # Validate the document locally before spending a rate limit token
+        self._validate_query(query)
+
+        # Serve read-only queries from the response cache when enabled
+        cache_key = self._cache_key(query, variables, operation_name)
+        if cache_key is not None:
+            cached = await self._response_cache.get_async(cache_key)
+            if cached is not None:
+                response, fresh = cached
+                if not fresh:
+                    self._refresh_in_background(
+                        cache_key, query, variables, operation_name
+                    )
+                return self._normalize_entities(response)
+
+        return await self._fetch_query(
+            query, variables, operation_name, priority, cache_key
+        )
+
+    async def _fetch_query(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+        priority: RequestPriority,
+        cache_key: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Send a query, sharing the request with identical in-flight queries.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            operation_name: Operation name
+            priority: Rate limiter priority class of the request
+            cache_key: Response cache key to store the response under
+
+        Returns:
+            GraphQL response data
+        """
+
+        async def fetch() -> dict[str, Any]:
+            response = await self._send_query(
+                query, variables, operation_name, priority
+            )
+            if cache_key is not None:
+                await self._response_cache.set_async(
+                    cache_key, response, query, operation_name
+                )
+            # Normalize before the response is shared with coalesced callers
+            return self._normalize_entities(response)
+
+        # Share one request between concurrent identical queries
+        key = self._coalescing_key(query, variables, operation_name)
+        if key is not None:
+            return await self._single_flight.do(key, fetch)
+        return await fetch()
+
+    def _refresh_in_background(
+        self,
+        cache_key: str,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> None:
+        """Refresh a stale cached response from a background task.
+
+        Refreshes run at bulk priority since no caller is waiting for them.
+        """
+        if not self._response_cache.start_refresh(cache_key):
+            return
+
+        async def refresh() -> None:
+            try:
+                await self._fetch_query(
+                    query, variables, operation_name, RequestPriority.BULK, cache_key
+                )
+            except Exception as e:
+                logger.warning(
+                    "Background refresh of cached response failed",
+                    extra={"error": str(e)},
+                )
+            finally:
+                self._response_cache.finish_refresh(cache_key)
+
+        # Keep a reference so the task is not garbage collected while running
+        task = asyncio.ensure_future(refresh())
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _send_query(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+        priority: RequestPriority,
+    ) -> dict[str, Any]:
+        """Send a validated query with rate limiting and retry.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            operation_name: Operation name
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            GraphQL response data
+        """
+        # Prepare request
+        payload = {"query": query}
+        if variables:
+            payload["variables"] = variables
+        if operation_name:
+            payload["operationName"] = operation_name
+
+        # Execute with rate limiting and retry
+        response_data = await self._retry_handler.execute_with_retry_async(
+            self._execute_request_with_rate_limiting,
+            payload,
+            priority,
+        )
+
+        # Process GraphQL response
+        return self._process_graphql_response(response_data)
+
+    async def _execute_request_with_rate_limiting(
+        self,
+        payload: dict[str, Any],
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute HTTP request with rate limiting.
+
+        Args:
+            payload: GraphQL request payload
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            Raw response data
+        """
+        # Acquire rate limit token
+        reserved = await self._rate_limiter.acquire_async(priority=priority)
+
+        # Execute HTTP request, letting adaptive limiters react to throttling.
+        # Whatever the outcome, the request no longer holds limiter capacity
+        try:
+            response_data = await self._execute_http_request(payload)
+            if isinstance(response_data, dict):
+                # Keep server-synchronized limiters up to date, even for errors
+                self._rate_limiter.update_from_extensions(
+                    response_data.get("extensions")
+                )
+        except RateLimitServerError as e:
+            self._rate_limiter.record_throttle(e.retry_after)
+            raise
+        finally:
+            self._rate_limiter.settle(reserved)
+        self._rate_limiter.record_success()
+        return response_data
+
+    async def _execute_http_request(self, payload: dict[str, Any]) -> dict[str, Any]:
+        """Execute the actual HTTP request.
+
+        Args:
+            payload: GraphQL request payload
+
+        Returns:
+            Raw response data
+
+        Raises:
+            requests.HTTPError: If HTTP errors occur
+            requests.ConnectionError: If the connection fails
+            requests.Timeout: If the request times out
+            AuthenticationError: If authentication fails
+            RateLimitServerError: If server rate limits are hit
+        """
+        endpoint = self._auth.get_api_endpoint()
+        headers = self._auth.get_request_headers()
+
+        self._request_count += 1
+
+        logger.info(
+            "Executing GraphQL request",
+            extra={
+                "endpoint": endpoint,
+                "operation": payload.get("operationName"),
+                "variables_count": len(payload.get("variables", {})),
+            },
+        )
+
+        try:
+            response = await self._http_client.post(
+                endpoint,
+                headers=headers,
+                json=payload,
+                timeout=self._settings.timeout_seconds,
+            )
+        except httpx.TimeoutException as e:
+            self._error_count += 1
+            raise requests.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            self._error_count += 1
+            raise requests.ConnectionError(str(e)) from e
+
+        # Handle HTTP status codes
+        if response.status_code == 401:
+            self._error_count += 1
+            raise UnauthorizedError("API request was not authorized")
+        if response.status_code == 403:
+            self._error_count += 1
+            raise ForbiddenError("API request was forbidden - insufficient permissions")
+        if response.status_code == 429:
+            self._error_count += 1
+            retry_after = None
+            if "retry-after" in response.headers:
+                with suppress(ValueError):
+                    retry_after = float(response.headers["retry-after"])
+            raise RateLimitServerError(retry_after=retry_after)
+
+        # Raise for other HTTP errors
+        if response.is_error:
+            self._error_count += 1
+            logger.warning(
+                "HTTP request failed",
+                extra={"error": f"HTTP {response.status_code}", "endpoint": endpoint},
+            )
+            raise requests.HTTPError(
+                f"{response.status_code} Error for url: {endpoint}",
+                response=response,
+            )
+
+        # Parse JSON response
+        try:
+            return response.json()
+        except json.JSONDecodeError as e:
+            self._error_count += 1
+            raise GraphQLResponseError(
+                "Failed to parse JSON response",
+                response_data=response.text,
+            ) from e
+
+    async def execute_mutation(
+        self,
+        mutation: str,
+        variables: Optional[dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute a GraphQL mutation.
+
+        Args:
+            mutation: GraphQL mutation string
+            variables: Mutation variables
+            operation_name: Operation name
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            GraphQL response data
+        """
+        return await self.execute_query(mutation, variables, operation_name, priority)
+
+    async def close(self) -> None:
+        """Close the HTTP client and the response cache."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+        if self._response_cache is not None:
+            self._response_cache.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
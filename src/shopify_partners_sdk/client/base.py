@@ -3,12 +3,19 @@
 from contextlib import suppress
 import json
 import logging
+from threading import Thread
 from typing import Any, Optional
 
 import requests
 
 from shopify_partners_sdk.client.auth import AuthenticationHandler
-from shopify_partners_sdk.client.rate_limiter import RateLimiter
+from shopify_partners_sdk.client.cache import ResponseCache, create_response_cache
+from shopify_partners_sdk.client.coalescing import SingleFlight, request_key
+from shopify_partners_sdk.client.rate_limiter import (
+    RateLimiter,
+    RequestPriority,
+    create_rate_limiter,
+)
 from shopify_partners_sdk.client.retry import RetryHandler
 from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
 from shopify_partners_sdk.exceptions.auth import ForbiddenError, UnauthorizedError
@@ -18,14 +25,21 @@ from shopify_partners_sdk.exceptions.graphql import (
     GraphQLResponseError,
 )
 from shopify_partners_sdk.exceptions.rate_limit import RateLimitServerError
+from shopify_partners_sdk.models.store import EntityStore
+from shopify_partners_sdk.schema import QueryValidator, get_schema_index
 
 logger = logging.getLogger(__name__)
 
 
-class BaseGraphQLClient:
-    """Base GraphQL client for the Shopify Partners API.
+class _GraphQLClientCore:
+    """State and response handling shared by the sync and async clients.
 
-    Handles HTTP requests, authentication, rate limiting, and retry logic.
+    Holds the settings, authentication, rate limiter, retry handler, response
+    cache and entity store, and processes responses. Sending requests is left
+    to :class:`BaseGraphQLClient` and
+    :class:`~shopify_partners_sdk.client.async_base.AsyncBaseGraphQLClient`,
+    which are siblings so that neither inherits the other's blocking or
+    awaitable contract.
     """
 
     def __init__(
@@ -33,40 +47,32 @@ class BaseGraphQLClient:
         organization_id: Optional[str] = None,
         access_token: Optional[str] = None,
         settings: Optional[ShopifyPartnersSDKSettings] = None,
-        http_client: Optional[requests.Session] = None,
     ) -> None:
-        """Initialize the GraphQL client.
+        """Initialize the transport-independent client state.
 
         Args:
             organization_id: Shopify Partners organization ID
             access_token: Shopify Partners API access token
             settings: SDK settings instance
-            http_client: Custom HTTP client (optional)
         """
         self._settings = settings or ShopifyPartnersSDKSettings()
         self._auth = AuthenticationHandler(
             organization_id, access_token, self._settings
         )
-        self._rate_limiter = RateLimiter(settings=self._settings)
+        self._rate_limiter = create_rate_limiter(
+            self._settings, organization_id or self._settings.organization_id
+        )
         self._retry_handler = RetryHandler(settings=self._settings)
 
-        # HTTP client configuration
-        if http_client:
-            self._http_client = http_client
-            self._owns_http_client = False
-        else:
-            self._http_client = requests.Session()
-            # Configure session settings
-            adapter = requests.adapters.HTTPAdapter(
-                pool_connections=self._settings.max_connections,
-                pool_maxsize=self._settings.max_keepalive_connections,
-            )
-            self._http_client.mount("http://", adapter)
-            self._http_client.mount("https://", adapter)
-            self._owns_http_client = True
-
         self._request_count = 0
         self._error_count = 0
+        self._query_validator: Optional[QueryValidator] = None
+        self._response_cache = create_response_cache(self._settings)
+        self._entity_store = (
+            EntityStore(self._settings.entity_store_max_entities)
+            if self._settings.entity_store
+            else None
+        )
 
     @property
     def settings(self) -> ShopifyPartnersSDKSettings:
@@ -88,6 +94,16 @@ class BaseGraphQLClient:
         """Get the retry handler."""
         return self._retry_handler
 
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """Get the response cache, or None if responses are not cached."""
+        return self._response_cache
+
+    @property
+    def entity_store(self) -> Optional[EntityStore]:
+        """Get the entity store, or None if responses are not normalized."""
+        return self._entity_store
+
     @property
     def request_count(self) -> int:
         """Get the total number of requests made."""
@@ -98,11 +114,218 @@ class BaseGraphQLClient:
         """Get the total number of errors encountered."""
         return self._error_count
 
+    def _validate_query(self, query: str) -> None:
+        """Validate a query against the schema of the configured API version.
+
+        Does nothing unless ``validate_queries`` is enabled and a schema is
+        available for the API version.
+
+        Args:
+            query: GraphQL query string
+
+        Raises:
+            GraphQLSyntaxError: If the query cannot be parsed
+            GraphQLValidationError: If the query does not match the schema
+            GraphQLMultipleErrors: If the query has several validation errors
+        """
+        if not self._settings.validate_queries:
+            return
+        if self._query_validator is None:
+            schema = get_schema_index(
+                self._settings.api_version, self._settings.schema_dir
+            )
+            if schema is None:
+                return
+            self._query_validator = QueryValidator(schema)
+        self._query_validator.assert_valid(query)
+
+    def _normalize_entities(self, response: dict[str, Any]) -> dict[str, Any]:
+        """Merge the objects of a response into the entity store, if enabled."""
+        if self._entity_store is not None and response.get("data") is not None:
+            response["data"] = self._entity_store.normalize(response["data"])
+        return response
+
+    def _cache_key(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Optional[str]:
+        """Get the response cache key of a query, or None if it is not cached."""
+        if self._response_cache is None:
+            return None
+        return self._response_cache.key(
+            self._auth.get_api_endpoint(),
+            query,
+            variables,
+            operation_name,
+            self._auth.access_token,
+        )
+
+    def _coalescing_key(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> Optional[tuple[str, str, str, Optional[str]]]:
+        """Get the single-flight key of a query, or None to send it as is."""
+        if not self._settings.coalesce_requests:
+            return None
+        return request_key(
+            self._auth.get_api_endpoint(), query, variables, operation_name
+        )
+
+    def _process_graphql_response(
+        self, response_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Process and validate GraphQL response.
+
+        Args:
+            response_data: Raw response data from server
+
+        Returns:
+            Validated GraphQL response data
+
+        Raises:
+            GraphQLError: If GraphQL errors are present
+            GraphQLResponseError: If response format is invalid
+        """
+        if not isinstance(response_data, dict):
+            raise GraphQLResponseError(
+                "Response is not a JSON object",
+                response_data=response_data,
+            )
+
+        # Check for GraphQL errors
+        errors = response_data.get("errors")
+        if errors:
+            self._error_count += 1
+            graphql_errors = []
+
+            for error_data in errors:
+                if not isinstance(error_data, dict):
+                    continue
+
+                message = error_data.get("message", "Unknown GraphQL error")
+                locations = error_data.get("locations")
+                path = error_data.get("path")
+                extensions = error_data.get("extensions")
+
+                graphql_errors.append(
+                    GraphQLError(
+                        message=message,
+                        locations=locations,
+                        path=path,
+                        extensions=extensions,
+                    )
+                )
+
+            if len(graphql_errors) == 1:
+                raise graphql_errors[0]
+            if graphql_errors:
+                raise GraphQLMultipleErrors(graphql_errors)
+
+        # Validate response structure
+        if "data" not in response_data:
+            raise GraphQLResponseError(
+                "Response missing 'data' field",
+                response_data=response_data,
+            )
+
+        logger.info(
+            "GraphQL request successful",
+            has_data=response_data.get("data") is not None,
+            has_extensions=response_data.get("extensions") is not None,
+        )
+
+        return response_data
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get client statistics.
+
+        Returns:
+            Dictionary with client statistics
+        """
+        return {
+            "request_count": self._request_count,
+            "error_count": self._error_count,
+            "error_rate": (self._error_count / max(1, self._request_count)) * 100,
+            "coalesced_requests": self._single_flight.coalesced,
+            "response_cache": self._response_cache.get_stats()
+            if self._response_cache
+            else None,
+            "entity_store": self._entity_store.get_stats()
+            if self._entity_store is not None
+            else None,
+            "rate_limiter": self._rate_limiter.get_stats(),
+            "retry_handler": self._retry_handler.get_stats(),
+            "auth_configured": self._auth.is_authenticated(),
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the client."""
+        return (
+            f"{self.__class__.__name__}("
+            f"requests={self._request_count}, "
+            f"errors={self._error_count}, "
+            f"authenticated={self._auth.is_authenticated()}"
+            f")"
+        )
+
+
+class BaseGraphQLClient(_GraphQLClientCore):
+    """Base GraphQL client for the Shopify Partners API.
+
+    Handles HTTP requests, authentication, rate limiting, and retry logic.
+    """
+
+    def __init__(
+        self,
+        organization_id: Optional[str] = None,
+        access_token: Optional[str] = None,
+        settings: Optional[ShopifyPartnersSDKSettings] = None,
+        http_client: Optional[requests.Session] = None,
+    ) -> None:
+        """Initialize the GraphQL client.
+
+        Args:
+            organization_id: Shopify Partners organization ID
+            access_token: Shopify Partners API access token
+            settings: SDK settings instance
+            http_client: Custom HTTP client (optional)
+        """
+        super().__init__(organization_id, access_token, settings)
+        self._single_flight = SingleFlight()
+
+        # HTTP client configuration
+        self._init_http_client(http_client)
+
+    def _init_http_client(self, http_client: Optional[requests.Session]) -> None:
+        """Set up the HTTP transport used for requests.
+
+        Args:
+            http_client: Custom HTTP client (optional)
+        """
+        if http_client:
+            self._http_client = http_client
+            self._owns_http_client = False
+        else:
+            self._http_client = requests.Session()
+            # Configure session settings
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=self._settings.max_connections,
+                pool_maxsize=self._settings.max_keepalive_connections,
+            )
+            self._http_client.mount("http://", adapter)
+            self._http_client.mount("https://", adapter)
+            self._owns_http_client = True
+
     def execute_query(
         self,
         query: str,
         variables: Optional[dict[str, Any]] = None,
         operation_name: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> dict[str, Any]:
         """Execute a GraphQL query.
 
@@ -110,19 +333,119 @@ class BaseGraphQLClient:
             query: GraphQL query string
             variables: Query variables
             operation_name: Operation name (for multi-operation queries)
+            priority: Rate limiter priority class of the request
 
         Returns:
             GraphQL response data
 
         Raises:
             AuthenticationError: If authentication fails
-            GraphQLError: If GraphQL errors occur
+            GraphQLError: If GraphQL errors occur, or if the query fails
+                local validation (when ``validate_queries`` is enabled)
             RateLimitError: If rate limits are exceeded
             requests.HTTPError: If HTTP errors occur
         """
         # Validate authentication
         self._auth.validate_credentials()
 
+        # Validate the document locally before spending a rate limit token
+        self._validate_query(query)
+
+        # Serve read-only queries from the response cache when enabled
+        cache_key = self._cache_key(query, variables, operation_name)
+        if cache_key is not None:
+            cached = self._response_cache.get(cache_key)
+            if cached is not None:
+                response, fresh = cached
+                if not fresh:
+                    self._refresh_in_background(
+                        cache_key, query, variables, operation_name
+                    )
+                return self._normalize_entities(response)
+
+        return self._fetch_query(query, variables, operation_name, priority, cache_key)
+
+    def _fetch_query(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+        priority: RequestPriority,
+        cache_key: Optional[str] = None,
+    ) -> dict[str, Any]:
+        """Send a query, sharing the request with identical in-flight queries.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            operation_name: Operation name
+            priority: Rate limiter priority class of the request
+            cache_key: Response cache key to store the response under
+
+        Returns:
+            GraphQL response data
+        """
+
+        def fetch() -> dict[str, Any]:
+            response = self._send_query(query, variables, operation_name, priority)
+            if cache_key is not None:
+                self._response_cache.set(cache_key, response, query, operation_name)
+            # Normalize before the response is shared with coalesced callers
+            return self._normalize_entities(response)
+
+        # Share one request between concurrent identical queries
+        key = self._coalescing_key(query, variables, operation_name)
+        if key is not None:
+            return self._single_flight.do(key, fetch)
+        return fetch()
+
+    def _refresh_in_background(
+        self,
+        cache_key: str,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+    ) -> None:
+        """Refresh a stale cached response from a background thread.
+
+        Refreshes run at bulk priority since no caller is waiting for them.
+        """
+        if not self._response_cache.start_refresh(cache_key):
+            return
+
+        def refresh() -> None:
+            try:
+                self._fetch_query(
+                    query, variables, operation_name, RequestPriority.BULK, cache_key
+                )
+            except Exception as e:
+                logger.warning(
+                    "Background refresh of cached response failed",
+                    extra={"error": str(e)},
+                )
+            finally:
+                self._response_cache.finish_refresh(cache_key)
+
+        Thread(target=refresh, daemon=True).start()
+
+    def _send_query(
+        self,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+        priority: RequestPriority,
+    ) -> dict[str, Any]:
+        """Send a validated query with rate limiting and retry.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            operation_name: Operation name
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            GraphQL response data
+        """
         # Prepare request
         payload = {"query": query}
         if variables:
@@ -134,6 +457,7 @@ class BaseGraphQLClient:
         response_data = self._retry_handler.execute_with_retry(
             self._execute_request_with_rate_limiting,
             payload,
+            priority,
         )
 
         # Process GraphQL response
@@ -142,20 +466,36 @@ class BaseGraphQLClient:
     def _execute_request_with_rate_limiting(
         self,
         payload: dict[str, Any],
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> dict[str, Any]:
         """Execute HTTP request with rate limiting.
 
         Args:
             payload: GraphQL request payload
+            priority: Rate limiter priority class of the request
 
         Returns:
             Raw response data
         """
         # Acquire rate limit token
-        self._rate_limiter.acquire()
+        reserved = self._rate_limiter.acquire(priority=priority)
 
-        # Execute HTTP request
-        return self._execute_http_request(payload)
+        # Execute HTTP request, letting adaptive limiters react to throttling.
+        # Whatever the outcome, the request no longer holds limiter capacity
+        try:
+            response_data = self._execute_http_request(payload)
+            if isinstance(response_data, dict):
+                # Keep server-synchronized limiters up to date, even for errors
+                self._rate_limiter.update_from_extensions(
+                    response_data.get("extensions")
+                )
+        except RateLimitServerError as e:
+            self._rate_limiter.record_throttle(e.retry_after)
+            raise
+        finally:
+            self._rate_limiter.settle(reserved)
+        self._rate_limiter.record_success()
+        return response_data
 
     def _execute_http_request(self, payload: dict[str, Any]) -> dict[str, Any]:
         """Execute the actual HTTP request.
@@ -230,76 +570,12 @@ class BaseGraphQLClient:
             )
             raise
 
-    def _process_graphql_response(
-        self, response_data: dict[str, Any]
-    ) -> dict[str, Any]:
-        """Process and validate GraphQL response.
-
-        Args:
-            response_data: Raw response data from server
-
-        Returns:
-            Validated GraphQL response data
-
-        Raises:
-            GraphQLError: If GraphQL errors are present
-            GraphQLResponseError: If response format is invalid
-        """
-        if not isinstance(response_data, dict):
-            raise GraphQLResponseError(
-                "Response is not a JSON object",
-                response_data=response_data,
-            )
-
-        # Check for GraphQL errors
-        errors = response_data.get("errors")
-        if errors:
-            self._error_count += 1
-            graphql_errors = []
-
-            for error_data in errors:
-                if not isinstance(error_data, dict):
-                    continue
-
-                message = error_data.get("message", "Unknown GraphQL error")
-                locations = error_data.get("locations")
-                path = error_data.get("path")
-                extensions = error_data.get("extensions")
-
-                graphql_errors.append(
-                    GraphQLError(
-                        message=message,
-                        locations=locations,
-                        path=path,
-                        extensions=extensions,
-                    )
-                )
-
-            if len(graphql_errors) == 1:
-                raise graphql_errors[0]
-            if graphql_errors:
-                raise GraphQLMultipleErrors(graphql_errors)
-
-        # Validate response structure
-        if "data" not in response_data:
-            raise GraphQLResponseError(
-                "Response missing 'data' field",
-                response_data=response_data,
-            )
-
-        logger.info(
-            "GraphQL request successful",
-            has_data=response_data.get("data") is not None,
-            has_extensions=response_data.get("extensions") is not None,
-        )
-
-        return response_data
-
     def execute_mutation(
         self,
         mutation: str,
         variables: Optional[dict[str, Any]] = None,
         operation_name: Optional[str] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> dict[str, Any]:
         """Execute a GraphQL mutation.
 
@@ -310,31 +586,19 @@ class BaseGraphQLClient:
             mutation: GraphQL mutation string
             variables: Mutation variables
             operation_name: Operation name
+            priority: Rate limiter priority class of the request
 
         Returns:
             GraphQL response data
         """
-        return self.execute_query(mutation, variables, operation_name)
-
-    def get_stats(self) -> dict[str, Any]:
-        """Get client statistics.
-
-        Returns:
-            Dictionary with client statistics
-        """
-        return {
-            "request_count": self._request_count,
-            "error_count": self._error_count,
-            "error_rate": (self._error_count / max(1, self._request_count)) * 100,
-            "rate_limiter": self._rate_limiter.get_stats(),
-            "retry_handler": self._retry_handler.get_stats(),
-            "auth_configured": self._auth.is_authenticated(),
-        }
+        return self.execute_query(mutation, variables, operation_name, priority)
 
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client and the response cache."""
         if self._owns_http_client:
             self._http_client.close()
+        if self._response_cache is not None:
+            self._response_cache.close()
 
     def __enter__(self):
         """Context manager entry."""
@@ -343,13 +607,3 @@ class BaseGraphQLClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
         self.close()
-
-    def __repr__(self) -> str:
-        """String representation of the client."""
-        return (
-            f"BaseGraphQLClient("
-            f"requests={self._request_count}, "
-            f"errors={self._error_count}, "
-            f"authenticated={self._auth.is_authenticated()}"
-            f")"
-        )
@@ -0,0 +1,520 @@
+"""TTL response cache for read-only GraphQL queries."""
+
+import asyncio
+from collections import OrderedDict
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import re
+import sqlite3
+from threading import Lock
+import time
+from typing import Any, Optional, Union
+
+from shopify_partners_sdk.config import (
+    DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    DEFAULT_RESPONSE_CACHE_TTL,
+    ShopifyPartnersSDKSettings,
+    user_cache_dir,
+)
+
+from .coalescing import request_key
+
+logger = logging.getLogger(__name__)
+
+_ROOT_FIELD_RE = re.compile(r"\{\s*(?:\w+\s*:\s*)?(\w+)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Stored entry: (response JSON, fresh until, servable until), wall clock times
+CacheEntry = tuple[str, float, float]
+
+
+class CacheBackend:
+    """Interface of response cache storage."""
+
+    name = "backend"
+    # Whether operations block on I/O (async clients run them on a thread)
+    blocking = False
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get a stored entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The entry, or None if there is none or it can no longer be served
+        """
+        raise NotImplementedError
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, replacing any entry with the same key."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process LRU cache bounded by the total size of the stored responses."""
+
+    name = "memory"
+
+    def __init__(self, max_bytes: int = DEFAULT_RESPONSE_CACHE_MAX_BYTES) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the stored responses (0 disables
+                caching)
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = Lock()
+
+    @property
+    def size(self) -> int:
+        """Get the total size of the stored responses in bytes."""
+        return self._size
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get a stored entry, marking it as recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[2] <= time.time():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry, evicting least recently used entries to fit it."""
+        size = len(entry[0])
+        with self._lock:
+            self._remove(key)
+            if size > self._max_bytes:
+                return
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self._max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def _remove(self, key: str) -> None:
+        """Remove an entry. Must be called with the lock held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= len(entry[0])
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def __len__(self) -> int:
+        """Get the number of stored entries."""
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        """String representation of the backend."""
+        return f"MemoryCacheBackend(entries={len(self)}, size={self._size})"
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Cache stored in an SQLite database file shared by processes on a host.
+
+    The database file is created readable only by the current user.
+    """
+
+    name = "sqlite"
+    blocking = True
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialize the backend, creating the database if needed.
+
+        Args:
+            path: Database file
+        """
+        self._path = Path(path)
+        self._lock = Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+
+    @property
+    def path(self) -> Path:
+        """Get the database file."""
+        return self._path
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get the connection of this process. Must be called with the lock held."""
+        if self._connection is None or self._pid != os.getpid():
+            # Connections must not be shared with forked children. SQLite
+            # gives its journal files the permissions of the database file.
+            os.close(os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600))
+            connection = sqlite3.connect(
+                self._path, timeout=30.0, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "fresh_until REAL NOT NULL, stale_until REAL NOT NULL)"
+            )
+            connection.commit()
+            self._connection, self._pid = connection, os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get a stored entry."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value, fresh_until, stale_until FROM responses "
+                    "WHERE key = ? AND stale_until > ?",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        return tuple(row) if row else None
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry and drop entries that can no longer be served."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                    (key, *entry),
+                )
+                connection.execute(
+                    "DELETE FROM responses WHERE stale_until <= ?", (time.time(),)
+                )
+
+    def delete(self, key: str) -> None:
+        """Remove an entry if present."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def __repr__(self) -> str:
+        """String representation of the backend."""
+        return f"SQLiteCacheBackend(path={str(self._path)!r})"
+
+
+class ResponseCache:
+    """TTL cache of GraphQL responses to read-only queries.
+
+    Responses are keyed on the endpoint (organization and API version), a
+    digest of the access token, the whitespace-normalized query and the
+    canonicalized variables, so clients with different tokens (and scopes)
+    never see each other's responses. Mutations are never cached. With
+    ``stale_while_revalidate``, an expired response is still served for that
+    long while the client refreshes it.
+
+    Async clients use :meth:`get_async` and :meth:`set_async`, which run the
+    operations of a blocking backend on a worker thread.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: float = DEFAULT_RESPONSE_CACHE_TTL,
+        ttls: Optional[dict[str, float]] = None,
+        stale_while_revalidate: float = 0.0,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            backend: Storage of the cached responses
+            ttl: Seconds a response stays fresh by default
+            ttls: Per-operation TTLs keyed by operation name or root field name
+            stale_while_revalidate: Seconds an expired response may still be
+                served while it is refreshed
+        """
+        self._backend = backend
+        self._ttl = ttl
+        self._ttls = dict(ttls or {})
+        self._stale_while_revalidate = stale_while_revalidate
+        self._refreshing: set[str] = set()
+        self._lock = Lock()
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+
+    @property
+    def backend(self) -> CacheBackend:
+        """Get the cache storage backend."""
+        return self._backend
+
+    def key(
+        self,
+        endpoint: str,
+        query: str,
+        variables: Optional[dict[str, Any]],
+        operation_name: Optional[str],
+        access_token: str = "",
+    ) -> Optional[str]:
+        """Get the cache key of a request.
+
+        Args:
+            endpoint: API endpoint the request is sent to
+            query: GraphQL document
+            variables: Query variables
+            operation_name: Operation name
+            access_token: Token the request is sent with (only its digest is
+                part of the key)
+
+        Returns:
+            Cache key, or None if the request is not cacheable (mutations and
+            operations with a TTL of 0)
+        """
+        if not self.ttl_for(query, operation_name):
+            return None
+        normalized = _WHITESPACE_RE.sub(" ", query).strip()
+        identity = request_key(endpoint, normalized, variables, operation_name)
+        if identity is None:
+            return None
+        token = hashlib.sha256(access_token.encode()).hexdigest()
+        return hashlib.sha256(json.dumps([token, *identity]).encode()).hexdigest()
+
+    def ttl_for(self, query: str, operation_name: Optional[str]) -> float:
+        """Get the TTL of an operation.
+
+        The operation name is looked up first, then the first root field.
+
+        Args:
+            query: GraphQL document
+            operation_name: Operation name
+
+        Returns:
+            Seconds a response stays fresh
+        """
+        if operation_name and operation_name in self._ttls:
+            return self._ttls[operation_name]
+        match = _ROOT_FIELD_RE.search(query)
+        if match and match.group(1) in self._ttls:
+            return self._ttls[match.group(1)]
+        return self._ttl
+
+    def get(self, key: str) -> Optional[tuple[dict[str, Any], bool]]:
+        """Look up a cached response.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The response and whether it is still fresh, or None on a miss
+        """
+        return self._lookup(self._backend.get(key))
+
+    async def get_async(self, key: str) -> Optional[tuple[dict[str, Any], bool]]:
+        """Look up a cached response without blocking the event loop.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The response and whether it is still fresh, or None on a miss
+        """
+        if self._backend.blocking:
+            loop = asyncio.get_running_loop()
+            entry = await loop.run_in_executor(None, self._backend.get, key)
+        else:
+            entry = self._backend.get(key)
+        return self._lookup(entry)
+
+    def _lookup(
+        self, entry: Optional[CacheEntry]
+    ) -> Optional[tuple[dict[str, Any], bool]]:
+        """Count a lookup and decode the entry it found."""
+        with self._lock:
+            if entry is None:
+                self._misses += 1
+                return None
+            fresh = entry[1] > time.time()
+            if fresh:
+                self._hits += 1
+            else:
+                self._stale_hits += 1
+        return json.loads(entry[0]), fresh
+
+    def set(
+        self,
+        key: str,
+        response: dict[str, Any],
+        query: str,
+        operation_name: Optional[str],
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key
+            response: GraphQL response data
+            query: GraphQL document (for its TTL)
+            operation_name: Operation name (for its TTL)
+        """
+        entry = self._entry(key, response, query, operation_name)
+        if entry is not None:
+            self._backend.set(key, entry)
+
+    async def set_async(
+        self,
+        key: str,
+        response: dict[str, Any],
+        query: str,
+        operation_name: Optional[str],
+    ) -> None:
+        """Store a response without blocking the event loop.
+
+        Args:
+            key: Cache key
+            response: GraphQL response data
+            query: GraphQL document (for its TTL)
+            operation_name: Operation name (for its TTL)
+        """
+        entry = self._entry(key, response, query, operation_name)
+        if entry is None:
+            return
+        if self._backend.blocking:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._backend.set, key, entry)
+        else:
+            self._backend.set(key, entry)
+
+    def _entry(
+        self,
+        key: str,
+        response: dict[str, Any],
+        query: str,
+        operation_name: Optional[str],
+    ) -> Optional[CacheEntry]:
+        """Encode a response as a cache entry, or None if it cannot be."""
+        try:
+            value = json.dumps(response, separators=(",", ":"))
+        except (TypeError, ValueError):
+            logger.debug("Response is not cacheable", extra={"cache_key": key})
+            return None
+        fresh_until = time.time() + self.ttl_for(query, operation_name)
+        return value, fresh_until, fresh_until + self._stale_while_revalidate
+
+    def start_refresh(self, key: str) -> bool:
+        """Claim the background refresh of a stale response.
+
+        Returns:
+            True if the caller should refresh it, False if a refresh is
+            already running
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def finish_refresh(self, key: str) -> None:
+        """Release the background refresh of a response."""
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def invalidate(self, key: str) -> None:
+        """Remove a cached response."""
+        self._backend.delete(key)
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        self._backend.clear()
+
+    def close(self) -> None:
+        """Release the resources of the backend."""
+        self._backend.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        lookups = self._hits + self._stale_hits + self._misses
+        return {
+            "backend": self._backend.name,
+            "hits": self._hits,
+            "stale_hits": self._stale_hits,
+            "misses": self._misses,
+            "hit_rate": ((self._hits + self._stale_hits) / lookups) * 100
+            if lookups
+            else 0.0,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the cache."""
+        return f"ResponseCache(backend={self._backend!r}, ttl={self._ttl})"
+
+
+def default_cache_path() -> Path:
+    """Get the default database file of the 'sqlite' response cache.
+
+    Returns:
+        Path in the user's private cache directory
+    """
+    return user_cache_dir() / "responses.sqlite"
+
+
+def create_response_cache(
+    settings: ShopifyPartnersSDKSettings,
+) -> Optional[ResponseCache]:
+    """Create the response cache selected by the settings.
+
+    Args:
+        settings: SDK settings instance
+
+    Returns:
+        Response cache, or None if ``response_cache`` is 'none'
+    """
+    if settings.response_cache == "none":
+        return None
+    if settings.response_cache == "sqlite":
+        backend: CacheBackend = SQLiteCacheBackend(
+            settings.response_cache_path or default_cache_path()
+        )
+    else:
+        backend = MemoryCacheBackend(settings.response_cache_max_bytes)
+    return ResponseCache(
+        backend,
+        ttl=settings.response_cache_ttl,
+        ttls=settings.response_cache_ttls,
+        stale_while_revalidate=settings.response_cache_stale_while_revalidate,
+    )
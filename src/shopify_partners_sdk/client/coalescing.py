@@ -0,0 +1,241 @@
+"""Single-flight coalescing of identical in-flight GraphQL queries."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+import copy
+import json
+import re
+from threading import Event, Lock
+from typing import Any, Optional
+
+# Strings and comments (skipped), names and the brackets delimiting definitions
+_TOKEN_RE = re.compile(
+    r'"""(?:\\"""|[^"]|"(?!""))*"""|"(?:\\.|[^"\\\n])*"|#[^\n\r]*'
+    r"|[_A-Za-z][_0-9A-Za-z]*|[{}()]"
+)
+
+_OPERATION_TYPES = ("query", "mutation", "subscription")
+
+
+def _operations(query: str) -> list[tuple[str, Optional[str]]]:
+    """List the operations of a document as (operation type, name) pairs.
+
+    Only the top level of the document is scanned, which is enough to tell
+    operations (including the ``{ ... }`` shorthand query) from fragments.
+    """
+    operations: list[tuple[str, Optional[str]]] = []
+    depth = 0
+    at_definition = True
+    pending: Optional[str] = None
+    for match in _TOKEN_RE.finditer(query):
+        token = match.group()
+        if token[0] in '"#':
+            continue
+        if token in ("{", "("):
+            if pending is not None:
+                operations.append((pending, None))
+            elif at_definition and token == "{":
+                operations.append(("query", None))
+            pending = None
+            at_definition = False
+            depth += 1
+        elif token in ("}", ")"):
+            depth -= 1
+            if depth == 0 and token == "}":
+                at_definition = True
+        elif depth == 0:
+            if pending is not None:
+                operations.append((pending, token))
+                pending = None
+            elif at_definition:
+                at_definition = False
+                if token in _OPERATION_TYPES:
+                    pending = token
+    return operations
+
+
+def operation_type(query: str, operation_name: Optional[str]) -> Optional[str]:
+    """Get the type of the operation a request executes.
+
+    Args:
+        query: GraphQL document
+        operation_name: Operation name selecting one of several operations
+
+    Returns:
+        'query', 'mutation' or 'subscription', or None if the document does
+        not identify exactly one operation to execute
+    """
+    operations = _operations(query)
+    if operation_name is not None:
+        operations = [op for op in operations if op[1] == operation_name]
+    return operations[0][0] if len(operations) == 1 else None
+
+
+def request_key(
+    endpoint: str,
+    query: str,
+    variables: Optional[dict[str, Any]],
+    operation_name: Optional[str],
+) -> Optional[tuple[str, str, str, Optional[str]]]:
+    """Get the coalescing key of a request.
+
+    Variables are canonicalized (sorted keys), so the same values passed in a
+    different order share a key. The endpoint carries the organization and
+    API version.
+
+    Args:
+        endpoint: API endpoint the request is sent to
+        query: GraphQL document
+        variables: Query variables
+        operation_name: Operation name
+
+    Returns:
+        Hashable key, or None if the request must not be coalesced
+        (mutations and subscriptions, which have side effects, and documents
+        whose executed operation cannot be resolved)
+    """
+    if operation_type(query, operation_name) != "query":
+        return None
+    canonical = json.dumps(
+        variables or {}, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return endpoint, query, canonical, operation_name
+
+
+class _Call:
+    """A call in flight and its outcome."""
+
+    __slots__ = ("done", "error", "result", "waiters")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class _AsyncCall:
+    """An asyncio call in flight and the number of callers sharing it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Share one execution between concurrent identical calls (threads).
+
+    The first caller for a key runs the function; callers arriving while it
+    runs wait for it and get a copy of its result, or the same exception.
+    Once the result is shared, every caller gets its own copy, so no caller
+    sees another one's changes. The function must therefore finish
+    preparing its result before returning it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = Lock()
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Get the number of calls served by another caller's execution."""
+        return self._coalesced
+
+    def do(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run ``function``, or wait for the identical call already running.
+
+        Args:
+            key: Identity of the call
+            function: Function executing the call
+
+        Returns:
+            Result of the function (a deep copy if it was shared)
+
+        Raises:
+            Exception: Whatever the function raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+                self._coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        try:
+            call.result = function()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        # No caller can join once the call is forgotten
+        if call.waiters:
+            return copy.deepcopy(call.result)
+        return call.result
+
+
+class AsyncSingleFlight:
+    """Share one execution between concurrent identical calls (asyncio).
+
+    The execution runs as its own task, so cancelling one caller does not
+    cancel it for the others. As with :class:`SingleFlight`, every caller
+    of a shared execution gets its own copy of the result.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._calls: dict[Hashable, _AsyncCall] = {}
+        self._coalesced = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Get the number of calls served by another caller's execution."""
+        return self._coalesced
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[Any]]) -> Any:
+        """Await ``function``, or the identical call already running.
+
+        Args:
+            key: Identity of the call
+            function: Coroutine function executing the call
+
+        Returns:
+            Result of the function (a deep copy if it was shared)
+
+        Raises:
+            Exception: Whatever the function raised
+        """
+        call = self._calls.get(key)
+        if call is not None:
+            call.waiters += 1
+            self._coalesced += 1
+            return copy.deepcopy(await asyncio.shield(call.task))
+
+        call = self._calls[key] = _AsyncCall(asyncio.ensure_future(function()))
+
+        def forget(done: asyncio.Future) -> None:
+            if self._calls.get(key) is call:
+                del self._calls[key]
+            # Retrieve the error, which no caller may be left to await
+            if not done.cancelled():
+                done.exception()
+
+        call.task.add_done_callback(forget)
+        result = await asyncio.shield(call.task)
+        if call.waiters:
+            return copy.deepcopy(result)
+        return result
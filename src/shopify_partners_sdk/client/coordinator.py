@@ -0,0 +1,235 @@
+"""TCP coordinator holding token buckets for rate limiters on several hosts.
+
+Run one coordinator where all workers can reach it, with a shared secret in
+``SHOPIFY_PARTNERS_RATE_LIMIT_COORDINATOR_SECRET`` (or a ``--secret-file``)::
+
+    python -m shopify_partners_sdk.client.coordinator --host 10.0.0.5 --port 8765
+
+and point the workers at it with ``rate_limit_backend="socket"``,
+``rate_limit_coordinator="10.0.0.5:8765"`` and the same
+``rate_limit_coordinator_secret``. The coordinator listens on localhost
+unless ``--host`` says otherwise; the protocol is not encrypted, so bind it
+to a private network interface only. It keeps one bucket per organization;
+clients send the rate and capacity with every request.
+
+Protocol (one line per request and reply, fields separated by spaces)::
+
+    AUTH <secret>                                             -> OK 0
+    RESERVE <key> <tokens> <rate> <capacity> <max_wait or ->  -> OK|DENY <wait>
+    REFUND <key> <tokens> <rate> <capacity>                   -> OK 0
+    PEEK <key> <rate> <capacity>                              -> OK <tokens>
+    RESET <key>                                               -> OK 0
+
+``AUTH`` must be the first line of a connection; the coordinator replies
+``ERR`` and closes the connection otherwise.
+"""
+
+import argparse
+import hmac
+import logging
+from pathlib import Path
+import socketserver
+import sys
+from threading import Lock, Thread
+import time
+from typing import Optional
+
+from shopify_partners_sdk.config import (
+    DEFAULT_RATE_LIMIT_COORDINATOR,
+    ShopifyPartnersSDKSettings,
+)
+
+from .limiter_backends import peek_tokens, refund_tokens, reserve_tokens
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COORDINATOR_PORT = int(DEFAULT_RATE_LIMIT_COORDINATOR.rpartition(":")[2])
+
+
+class _CoordinatorHandler(socketserver.StreamRequestHandler):
+    """Serve the requests of one client connection."""
+
+    server: "_CoordinatorServer"
+
+    def handle(self) -> None:
+        if not self.server.coordinator.authenticate(self.rfile.readline()):
+            self.wfile.write(b"ERR authentication required\n")
+            return
+        self.wfile.write(b"OK 0\n")
+        for line in self.rfile:
+            try:
+                reply = self.server.coordinator.handle_command(line.decode().split())
+            except (ValueError, IndexError, ZeroDivisionError) as e:
+                reply = f"ERR {e}"
+            self.wfile.write(reply.encode() + b"\n")
+
+
+class _CoordinatorServer(socketserver.ThreadingTCPServer):
+    """Threaded TCP server bound to a coordinator."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], coordinator: "RateLimitCoordinator"):
+        self.coordinator = coordinator
+        super().__init__(address, _CoordinatorHandler)
+
+
+class RateLimitCoordinator:
+    """Token bucket server shared by :class:`SocketBucketBackend` clients."""
+
+    def __init__(
+        self,
+        secret: str,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_COORDINATOR_PORT,
+    ) -> None:
+        """Initialize the coordinator and bind its socket.
+
+        Args:
+            secret: Shared secret clients must authenticate with
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+
+        Raises:
+            ValueError: If the secret is empty
+        """
+        if not secret:
+            raise ValueError("The rate limit coordinator requires a secret")
+        self._secret = secret.encode()
+        self._buckets: dict[str, list[float]] = {}
+        self._lock = Lock()
+        self._server = _CoordinatorServer((host, port), self)
+        self._thread: Optional[Thread] = None
+
+    @property
+    def address(self) -> str:
+        """Get the ``host:port`` address clients should connect to."""
+        host, port = self._server.server_address[:2]
+        return f"{host}:{port}"
+
+    def authenticate(self, line: bytes) -> bool:
+        """Check the ``AUTH`` line that opens a connection.
+
+        Args:
+            line: First line received on the connection
+
+        Returns:
+            Whether the line carries the coordinator's secret
+        """
+        command, _, secret = line.rstrip(b"\r\n").partition(b" ")
+        return command == b"AUTH" and hmac.compare_digest(secret, self._secret)
+
+    def handle_command(self, fields: list[str]) -> str:
+        """Execute one protocol command.
+
+        The command is parsed in full before its bucket is looked up, so a
+        malformed request never creates a bucket.
+
+        Args:
+            fields: Command name and arguments
+
+        Returns:
+            Reply line (without newline)
+
+        Raises:
+            ValueError: If the command is unknown or malformed
+        """
+        command, key, *args = fields
+        arity = {"RESERVE": 4, "REFUND": 3, "PEEK": 2, "RESET": 0}.get(command)
+        if arity is None:
+            raise ValueError(f"unknown command {command}")
+        if len(args) != arity:
+            raise ValueError(f"{command} takes {arity} arguments")
+        if command == "RESERVE":
+            max_wait = None if args[3] == "-" else float(args[3])
+            args = args[:3]
+        values = [float(arg) for arg in args]
+        if any(value <= 0 for value in values[-2:]):
+            raise ValueError("rate and capacity must be positive")
+
+        now = time.monotonic()
+        with self._lock:
+            state = self._buckets.setdefault(key, [float("inf"), now])
+            if command == "RESERVE":
+                granted, wait_time = reserve_tokens(state, *values, now, max_wait)
+                return f"{'OK' if granted else 'DENY'} {wait_time!r}"
+            if command == "REFUND":
+                refund_tokens(state, *values, now)
+                return "OK 0"
+            if command == "PEEK":
+                return f"OK {peek_tokens(state, *values, now)!r}"
+            state[0], state[1] = float("inf"), now
+            return "OK 0"
+
+    def serve_forever(self) -> None:
+        """Serve clients until :meth:`shutdown` is called."""
+        logger.info("Rate limit coordinator listening", extra={"address": self.address})
+        self._server.serve_forever()
+
+    def start(self) -> "RateLimitCoordinator":
+        """Serve clients from a background thread.
+
+        Returns:
+            Self for method chaining
+        """
+        self._thread = Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def shutdown(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        """Context manager entry, serving from a background thread."""
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.shutdown()
+
+    def __repr__(self) -> str:
+        """String representation of the coordinator."""
+        return f"RateLimitCoordinator(address={self.address!r})"
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1", help="interface to listen on")
+    parser.add_argument(
+        "--port", type=int, default=DEFAULT_COORDINATOR_PORT, help="port to listen on"
+    )
+    parser.add_argument(
+        "--secret-file",
+        type=Path,
+        help="file holding the shared secret (default: the "
+        "SHOPIFY_PARTNERS_RATE_LIMIT_COORDINATOR_SECRET environment variable)",
+    )
+    args = parser.parse_args(argv)
+
+    if args.secret_file is not None:
+        secret = args.secret_file.read_text(encoding="utf-8").strip()
+    else:
+        secret = ShopifyPartnersSDKSettings().rate_limit_coordinator_secret
+    if not secret:
+        parser.error("a shared secret is required")
+
+    coordinator = RateLimitCoordinator(secret, args.host, args.port)
+    print(f"Rate limit coordinator listening on {coordinator.address}")
+    try:
+        coordinator.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        coordinator.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
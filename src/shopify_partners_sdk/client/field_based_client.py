@@ -1,21 +1,95 @@
 """Field-based query and mutation client for the Shopify Partners API."""
 
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Optional
 
+from shopify_partners_sdk.exceptions.validation import QueryCostExceededError
 from shopify_partners_sdk.mutations.custom_builders import CustomMutationBuilder
+from shopify_partners_sdk.queries.batch import QueryBatch
+from shopify_partners_sdk.queries.cost import estimate_cost, max_page_size_within
 from shopify_partners_sdk.queries.custom_builders import (
     CustomConnectionQueryBuilder,
     CustomFilterableQueryBuilder,
     CustomQueryBuilder,
 )
 from shopify_partners_sdk.queries.fields import FieldSelector
+from shopify_partners_sdk.schema import SchemaIndex, get_schema_index
 
+from .async_base import AsyncBaseGraphQLClient
 from .base import BaseGraphQLClient
+from .rate_limiter import RequestPriority
 
 logger = logging.getLogger(__name__)
 
 
+class _SplitQuery:
+    """Page loop of a root connection query split into smaller pages.
+
+    Holds the cursor, the number of nodes still wanted and the merged edges,
+    so the sync and async clients only differ in how each page is sent.
+    """
+
+    def __init__(self, builder: CustomQueryBuilder, page_size: int) -> None:
+        """Initialize the page loop.
+
+        Args:
+            builder: The query builder to split (``first`` must be set)
+            page_size: Number of nodes per page
+        """
+        self._builder = builder
+        self._page_size = page_size
+        self._query_name = builder.get_query_name()
+        self._remaining = builder.variables["first"]
+        self._cursor = builder.variables.get("after")
+        self._merged: Optional[dict[str, Any]] = None
+        self._page: Optional[CustomQueryBuilder] = None
+
+    def next_page(self) -> Optional[CustomQueryBuilder]:
+        """Get the builder for the next page.
+
+        Returns:
+            Page builder, or None when the query is complete
+        """
+        if self._remaining <= 0:
+            return None
+        page = self._builder.copy().add_variable(
+            "first", min(self._page_size, self._remaining)
+        )
+        self._page = page.add_variable("after", self._cursor)
+        return self._page
+
+    def add_response(self, data: dict[str, Any]) -> Optional[CustomQueryBuilder]:
+        """Merge the response data of the current page.
+
+        Args:
+            data: Response data of the page returned by :meth:`next_page`
+
+        Returns:
+            Builder for the next page, or None when the query is complete
+        """
+        connection = data[self._query_name] or {}
+        page_edges = list(connection.get("edges") or [])
+        edges = page_edges
+        if self._merged is not None:
+            edges = self._merged["edges"] + page_edges
+        # The merged connection keeps the page info of the latest page
+        self._merged = {**connection, "edges": edges}
+
+        requested = self._page.variables["first"]
+        page_info = connection.get("pageInfo") or {}
+        if len(page_edges) < requested or not page_info.get("hasNextPage", True):
+            self._remaining = 0
+        else:
+            self._remaining -= requested
+            self._cursor = edges[-1]["cursor"]
+        return self.next_page()
+
+    def result(self) -> dict[str, Any]:
+        """Get the response data with the edges of all pages merged."""
+        return {self._query_name: self._merged}
+
+
 class FieldBasedShopifyPartnersClient:
     """Field-based client interface for the Shopify Partners API.
 
@@ -31,6 +105,19 @@ class FieldBasedShopifyPartnersClient:
         """
         self._client = base_client
 
+    @property
+    def schema(self) -> Optional[SchemaIndex]:
+        """Get the schema index of the configured API version.
+
+        Returns:
+            Schema index, or None if schema typing is disabled or no schema
+            is available for the version
+        """
+        settings = self._client.settings
+        if not settings.use_schema:
+            return None
+        return get_schema_index(settings.api_version, settings.schema_dir)
+
     # Query building methods
     def query(
         self, query_name: str, fields: FieldSelector, **variables
@@ -51,7 +138,7 @@ class FieldBasedShopifyPartnersClient:
             >>> query = client.field_based.query('publicApiVersions', fields)
             >>> result = client.execute_query_builder(query)
         """
-        builder = CustomQueryBuilder(query_name, fields)
+        builder = CustomQueryBuilder(query_name, fields, schema=self.schema)
         return builder.add_variables(**variables)
 
     def connection_query(
@@ -86,7 +173,9 @@ class FieldBasedShopifyPartnersClient:
         page_info_fields = FieldSelector(["hasNextPage", "hasPreviousPage"])
         connection_fields.add_nested_field("pageInfo", page_info_fields)
 
-        builder = CustomConnectionQueryBuilder(query_name, connection_fields)
+        builder = CustomConnectionQueryBuilder(
+            query_name, connection_fields, schema=self.schema
+        )
         return builder.add_variables(**variables)
 
     def filterable_query(
@@ -109,7 +198,7 @@ class FieldBasedShopifyPartnersClient:
             >>> query = query.with_date_range('2024-01-01', '2024-12-31')
             >>> result = client.execute_query_builder(query)
         """
-        builder = CustomFilterableQueryBuilder(query_name, fields)
+        builder = CustomFilterableQueryBuilder(query_name, fields, schema=self.schema)
         return builder.add_variables(**variables)
 
     # Mutation building methods
@@ -136,40 +225,374 @@ class FieldBasedShopifyPartnersClient:
             >>> mutation = mutation.with_input_variable(credit_input)
             >>> result = client.execute_mutation_builder(mutation)
         """
-        builder = CustomMutationBuilder(mutation_name, result_fields)
+        builder = CustomMutationBuilder(
+            mutation_name, result_fields, schema=self.schema
+        )
         return builder.add_variables(**variables)
 
-    def execute_query_builder(self, builder: CustomQueryBuilder) -> dict[str, Any]:
+    def execute_query_builder(
+        self,
+        builder: CustomQueryBuilder,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
         """Execute a query builder and return the result.
 
         Args:
             builder: The query builder to execute
+            priority: Rate limiter priority class of the request
 
         Returns:
             GraphQL response data
 
         Raises:
             GraphQLError: If the query fails
+            QueryCostExceededError: If the query's estimated cost exceeds
+                ``max_query_cost`` and it cannot be split into pages
         """
-        query = builder.build_query()
+        stored = self._lookup_stored(builder)
+        if stored is not None:
+            return stored
+
+        page_size = self._check_query_cost(builder)
+        if page_size is not None:
+            return self._execute_split_query(builder, page_size, priority)
+
+        query = builder.build_query(pretty=self._client.settings.pretty_queries)
         variables = builder.variables
 
         logger.debug(
             "Executing dynamic query",
-            query_name=builder.get_query_name(),
-            variables=list(variables.keys()),
+            extra={
+                "query_name": builder.get_query_name(),
+                "variables": list(variables.keys()),
+            },
         )
 
-        response = self._client.execute_query(query, variables)
+        response = self._client.execute_query(query, variables, priority=priority)
         return response["data"]
 
+    def execute_batch(
+        self,
+        batch: QueryBatch,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> list[Any]:
+        """Execute a query batch with as few requests as possible.
+
+        The batch is chunked under ``max_batch_size`` and ``max_query_cost``
+        and each chunk is sent as one aliased document. A chunk holding a
+        single builder is executed like :meth:`execute_query_builder`, so an
+        expensive connection query can still be split into pages.
+
+        Args:
+            batch: The query batch to execute
+            priority: Rate limiter priority class of the requests
+
+        Returns:
+            Root field value of each builder, in the order they were added
+
+        Raises:
+            GraphQLError: If a chunk fails (the whole chunk's results are lost)
+            QueryCostExceededError: If a single query's estimated cost exceeds
+                ``max_query_cost`` and it cannot be split into pages
+        """
+        results: list[Any] = []
+        for chunk in self._batch_chunks(batch):
+            if len(chunk) == 1:
+                data = self.execute_query_builder(chunk[0], priority)
+                results.append(data[chunk[0].get_query_name()])
+                continue
+            query, variables = QueryBatch.build_query(
+                chunk, pretty=self._client.settings.pretty_queries
+            )
+            response = self._client.execute_query(query, variables, priority=priority)
+            results.extend(QueryBatch.split_response(chunk, response["data"]))
+        return results
+
+    def _batch_chunks(self, batch: QueryBatch) -> list[list[CustomQueryBuilder]]:
+        """Split a batch into chunks under the configured size and cost."""
+        settings = self._client.settings
+        chunks = batch.chunks(settings.max_batch_size, settings.max_query_cost)
+        logger.debug(
+            "Executing query batch",
+            extra={"queries": len(batch), "requests": len(chunks)},
+        )
+        return chunks
+
+    def _lookup_stored(self, builder: CustomQueryBuilder) -> Optional[dict[str, Any]]:
+        """Answer a lookup by ID from the entity store, if it can be.
+
+        Only done with ``entity_store_lookups`` enabled, for queries whose
+        sole variable is ``id``, and only when the store holds every
+        selected field of an object fetched within ``entity_store_ttl``.
+
+        Args:
+            builder: The query builder to answer
+
+        Returns:
+            Response data built from the store, or None to send the query
+        """
+        store = self._client.entity_store
+        settings = self._client.settings
+        variables = builder.variables
+        if (
+            store is None
+            or not settings.entity_store_lookups
+            or list(variables) != ["id"]
+        ):
+            return None
+        entity = store.lookup(
+            variables["id"], builder._fields, max_age=settings.entity_store_ttl
+        )
+        if entity is None:
+            return None
+        return {builder.get_query_name(): entity}
+
+    def _check_query_cost(self, builder: CustomQueryBuilder) -> Optional[int]:
+        """Check a query against the configured cost budget.
+
+        Args:
+            builder: The query builder to check
+
+        Returns:
+            None if the query is within budget (or no budget is configured),
+            otherwise the page size to split the root connection into
+
+        Raises:
+            QueryCostExceededError: If the query is over budget and cannot be
+                split
+        """
+        settings = self._client.settings
+        budget = settings.max_query_cost
+        if budget is None:
+            return None
+
+        cost = estimate_cost(builder)
+        if cost <= budget:
+            return None
+
+        page_size = None
+        if settings.split_expensive_queries and self._is_splittable(builder):
+            page_size = max_page_size_within(builder, budget)
+        if page_size is None:
+            raise QueryCostExceededError(builder.get_query_name(), cost, budget)
+
+        logger.debug(
+            "Splitting query above cost budget",
+            extra={
+                "query_name": builder.get_query_name(),
+                "cost": cost,
+                "budget": budget,
+                "page_size": page_size,
+            },
+        )
+        return page_size
+
+    @staticmethod
+    def _is_splittable(builder: CustomQueryBuilder) -> bool:
+        """Check whether a query is a forward-paginated root connection.
+
+        Splitting needs the requested ``first`` and the edge cursors to
+        continue from.
+        """
+        variables = builder.variables
+        if not isinstance(variables.get("first"), int) or "last" in variables:
+            return False
+        fields = builder._fields
+        edges = fields._fields.get("edges") if fields is not None else None
+        return isinstance(edges, FieldSelector) and "cursor" in edges._fields
+
+    def _execute_split_query(
+        self,
+        builder: CustomQueryBuilder,
+        page_size: int,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute a root connection query as several smaller pages.
+
+        Args:
+            builder: The query builder to execute
+            page_size: Number of nodes per page
+            priority: Rate limiter priority class of the requests
+
+        Returns:
+            GraphQL response data with the edges of all pages merged
+        """
+        split = _SplitQuery(builder, page_size)
+        page = split.next_page()
+        while page is not None:
+            query = page.build_query(pretty=self._client.settings.pretty_queries)
+            response = self._client.execute_query(
+                query, page.variables, priority=priority
+            )
+            page = split.add_response(response["data"])
+        return split.result()
+
     def execute_mutation_builder(
-        self, builder: CustomMutationBuilder
+        self,
+        builder: CustomMutationBuilder,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute a mutation builder and return the result.
+
+        Args:
+            builder: The mutation builder to execute
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            GraphQL response data
+
+        Raises:
+            GraphQLError: If the mutation fails
+        """
+        mutation = builder.build_mutation(pretty=self._client.settings.pretty_queries)
+        variables = builder.variables
+
+        logger.debug(
+            "Executing dynamic mutation",
+            extra={
+                "mutation_name": builder.get_mutation_name(),
+                "variables": list(variables.keys()),
+            },
+        )
+
+        response = self._client.execute_query(mutation, variables, priority=priority)
+        return response["data"]
+
+
+class AsyncFieldBasedShopifyPartnersClient(FieldBasedShopifyPartnersClient):
+    """Field-based client interface backed by an async GraphQL client.
+
+    Builder methods are shared with :class:`FieldBasedShopifyPartnersClient`;
+    only execution is awaited.
+    """
+
+    def __init__(self, base_client: AsyncBaseGraphQLClient) -> None:
+        """Initialize the async field-based client.
+
+        Args:
+            base_client: The async GraphQL client to use
+        """
+        super().__init__(base_client)
+
+    async def execute_query_builder(
+        self,
+        builder: CustomQueryBuilder,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute a query builder and return the result.
+
+        Args:
+            builder: The query builder to execute
+            priority: Rate limiter priority class of the request
+
+        Returns:
+            GraphQL response data
+
+        Raises:
+            GraphQLError: If the query fails
+            QueryCostExceededError: If the query's estimated cost exceeds
+                ``max_query_cost`` and it cannot be split into pages
+        """
+        stored = self._lookup_stored(builder)
+        if stored is not None:
+            return stored
+
+        page_size = self._check_query_cost(builder)
+        if page_size is not None:
+            return await self._execute_split_query(builder, page_size, priority)
+
+        query = builder.build_query(pretty=self._client.settings.pretty_queries)
+        variables = builder.variables
+
+        logger.debug(
+            "Executing dynamic query",
+            extra={
+                "query_name": builder.get_query_name(),
+                "variables": list(variables.keys()),
+            },
+        )
+
+        response = await self._client.execute_query(query, variables, priority=priority)
+        return response["data"]
+
+    async def execute_batch(
+        self,
+        batch: QueryBatch,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> list[Any]:
+        """Execute a query batch with as few requests as possible.
+
+        Chunks are sent concurrently; the rate limiter paces them.
+
+        Args:
+            batch: The query batch to execute
+            priority: Rate limiter priority class of the requests
+
+        Returns:
+            Root field value of each builder, in the order they were added
+
+        Raises:
+            GraphQLError: If a chunk fails (the whole chunk's results are lost)
+            QueryCostExceededError: If a single query's estimated cost exceeds
+                ``max_query_cost`` and it cannot be split into pages
+        """
+        chunk_results = await asyncio.gather(
+            *(
+                self._execute_batch_chunk(chunk, priority)
+                for chunk in self._batch_chunks(batch)
+            )
+        )
+        return [result for results in chunk_results for result in results]
+
+    async def _execute_batch_chunk(
+        self, chunk: list[CustomQueryBuilder], priority: RequestPriority
+    ) -> list[Any]:
+        """Execute one chunk of a query batch."""
+        if len(chunk) == 1:
+            data = await self.execute_query_builder(chunk[0], priority)
+            return [data[chunk[0].get_query_name()]]
+        query, variables = QueryBatch.build_query(
+            chunk, pretty=self._client.settings.pretty_queries
+        )
+        response = await self._client.execute_query(query, variables, priority=priority)
+        return QueryBatch.split_response(chunk, response["data"])
+
+    async def _execute_split_query(
+        self,
+        builder: CustomQueryBuilder,
+        page_size: int,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> dict[str, Any]:
+        """Execute a root connection query as several smaller pages.
+
+        Args:
+            builder: The query builder to execute
+            page_size: Number of nodes per page
+            priority: Rate limiter priority class of the requests
+
+        Returns:
+            GraphQL response data with the edges of all pages merged
+        """
+        split = _SplitQuery(builder, page_size)
+        page = split.next_page()
+        while page is not None:
+            query = page.build_query(pretty=self._client.settings.pretty_queries)
+            response = await self._client.execute_query(
+                query, page.variables, priority=priority
+            )
+            page = split.add_response(response["data"])
+        return split.result()
+
+    async def execute_mutation_builder(
+        self,
+        builder: CustomMutationBuilder,
+        priority: RequestPriority = RequestPriority.NORMAL,
     ) -> dict[str, Any]:
         """Execute a mutation builder and return the result.
 
         Args:
             builder: The mutation builder to execute
+            priority: Rate limiter priority class of the request
 
         Returns:
             GraphQL response data
@@ -177,14 +600,18 @@ class FieldBasedShopifyPartnersClient:
         Raises:
             GraphQLError: If the mutation fails
         """
-        mutation = builder.build_mutation()
+        mutation = builder.build_mutation(pretty=self._client.settings.pretty_queries)
         variables = builder.variables
 
         logger.debug(
             "Executing dynamic mutation",
-            mutation_name=builder.get_mutation_name(),
-            variables=list(variables.keys()),
+            extra={
+                "mutation_name": builder.get_mutation_name(),
+                "variables": list(variables.keys()),
+            },
         )
 
-        response = self._client.execute_query(mutation, variables)
+        response = await self._client.execute_query(
+            mutation, variables, priority=priority
+        )
         return response["data"]
@@ -0,0 +1,632 @@
+"""Token bucket backends shared between processes and hosts.
+
+A backend holds the state of one token bucket outside the current process,
+so every worker that uses it draws from the same request budget:
+
+- :class:`FileLockBucketBackend` keeps the bucket in a small file guarded by
+  an OS file lock, for processes on one host.
+- :class:`SocketBucketBackend` asks a :class:`RateLimitCoordinator` over TCP,
+  for processes on several hosts.
+
+Buckets are reservation based: a caller takes its tokens immediately, even
+if that leaves the bucket negative, and is told how long to wait before
+sending. Waiting happens outside any lock and callers are served in the
+order they reserved.
+"""
+
+import asyncio
+import os
+from pathlib import Path
+import socket
+import struct
+from threading import Lock
+import time
+from typing import Any, Optional, Union
+
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings, user_cache_dir
+from shopify_partners_sdk.exceptions.auth import AuthenticationError
+from shopify_partners_sdk.exceptions.rate_limit import RateLimitExceededError
+
+from .rate_limiter import RateLimiter, RequestPriority, Reservation
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+try:
+    import msvcrt
+except ImportError:  # pragma: no cover - only available on Windows
+    msvcrt = None
+
+
+def reserve_tokens(
+    state: list[float],
+    tokens: float,
+    rate: float,
+    capacity: float,
+    now: float,
+    max_wait: Optional[float] = None,
+) -> tuple[bool, float]:
+    """Reserve tokens from a bucket, updating its state in place.
+
+    Args:
+        state: Bucket state as ``[tokens, last refill time]``
+        tokens: Number of tokens to reserve
+        rate: Refill rate in tokens per second
+        capacity: Bucket capacity
+        now: Current time, on the same clock as the state
+        max_wait: Longest acceptable wait (None for no limit)
+
+    Returns:
+        Whether the tokens were reserved, and the time to wait before using
+        them (or, if not reserved, the wait that would have been needed)
+    """
+    available = min(capacity, state[0] + max(0.0, now - state[1]) * rate)
+    state[0], state[1] = available, now
+
+    wait_time = max(0.0, (tokens - available) / rate)
+    if max_wait is not None and wait_time > max_wait:
+        return False, wait_time
+    state[0] = available - tokens
+    return True, wait_time
+
+
+def refund_tokens(
+    state: list[float], tokens: float, rate: float, capacity: float, now: float
+) -> None:
+    """Return reserved tokens to a bucket, updating its state in place."""
+    available = min(capacity, state[0] + max(0.0, now - state[1]) * rate)
+    state[0], state[1] = min(capacity, available + tokens), now
+
+
+def peek_tokens(state: list[float], rate: float, capacity: float, now: float) -> float:
+    """Get the tokens a bucket would hold now, without changing it."""
+    return min(capacity, state[0] + max(0.0, now - state[1]) * rate)
+
+
+class BucketBackend:
+    """Interface of token bucket storage shared outside the process."""
+
+    name = "backend"
+
+    def reserve(
+        self,
+        tokens: float,
+        rate: float,
+        capacity: float,
+        max_wait: Optional[float] = None,
+    ) -> tuple[bool, float]:
+        """Reserve tokens from the shared bucket.
+
+        Args:
+            tokens: Number of tokens to reserve
+            rate: Refill rate in tokens per second
+            capacity: Bucket capacity
+            max_wait: Longest acceptable wait (None for no limit)
+
+        Returns:
+            Whether the tokens were reserved, and the time to wait before
+            using them (or the wait that would have been needed)
+        """
+        raise NotImplementedError
+
+    def refund(self, tokens: float, rate: float, capacity: float) -> None:
+        """Return the tokens of a cancelled reservation to the shared bucket."""
+        raise NotImplementedError
+
+    def available(self, rate: float, capacity: float) -> float:
+        """Get the number of tokens currently in the shared bucket."""
+        raise NotImplementedError
+
+    def reset(self) -> None:
+        """Refill the shared bucket."""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class FileLockBucketBackend(BucketBackend):
+    """Token bucket stored in a file and guarded by an OS file lock.
+
+    Every process on the host that uses the same file shares one bucket.
+    The bucket is timed with the wall clock, which all processes agree on.
+    """
+
+    name = "file"
+
+    _STATE = struct.Struct("<dd")
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialize the file backend.
+
+        Args:
+            path: Bucket file (created on first use)
+
+        Raises:
+            RuntimeError: If the platform has no supported file locking
+        """
+        if fcntl is None and msvcrt is None:
+            raise RuntimeError("File locking is not supported on this platform")
+        self._path = Path(path)
+
+    @property
+    def path(self) -> Path:
+        """Get the bucket file path."""
+        return self._path
+
+    def _update(self, update: Any) -> Any:
+        """Run ``update(state)`` on the bucket state while holding the lock.
+
+        The file is opened per call, so lock ownership is never shared with
+        processes forked after the backend was created.
+        """
+        # Created private to the user, like the default bucket directory
+        fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o600)
+        with os.fdopen(fd, "r+b") as f:
+            self._lock(fd)
+            try:
+                f.seek(0)
+                raw = f.read(self._STATE.size)
+                if len(raw) == self._STATE.size:
+                    state = list(self._STATE.unpack(raw))
+                else:
+                    # New bucket: mark it full
+                    state = [float("inf"), time.time()]
+                result = update(state)
+                f.seek(0)
+                f.truncate()
+                f.write(self._STATE.pack(*state))
+                f.flush()
+            finally:
+                self._unlock(fd)
+        return result
+
+    @staticmethod
+    def _lock(fd: int) -> None:
+        """Take the exclusive lock on an open bucket file."""
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+        else:  # pragma: no cover - Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    @staticmethod
+    def _unlock(fd: int) -> None:
+        """Release the lock on an open bucket file."""
+        if fcntl is not None:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        else:  # pragma: no cover - Windows
+            os.lseek(fd, 0, os.SEEK_SET)
+            msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+    def reserve(
+        self,
+        tokens: float,
+        rate: float,
+        capacity: float,
+        max_wait: Optional[float] = None,
+    ) -> tuple[bool, float]:
+        """Reserve tokens from the shared bucket."""
+        return self._update(
+            lambda state: reserve_tokens(
+                state, tokens, rate, capacity, time.time(), max_wait
+            )
+        )
+
+    def refund(self, tokens: float, rate: float, capacity: float) -> None:
+        """Return the tokens of a cancelled reservation to the shared bucket."""
+        self._update(
+            lambda state: refund_tokens(state, tokens, rate, capacity, time.time())
+        )
+
+    def available(self, rate: float, capacity: float) -> float:
+        """Get the number of tokens currently in the shared bucket."""
+        return self._update(
+            lambda state: peek_tokens(state, rate, capacity, time.time())
+        )
+
+    def reset(self) -> None:
+        """Refill the shared bucket."""
+
+        def refill(state: list[float]) -> None:
+            state[0], state[1] = float("inf"), time.time()
+
+        self._update(refill)
+
+    def __repr__(self) -> str:
+        """String representation of the backend."""
+        return f"FileLockBucketBackend(path={str(self._path)!r})"
+
+
+def parse_address(address: str) -> tuple[str, int]:
+    """Parse a ``host:port`` coordinator address.
+
+    Args:
+        address: Coordinator address
+
+    Returns:
+        Host and port
+
+    Raises:
+        ValueError: If the address has no valid port
+    """
+    host, _, port = address.rpartition(":")
+    if not host or not port.isdigit():
+        raise ValueError(f"Invalid coordinator address (expected host:port): {address}")
+    return host.strip("[]"), int(port)
+
+
+class SocketBucketBackend(BucketBackend):
+    """Token bucket held by a :class:`RateLimitCoordinator` over TCP.
+
+    The coordinator times the bucket with its own clock, so hosts do not
+    need synchronized clocks. One connection is kept per process.
+    """
+
+    name = "socket"
+
+    def __init__(
+        self,
+        address: str,
+        secret: str,
+        key: str = "default",
+        timeout: float = 5.0,
+    ) -> None:
+        """Initialize the socket backend.
+
+        Args:
+            address: Coordinator address as ``host:port``
+            secret: Shared secret the coordinator was started with
+            key: Bucket name on the coordinator (e.g. the organization ID)
+            timeout: Socket timeout in seconds
+
+        Raises:
+            ValueError: If the secret is empty
+        """
+        if not secret:
+            raise ValueError("The socket backend requires the coordinator secret")
+        self._address = parse_address(address)
+        self._secret = secret
+        self._key = key
+        self._timeout = timeout
+        self._lock = Lock()
+        self._socket: Optional[socket.socket] = None
+        self._reader: Any = None
+        self._pid: Optional[int] = None
+
+    def _connect(self) -> None:
+        """Open and authenticate the connection to the coordinator.
+
+        Raises:
+            AuthenticationError: If the coordinator rejects the secret
+        """
+        self._disconnect()
+        self._socket = socket.create_connection(self._address, timeout=self._timeout)
+        self._reader = self._socket.makefile("rb")
+        self._pid = os.getpid()
+        self._socket.sendall(f"AUTH {self._secret}\n".encode())
+        if not self._reader.readline().startswith(b"OK"):
+            self._disconnect()
+            raise AuthenticationError("Rate limit coordinator rejected the secret")
+
+    def _disconnect(self) -> None:
+        """Close the connection to the coordinator, if open."""
+        if self._reader is not None:
+            self._reader.close()
+        if self._socket is not None:
+            self._socket.close()
+        self._socket = None
+        self._reader = None
+
+    def _request(self, *fields: Any) -> list[str]:
+        """Send one command line to the coordinator and read its reply.
+
+        Reconnects once if the connection was lost (or belongs to the parent
+        of a forked process).
+
+        Raises:
+            ConnectionError: If the coordinator cannot be reached
+            AuthenticationError: If the coordinator rejects the secret
+        """
+        line = (" ".join(str(field) for field in fields) + "\n").encode()
+        with self._lock:
+            for attempt in range(2):
+                try:
+                    if self._socket is None or self._pid != os.getpid():
+                        self._connect()
+                    self._socket.sendall(line)
+                    reply = self._reader.readline()
+                    if not reply:
+                        raise ConnectionError("Coordinator closed the connection")
+                    break
+                except OSError as e:
+                    self._disconnect()
+                    if attempt:
+                        raise ConnectionError(
+                            f"Rate limit coordinator unreachable at "
+                            f"{self._address[0]}:{self._address[1]}: {e}"
+                        ) from e
+        status, *values = reply.decode().split()
+        if status == "ERR":
+            raise ValueError(f"Coordinator rejected request: {' '.join(values)}")
+        return [status, *values]
+
+    def reserve(
+        self,
+        tokens: float,
+        rate: float,
+        capacity: float,
+        max_wait: Optional[float] = None,
+    ) -> tuple[bool, float]:
+        """Reserve tokens from the shared bucket."""
+        status, wait_time = self._request(
+            "RESERVE",
+            self._key,
+            tokens,
+            rate,
+            capacity,
+            "-" if max_wait is None else max_wait,
+        )
+        return status == "OK", float(wait_time)
+
+    def refund(self, tokens: float, rate: float, capacity: float) -> None:
+        """Return the tokens of a cancelled reservation to the shared bucket."""
+        self._request("REFUND", self._key, tokens, rate, capacity)
+
+    def available(self, rate: float, capacity: float) -> float:
+        """Get the number of tokens currently in the shared bucket."""
+        _, tokens = self._request("PEEK", self._key, rate, capacity)
+        return float(tokens)
+
+    def reset(self) -> None:
+        """Refill the shared bucket."""
+        self._request("RESET", self._key)
+
+    def close(self) -> None:
+        """Close the connection to the coordinator."""
+        with self._lock:
+            self._disconnect()
+
+    def __repr__(self) -> str:
+        """String representation of the backend."""
+        host, port = self._address
+        return f"SocketBucketBackend(address='{host}:{port}', key={self._key!r})"
+
+
+class SharedRateLimiter(RateLimiter):
+    """Rate limiter whose token bucket lives in a shared backend.
+
+    Processes (and hosts) using the same backend share one request budget,
+    so each worker can use the full rate while others are idle.
+    """
+
+    def __init__(
+        self,
+        backend: BucketBackend,
+        rate_limit: Optional[float] = None,
+        settings: Optional[ShopifyPartnersSDKSettings] = None,
+    ) -> None:
+        """Initialize the shared rate limiter.
+
+        Args:
+            backend: Shared bucket backend
+            rate_limit: Maximum requests per second (defaults to settings value)
+            settings: SDK settings instance
+        """
+        super().__init__(rate_limit, settings)
+        self._backend = backend
+
+    @property
+    def backend(self) -> BucketBackend:
+        """Get the shared bucket backend."""
+        return self._backend
+
+    @property
+    def available_tokens(self) -> float:
+        """Get the number of tokens currently in the shared bucket."""
+        return self._backend.available(self._refill_rate, self._bucket_capacity)
+
+    def _reserve(self, tokens: float, max_wait: Optional[float]) -> float:
+        """Reserve tokens from the backend and record the request.
+
+        Args:
+            tokens: Number of tokens to reserve
+            max_wait: Longest acceptable wait (None for no limit)
+
+        Returns:
+            Seconds to wait before the reservation is due
+
+        Raises:
+            RateLimitExceededError: If the wait would exceed ``max_wait``
+            ValueError: If tokens requested is invalid
+        """
+        self._check_tokens(tokens)
+        return self._reserve_shared(tokens, max_wait)
+
+    def _reserve_shared(self, tokens: float, max_wait: Optional[float]) -> float:
+        """Reserve any number of tokens from the backend; see :meth:`_reserve`."""
+        granted, wait_time = self._backend.reserve(
+            tokens, self._refill_rate, self._bucket_capacity, max_wait
+        )
+        with self._lock:
+            if not granted:
+                self._stats.record_blocked()
+                raise RateLimitExceededError(
+                    current_rate=self.current_rate,
+                    max_rate=self._rate_limit,
+                    retry_after=wait_time,
+                )
+            self._stats.record_request(wait_time)
+        return wait_time
+
+    def reserve(
+        self,
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> Reservation:
+        """Reserve tokens from the shared bucket; see :meth:`RateLimiter.reserve`."""
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+        wait_time = self._reserve_shared(tokens, self._max_wait(timeout, deadline))
+        return Reservation(self, tokens, time.monotonic() + wait_time)
+
+    def _refund(self, tokens: float) -> None:
+        """Return the tokens of a cancelled reservation to the shared bucket."""
+        self._backend.refund(tokens, self._refill_rate, self._bucket_capacity)
+
+    def _admit(
+        self,
+        tokens: float,
+        _priority: RequestPriority,
+        _ticket: int,
+        waited: float,
+        max_wait: Optional[float],
+    ) -> tuple[bool, float]:
+        """Admit a request in FIFO order.
+
+        Priority classes are not applied across processes: the shared bucket
+        has no view of the other processes' waiting requests.
+        """
+        remaining = None if max_wait is None else max(0.0, max_wait - waited)
+        return True, self._reserve(tokens, remaining)
+
+    async def acquire_async(
+        self,
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        # Keyword of RateLimiter.acquire_async that callers pass by name
+        priority: RequestPriority = RequestPriority.NORMAL,  # noqa: ARG002
+    ) -> Optional[float]:
+        """Acquire tokens from the shared bucket without blocking the event loop.
+
+        The backend round trip runs in the default executor. Requests are
+        served in FIFO order whatever their priority.
+
+        Args:
+            tokens: Number of tokens to acquire (default 1.0 for one request)
+            timeout: Maximum time to wait for tokens (None for no timeout)
+            deadline: Latest ``time.monotonic()`` at which the tokens may be
+                granted (None for no deadline)
+            priority: Request priority class (not applied across processes)
+
+        Returns:
+            None, as the shared limiter holds nothing per request
+
+        Raises:
+            RateLimitExceededError: If the tokens cannot be granted within the
+                timeout or before the deadline
+            ValueError: If tokens requested is invalid
+        """
+        loop = asyncio.get_running_loop()
+        max_wait = self._max_wait(timeout, deadline)
+        wait_time = await loop.run_in_executor(None, self._reserve, tokens, max_wait)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return None
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Try to acquire tokens from the shared bucket without waiting.
+
+        Args:
+            tokens: Number of tokens to acquire
+
+        Returns:
+            True if tokens were acquired, False otherwise
+        """
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+        try:
+            self._reserve_shared(tokens, 0.0)
+        except RateLimitExceededError:
+            return False
+        return True
+
+    def reset(self) -> None:
+        """Reset the local statistics and refill the shared bucket."""
+        super().reset()
+        self._backend.reset()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary with rate limiter statistics
+        """
+        stats = super().get_stats()
+        stats["available_tokens"] = self.available_tokens
+        stats["backend"] = self._backend.name
+        return stats
+
+    def __repr__(self) -> str:
+        """String representation of the rate limiter."""
+        return (
+            f"SharedRateLimiter("
+            f"rate_limit={self._rate_limit}, "
+            f"backend={self._backend!r}"
+            f")"
+        )
+
+
+def _bucket_key(
+    settings: ShopifyPartnersSDKSettings,
+    organization_id: Optional[Union[int, str]] = None,
+) -> str:
+    """Get the bucket name of an organization."""
+    if organization_id is None:
+        organization_id = settings.organization_id
+    return str(organization_id) if organization_id is not None else "default"
+
+
+def default_bucket_path(
+    settings: ShopifyPartnersSDKSettings,
+    organization_id: Optional[Union[int, str]] = None,
+) -> Path:
+    """Get the default bucket file of an organization.
+
+    Args:
+        settings: SDK settings instance
+        organization_id: Organization the client is authenticated for
+            (defaults to ``settings.organization_id``)
+
+    Returns:
+        Path in the user's private cache directory
+    """
+    key = _bucket_key(settings, organization_id)
+    return user_cache_dir() / f"rate-limit-{key}.bucket"
+
+
+def create_backend(
+    settings: ShopifyPartnersSDKSettings,
+    organization_id: Optional[Union[int, str]] = None,
+) -> BucketBackend:
+    """Create the shared bucket backend selected by the settings.
+
+    Args:
+        settings: SDK settings instance
+        organization_id: Organization the client is authenticated for
+            (defaults to ``settings.organization_id``)
+
+    Returns:
+        Bucket backend
+
+    Raises:
+        ValueError: If ``rate_limit_backend`` is not a shared backend, or the
+            socket backend has no coordinator secret
+    """
+    if settings.rate_limit_backend == "file":
+        path = settings.rate_limit_file or default_bucket_path(
+            settings, organization_id
+        )
+        return FileLockBucketBackend(path)
+    if settings.rate_limit_backend == "socket":
+        return SocketBucketBackend(
+            settings.rate_limit_coordinator,
+            secret=settings.rate_limit_coordinator_secret or "",
+            key=_bucket_key(settings, organization_id),
+            timeout=settings.timeout_seconds,
+        )
+    raise ValueError(f"Not a shared backend: {settings.rate_limit_backend}")
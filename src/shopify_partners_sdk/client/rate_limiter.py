@@ -1,13 +1,224 @@
 """Rate limiter implementation for the Shopify Partners API."""
 
-from collections import deque
+import asyncio
+from enum import IntEnum
+import itertools
+import logging
 from threading import Lock
 import time
-from typing import Optional
+from typing import Any, Optional, Union
 
 from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
 from shopify_partners_sdk.exceptions.rate_limit import RateLimitExceededError
 
+logger = logging.getLogger(__name__)
+
+
+class RequestPriority(IntEnum):
+    """Priority class of a request sharing a rate limiter.
+
+    Lower values are served first.
+    """
+
+    INTERACTIVE = 0  # User-facing lookups
+    NORMAL = 1
+    BULK = 2  # Backfills and large pagination jobs
+
+
+class _RequestStats:
+    """Constant-memory request statistics of a rate limiter.
+
+    Requests and blocked requests over the last ``window`` seconds are
+    counted in a ring of time slots, and wait times are kept in a ring of the
+    most recent samples. Recording is O(1) and memory does not grow with the
+    number of requests.
+    """
+
+    def __init__(
+        self, window: float = 1.0, slots: int = 10, sample_size: int = 1024
+    ) -> None:
+        """Initialize the statistics.
+
+        Args:
+            window: Length of the window for rates, in seconds
+            slots: Number of time slots the window is divided into
+            sample_size: Number of recent wait times kept for percentiles
+        """
+        self._window = window
+        self._slot_width = window / slots
+        self._slot_ids = [-1] * slots
+        self._requests = [0] * slots
+        self._blocked = [0] * slots
+        self._waits = [0.0] * sample_size
+        self._wait_count = 0
+        self.total_requests = 0
+        self.blocked_requests = 0
+
+    def _slot(self, now: float) -> int:
+        """Get the ring index of the slot for ``now``, clearing it if stale."""
+        slot_id = int(now / self._slot_width)
+        index = slot_id % len(self._slot_ids)
+        if self._slot_ids[index] != slot_id:
+            self._slot_ids[index] = slot_id
+            self._requests[index] = 0
+            self._blocked[index] = 0
+        return index
+
+    def _recent(self, counts: list[int]) -> int:
+        """Sum the counts of the slots inside the window."""
+        current = int(time.monotonic() / self._slot_width)
+        oldest = current - len(self._slot_ids)
+        return sum(
+            count
+            for slot_id, count in zip(self._slot_ids, counts)
+            if oldest < slot_id <= current
+        )
+
+    def record_request(self, wait_time: float = 0.0) -> None:
+        """Record a granted request and how long it waited."""
+        self._requests[self._slot(time.monotonic())] += 1
+        self._waits[self._wait_count % len(self._waits)] = wait_time
+        self._wait_count += 1
+        self.total_requests += 1
+
+    def record_blocked(self) -> None:
+        """Record a request that was rate limited."""
+        self._blocked[self._slot(time.monotonic())] += 1
+        self.blocked_requests += 1
+
+    @property
+    def request_rate(self) -> float:
+        """Get the granted requests per second over the window."""
+        return self._recent(self._requests) / self._window
+
+    @property
+    def blocked_rate(self) -> float:
+        """Get the blocked requests per second over the window."""
+        return self._recent(self._blocked) / self._window
+
+    def wait_percentiles(self) -> dict[str, float]:
+        """Get the median, p95, p99 and maximum of the recent wait times."""
+        samples = sorted(self._waits[: min(self._wait_count, len(self._waits))])
+        if not samples:
+            return {"wait_p50": 0.0, "wait_p95": 0.0, "wait_p99": 0.0, "wait_max": 0.0}
+        last = len(samples) - 1
+        return {
+            "wait_p50": samples[int(last * 0.5)],
+            "wait_p95": samples[int(last * 0.95)],
+            "wait_p99": samples[int(last * 0.99)],
+            "wait_max": samples[last],
+        }
+
+    def reset(self) -> None:
+        """Clear all statistics."""
+        self._slot_ids = [-1] * len(self._slot_ids)
+        self._wait_count = 0
+        self.total_requests = 0
+        self.blocked_requests = 0
+
+
+class Reservation:
+    """Tokens reserved from a rate limiter, due at a known time.
+
+    Created by :meth:`RateLimiter.reserve`. The tokens are already taken
+    from the bucket; :meth:`commit` (or :meth:`wait`) marks them used and
+    :meth:`cancel` gives them back.
+    """
+
+    PENDING = "pending"
+    COMMITTED = "committed"
+    CANCELLED = "cancelled"
+
+    def __init__(self, limiter: "RateLimiter", tokens: float, eta: float) -> None:
+        """Initialize the reservation.
+
+        Args:
+            limiter: Rate limiter the tokens were reserved from
+            tokens: Number of reserved tokens
+            eta: ``time.monotonic()`` at which the tokens are due
+        """
+        self._limiter = limiter
+        self._tokens = tokens
+        self._eta = eta
+        self._state = self.PENDING
+
+    @property
+    def tokens(self) -> float:
+        """Get the number of reserved tokens."""
+        return self._tokens
+
+    @property
+    def eta(self) -> float:
+        """Get the ``time.monotonic()`` at which the tokens are due."""
+        return self._eta
+
+    @property
+    def delay(self) -> float:
+        """Get the seconds left until the tokens are due."""
+        return max(0.0, self._eta - time.monotonic())
+
+    @property
+    def ready(self) -> bool:
+        """Check whether the tokens are due."""
+        return self.delay == 0.0
+
+    @property
+    def state(self) -> str:
+        """Get the reservation state: pending, committed or cancelled."""
+        return self._state
+
+    def commit(self) -> None:
+        """Mark the reserved tokens as used.
+
+        Raises:
+            ValueError: If the reservation was cancelled
+        """
+        if self._state == self.CANCELLED:
+            raise ValueError("Cannot commit a cancelled reservation")
+        self._state = self.COMMITTED
+
+    def cancel(self) -> None:
+        """Give the reserved tokens back to the rate limiter.
+
+        Cancelling twice has no effect.
+
+        Raises:
+            ValueError: If the reservation was committed
+        """
+        if self._state == self.COMMITTED:
+            raise ValueError("Cannot cancel a committed reservation")
+        if self._state == self.PENDING:
+            self._state = self.CANCELLED
+            self._limiter._refund(self._tokens)
+
+    def wait(self) -> None:
+        """Sleep until the tokens are due, then commit them."""
+        if self._state == self.CANCELLED:
+            raise ValueError("Cannot wait for a cancelled reservation")
+        delay = self.delay
+        if delay > 0:
+            time.sleep(delay)
+        self.commit()
+
+    async def wait_async(self) -> None:
+        """Sleep until the tokens are due without blocking the loop, then commit."""
+        if self._state == self.CANCELLED:
+            raise ValueError("Cannot wait for a cancelled reservation")
+        delay = self.delay
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.commit()
+
+    def __repr__(self) -> str:
+        """String representation of the reservation."""
+        return (
+            f"Reservation("
+            f"tokens={self._tokens}, "
+            f"delay={self.delay:.3f}, "
+            f"state={self._state}"
+            f")"
+        )
+
 
 class RateLimiter:
     """Token bucket rate limiter for API requests.
@@ -41,10 +252,13 @@ class RateLimiter:
         self._last_refill = time.monotonic()
         self._lock = Lock()
 
+        # Deferred requests waiting, per priority class: ticket -> tokens
+        self._waiting: dict[RequestPriority, dict[int, float]] = {}
+        self._tickets = itertools.count()
+        self._max_deferral = self._settings.rate_limit_max_deferral
+
         # Request tracking for monitoring
-        self._request_times: deque[float] = deque()
-        self._total_requests = 0
-        self._blocked_requests = 0
+        self._stats = _RequestStats()
 
     @property
     def rate_limit(self) -> float:
@@ -54,26 +268,22 @@ class RateLimiter:
     @property
     def current_rate(self) -> float:
         """Get the current request rate based on recent activity."""
-        current_time = time.monotonic()
-        # Keep only requests from the last second
-        while self._request_times and current_time - self._request_times[0] > 1.0:
-            self._request_times.popleft()
-        return len(self._request_times)
+        return self._stats.request_rate
 
     @property
     def available_tokens(self) -> float:
         """Get the number of tokens currently available."""
-        return self._tokens
+        return max(0.0, self._tokens)
 
     @property
     def total_requests(self) -> int:
         """Get the total number of requests processed."""
-        return self._total_requests
+        return self._stats.total_requests
 
     @property
     def blocked_requests(self) -> int:
         """Get the number of requests that were rate limited."""
-        return self._blocked_requests
+        return self._stats.blocked_requests
 
     def _refill_tokens(self) -> None:
         """Refill the token bucket based on elapsed time."""
@@ -86,63 +296,306 @@ class RateLimiter:
             self._tokens = min(self._bucket_capacity, self._tokens + tokens_to_add)
             self._last_refill = current_time
 
-    def _calculate_wait_time(self) -> float:
-        """Calculate how long to wait for the next token."""
-        if self._tokens >= 1.0:
+    def _calculate_wait_time(self, tokens: float = 1.0) -> float:
+        """Calculate how long to wait until the bucket holds ``tokens``."""
+        if self._tokens >= tokens:
             return 0.0
 
-        # Calculate time needed to accumulate 1 token
-        tokens_needed = 1.0 - self._tokens
+        # Calculate time needed to accumulate the missing tokens
+        tokens_needed = tokens - self._tokens
         return tokens_needed / self._refill_rate
 
-    def acquire(self, tokens: float = 1.0, timeout: Optional[float] = None) -> None:
+    @staticmethod
+    def _max_wait(
+        timeout: Optional[float], deadline: Optional[float]
+    ) -> Optional[float]:
+        """Get the longest acceptable wait from a timeout and/or a deadline."""
+        max_wait = timeout
+        if deadline is not None:
+            remaining = max(0.0, deadline - time.monotonic())
+            max_wait = remaining if max_wait is None else min(max_wait, remaining)
+        return max_wait
+
+    def _check_tokens(self, tokens: float) -> None:
+        """Validate a number of tokens to acquire."""
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+
+        if tokens > self._bucket_capacity:
+            raise ValueError(
+                f"tokens ({tokens}) exceeds bucket capacity ({self._bucket_capacity})"
+            )
+
+    def _reserve_locked(self, tokens: float, max_wait: Optional[float]) -> float:
+        """Reserve tokens; see :meth:`_reserve`. Must be called with the lock held."""
+        self._refill_tokens()
+        wait_time = self._calculate_wait_time(tokens)
+
+        if max_wait is not None and wait_time > max_wait:
+            self._stats.record_blocked()
+            raise RateLimitExceededError(
+                current_rate=self.current_rate,
+                max_rate=self._rate_limit,
+                retry_after=wait_time,
+            )
+
+        self._tokens -= tokens
+        self._stats.record_request(wait_time)
+        return wait_time
+
+    def _reserve(self, tokens: float, max_wait: Optional[float]) -> float:
+        """Reserve tokens and return the time until they may be used.
+
+        Tokens are taken immediately, even if that leaves the bucket
+        negative: the deficit is the queue of callers that reserved before.
+        Each caller therefore gets the next free slot after everyone who
+        reserved earlier (FIFO), and waits for it without holding the lock.
+
+        Args:
+            tokens: Number of tokens to reserve
+            max_wait: Longest acceptable wait (None for no limit)
+
+        Returns:
+            Seconds to wait before the reservation is due
+
+        Raises:
+            RateLimitExceededError: If the slot is further away than
+                ``max_wait`` (nothing is reserved then)
+            ValueError: If tokens requested is invalid
+        """
+        self._check_tokens(tokens)
+        with self._lock:
+            return self._reserve_locked(tokens, max_wait)
+
+    def _admit(
+        self,
+        tokens: float,
+        priority: RequestPriority,
+        ticket: int,
+        waited: float,
+        max_wait: Optional[float],
+    ) -> tuple[bool, float]:
+        """Try to admit a deferred (non-interactive) request.
+
+        A deferred request only takes tokens that are free now and not
+        needed by waiting requests of a higher class, or by requests of its
+        own class that started waiting earlier. Once it has waited for
+        ``max_deferral`` it joins the FIFO queue like an interactive request.
+
+        Args:
+            tokens: Number of tokens to acquire
+            priority: Request priority class
+            ticket: Ticket returned by :meth:`_start_waiting`
+            waited: Time the request has waited so far
+            max_wait: Longest acceptable total wait (None for no limit)
+
+        Returns:
+            Whether the request was admitted, and the time to wait (until its
+            slot if admitted, before trying again otherwise)
+
+        Raises:
+            RateLimitExceededError: If the request cannot be admitted within
+                ``max_wait``
+        """
+        remaining = None if max_wait is None else max(0.0, max_wait - waited)
+        with self._lock:
+            if waited >= self._max_deferral:
+                return True, self._reserve_locked(tokens, remaining)
+
+            self._refill_tokens()
+            ahead = 0.0
+            for waiting_priority, waiting in self._waiting.items():
+                if waiting_priority < priority:
+                    ahead += sum(waiting.values())
+                elif waiting_priority == priority:
+                    ahead += sum(
+                        waiting_tokens
+                        for waiting_ticket, waiting_tokens in waiting.items()
+                        if waiting_ticket < ticket
+                    )
+            wait_time = (tokens + ahead - self._tokens) / self._refill_rate
+            if wait_time <= 0:
+                self._tokens -= tokens
+                self._stats.record_request(waited)
+                return True, 0.0
+
+            if remaining is not None and wait_time > remaining:
+                self._stats.record_blocked()
+                raise RateLimitExceededError(
+                    current_rate=self.current_rate,
+                    max_rate=self._rate_limit,
+                    retry_after=wait_time,
+                )
+        # Check again when enough tokens should have accumulated, or when the
+        # request has waited long enough to join the queue
+        return False, max(0.001, min(wait_time, self._max_deferral - waited))
+
+    def _start_waiting(self, tokens: float, priority: RequestPriority) -> int:
+        """Register a deferred request so later and lower classes yield to it.
+
+        Returns:
+            Ticket identifying the request in its class queue
+        """
+        with self._lock:
+            ticket = next(self._tickets)
+            self._waiting.setdefault(priority, {})[ticket] = tokens
+        return ticket
+
+    def _stop_waiting(self, priority: RequestPriority, ticket: int) -> None:
+        """Unregister a deferred request."""
+        with self._lock:
+            del self._waiting[priority][ticket]
+
+    def acquire(
+        self,
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Optional[float]:
         """Acquire tokens from the rate limiter.
 
+        Requests are served in the order they call within their priority
+        class. Interactive requests reserve the next free slot and sleep
+        until it is due, without blocking others. Normal and bulk requests
+        yield to waiting requests of higher classes, for at most
+        ``rate_limit_max_deferral`` seconds.
+
         Args:
             tokens: Number of tokens to acquire (default 1.0 for one request)
             timeout: Maximum time to wait for tokens (None for no timeout)
+            deadline: Latest ``time.monotonic()`` at which the tokens may be
+                granted (None for no deadline)
+            priority: Request priority class
+
+        Returns:
+            Capacity held for the request, to pass to :meth:`settle` once it
+            completes (None, as the fixed-rate limiter holds none)
 
         Raises:
-            RateLimitExceededError: If timeout is exceeded while waiting for tokens
+            RateLimitExceededError: If the tokens cannot be granted within the
+                timeout or before the deadline
             ValueError: If tokens requested is invalid
         """
-        if tokens <= 0:
-            raise ValueError("tokens must be positive")
+        max_wait = self._max_wait(timeout, deadline)
+        if priority == RequestPriority.INTERACTIVE:
+            wait_time = self._reserve(tokens, max_wait)
+        else:
+            self._check_tokens(tokens)
+            start_time = time.monotonic()
+            ticket = self._start_waiting(tokens, priority)
+            try:
+                while True:
+                    waited = time.monotonic() - start_time
+                    admitted, wait_time = self._admit(
+                        tokens, priority, ticket, waited, max_wait
+                    )
+                    if admitted:
+                        break
+                    time.sleep(wait_time)
+            finally:
+                self._stop_waiting(priority, ticket)
 
-        if tokens > self._bucket_capacity:
-            raise ValueError(
-                f"tokens ({tokens}) exceeds bucket capacity ({self._bucket_capacity})"
-            )
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return None
 
-        start_time = time.monotonic()
+    async def acquire_async(
+        self,
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> Optional[float]:
+        """Acquire tokens from the rate limiter without blocking the event loop.
 
+        The bucket state is shared with :meth:`acquire`, so sync and async
+        callers draw from the same budget and queue.
+
+        Args:
+            tokens: Number of tokens to acquire (default 1.0 for one request)
+            timeout: Maximum time to wait for tokens (None for no timeout)
+            deadline: Latest ``time.monotonic()`` at which the tokens may be
+                granted (None for no deadline)
+            priority: Request priority class
+
+        Returns:
+            Capacity held for the request, to pass to :meth:`settle` once it
+            completes (None, as the fixed-rate limiter holds none)
+
+        Raises:
+            RateLimitExceededError: If the tokens cannot be granted within the
+                timeout or before the deadline
+            ValueError: If tokens requested is invalid
+        """
+        max_wait = self._max_wait(timeout, deadline)
+        if priority == RequestPriority.INTERACTIVE:
+            wait_time = self._reserve(tokens, max_wait)
+        else:
+            self._check_tokens(tokens)
+            start_time = time.monotonic()
+            ticket = self._start_waiting(tokens, priority)
+            try:
+                while True:
+                    waited = time.monotonic() - start_time
+                    admitted, wait_time = self._admit(
+                        tokens, priority, ticket, waited, max_wait
+                    )
+                    if admitted:
+                        break
+                    await asyncio.sleep(wait_time)
+            finally:
+                self._stop_waiting(priority, ticket)
+
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return None
+
+    def reserve(
+        self,
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+    ) -> "Reservation":
+        """Reserve tokens now and get a handle telling when they are due.
+
+        The tokens are taken from the bucket immediately, in FIFO order with
+        other reservations, so the ETA does not change afterwards. Unlike
+        :meth:`acquire`, more tokens than the bucket capacity can be
+        reserved at once; they are due when the bucket has refilled enough.
+        Cancelling the reservation returns its tokens to the bucket.
+
+        Args:
+            tokens: Number of tokens to reserve
+            timeout: Maximum acceptable wait (None for no limit)
+            deadline: Latest ``time.monotonic()`` at which the tokens may be
+                due (None for no deadline)
+
+        Returns:
+            Reservation with the ETA of the tokens
+
+        Raises:
+            RateLimitExceededError: If the tokens would not be due within the
+                timeout or before the deadline (nothing is reserved then)
+            ValueError: If tokens requested is invalid
+
+        Example:
+            >>> reservation = limiter.reserve(40)
+            >>> prepare_batch()  # overlap work with the wait
+            >>> reservation.wait()
+        """
+        if tokens <= 0:
+            raise ValueError("tokens must be positive")
+        max_wait = self._max_wait(timeout, deadline)
         with self._lock:
-            while True:
-                self._refill_tokens()
+            wait_time = self._reserve_locked(tokens, max_wait)
+        return Reservation(self, tokens, time.monotonic() + wait_time)
 
-                if self._tokens >= tokens:
-                    # Sufficient tokens available
-                    self._tokens -= tokens
-                    self._total_requests += 1
-                    self._request_times.append(time.monotonic())
-                    return
-
-                # Not enough tokens, calculate wait time
-                wait_time = self._calculate_wait_time()
-
-                # Check timeout
-                if timeout is not None:
-                    elapsed = time.monotonic() - start_time
-                    if elapsed + wait_time > timeout:
-                        self._blocked_requests += 1
-                        raise RateLimitExceededError(
-                            current_rate=self.current_rate,
-                            max_rate=self._rate_limit,
-                            retry_after=wait_time,
-                        )
-
-                # Wait for tokens to be available
-                time.sleep(wait_time)
+    def _refund(self, tokens: float) -> None:
+        """Return the tokens of a cancelled reservation to the bucket."""
+        with self._lock:
+            self._refill_tokens()
+            self._tokens = min(self._bucket_capacity, self._tokens + tokens)
 
     def acquire_multiple(
         self,
@@ -150,30 +603,29 @@ class RateLimiter:
         timeout: Optional[float] = None,
         batch_size: Optional[int] = None,
     ) -> None:
-        """Acquire multiple tokens with optional batching.
+        """Acquire multiple tokens as one atomic grant.
+
+        All tokens are reserved in a single step, so no other caller can
+        take a slot in between, and the call returns when the last one is
+        due.
 
         Args:
             count: Number of tokens to acquire
             timeout: Maximum time to wait for all tokens
-            batch_size: Maximum tokens to acquire in each batch
-                (default: bucket_capacity)
+            batch_size: Deprecated and ignored; the tokens are always
+                granted in one reservation
 
         Raises:
-            RateLimitExceededError: If timeout is exceeded
+            RateLimitExceededError: If timeout is exceeded (nothing is
+                acquired then)
             ValueError: If count or batch_size is invalid
         """
         if count <= 0:
             raise ValueError("count must be positive")
-
-        batch_size = batch_size or int(self._bucket_capacity)
-        if batch_size <= 0:
+        if batch_size is not None and batch_size <= 0:
             raise ValueError("batch_size must be positive")
 
-        remaining = count
-        while remaining > 0:
-            tokens_to_acquire = min(remaining, batch_size)
-            self.acquire(tokens=tokens_to_acquire, timeout=timeout)
-            remaining -= tokens_to_acquire
+        self.reserve(count, timeout=timeout).wait()
 
     def try_acquire(self, tokens: float = 1.0) -> bool:
         """Try to acquire tokens without waiting.
@@ -190,41 +642,76 @@ class RateLimiter:
         if tokens > self._bucket_capacity:
             return False
 
-        # Use synchronous refill for non-blocking check
-        current_time = time.monotonic()
-        elapsed = current_time - self._last_refill
+        with self._lock:
+            self._refill_tokens()
+            if self._tokens < tokens:
+                return False
+            self._tokens -= tokens
+            self._stats.record_request()
+        return True
 
-        if elapsed > 0:
-            tokens_to_add = elapsed * self._refill_rate
-            available_tokens = min(self._bucket_capacity, self._tokens + tokens_to_add)
-        else:
-            available_tokens = self._tokens
+    def settle(self, reserved: Optional[float]) -> None:
+        """Release what :meth:`acquire` held for a request that has completed.
+
+        Must be called once per granted request, whatever its outcome
+        (response, HTTP or network error). The fixed-rate limiter holds
+        nothing per request; see :class:`CostAwareRateLimiter`.
+
+        Args:
+            reserved: Value returned by :meth:`acquire`
+        """
+
+    def update_from_extensions(self, extensions: Optional[dict[str, Any]]) -> None:
+        """Update the limiter from the ``extensions`` of a GraphQL response.
 
-        # Would be able to acquire, but don't actually modify state
-        # This is just a check - use acquire() to actually get tokens
-        return available_tokens >= tokens
+        The fixed-rate limiter does not use server feedback; see
+        :class:`CostAwareRateLimiter`.
+
+        Args:
+            extensions: The ``extensions`` object of a GraphQL response
+        """
+
+    def record_success(self) -> None:
+        """Record that a request was accepted by the server.
+
+        The fixed-rate limiter does not use server feedback; see
+        :class:`AdaptiveRateLimiter`.
+        """
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Record that the server rejected a request with HTTP 429.
+
+        The fixed-rate limiter does not use server feedback; see
+        :class:`AdaptiveRateLimiter`.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if given
+        """
 
     def reset(self) -> None:
         """Reset the rate limiter to initial state."""
         with self._lock:
             self._tokens = self._bucket_capacity
             self._last_refill = time.monotonic()
-            self._request_times.clear()
-            self._total_requests = 0
-            self._blocked_requests = 0
+            self._stats.reset()
 
     def get_stats(self) -> dict[str, float | int]:
         """Get rate limiter statistics.
 
+        Rates cover the last second; wait time percentiles cover the most
+        recent granted requests.
+
         Returns:
             Dictionary with rate limiter statistics
         """
         return {
             "rate_limit": self._rate_limit,
             "current_rate": self.current_rate,
-            "available_tokens": self._tokens,
-            "total_requests": self._total_requests,
-            "blocked_requests": self._blocked_requests,
+            "available_tokens": self.available_tokens,
+            "total_requests": self._stats.total_requests,
+            "blocked_requests": self._stats.blocked_requests,
+            "blocked_rate": self._stats.blocked_rate,
+            **self._stats.wait_percentiles(),
             "bucket_capacity": self._bucket_capacity,
         }
 
@@ -233,7 +720,484 @@ class RateLimiter:
         return (
             f"RateLimiter("
             f"rate_limit={self._rate_limit}, "
-            f"available_tokens={self._tokens:.2f}, "
+            f"available_tokens={self.available_tokens:.2f}, "
             f"current_rate={self.current_rate:.2f}"
             f")"
         )
+
+
+class CostAwareRateLimiter(RateLimiter):
+    """Rate limiter paced on the server's reported query cost budget.
+
+    GraphQL responses may report the cost of a query and the state of the
+    server's cost bucket in ``extensions``::
+
+        {"cost": {"requestedQueryCost": 12, "actualQueryCost": 10,
+                  "throttleStatus": {"maximumAvailable": 1000.0,
+                                     "currentlyAvailable": 990,
+                                     "restoreRate": 50.0}}}
+
+    Each response re-synchronizes a local copy of that bucket, which is then
+    restored at the reported rate. Before a request is sent, the limiter
+    waits until the bucket can cover the expected cost of the request (a
+    moving average of recent actual costs) plus the expected cost of
+    requests still in flight. The cost reserved by :meth:`acquire` stays in
+    flight until it is returned to :meth:`settle`, which the client does
+    for every outcome of a request. The request rate limit still applies
+    on top.
+
+    Until the server reports a throttle status, only the request rate limit
+    is enforced.
+    """
+
+    # Weight of the latest actual cost in the expected cost moving average
+    COST_SMOOTHING = 0.3
+
+    def __init__(
+        self,
+        rate_limit: Optional[float] = None,
+        settings: Optional[ShopifyPartnersSDKSettings] = None,
+    ) -> None:
+        """Initialize the cost-aware rate limiter.
+
+        Args:
+            rate_limit: Maximum requests per second (defaults to settings value)
+            settings: SDK settings instance
+        """
+        super().__init__(rate_limit, settings)
+
+        # Server cost bucket as of the last synchronization
+        self._maximum_cost: Optional[float] = None
+        self._available_cost = 0.0
+        self._restore_rate = 0.0
+        self._last_sync = time.monotonic()
+
+        self._expected_cost = 1.0
+        self._in_flight_cost = 0.0
+        self._throttled_requests = 0
+
+    @property
+    def synchronized(self) -> bool:
+        """Check whether the server has reported its throttle status."""
+        return self._maximum_cost is not None
+
+    @property
+    def available_cost(self) -> Optional[float]:
+        """Get the estimated cost currently available on the server."""
+        if self._maximum_cost is None:
+            return None
+        return self._current_available_cost()
+
+    @property
+    def expected_cost(self) -> float:
+        """Get the cost expected for the next request."""
+        return self._expected_cost
+
+    def _current_available_cost(self) -> float:
+        """Estimate the server bucket level, less the cost of in-flight requests."""
+        elapsed = time.monotonic() - self._last_sync
+        restored = self._available_cost + elapsed * self._restore_rate
+        return min(self._maximum_cost, restored) - self._in_flight_cost
+
+    def _reserve_cost(self, cost: float) -> tuple[float, float]:
+        """Reserve cost capacity for a request, if it is available.
+
+        Must be called with the lock held.
+
+        Returns:
+            Tuple of the time to wait before the cost can be reserved (0.0
+            once it is) and the cost reserved
+        """
+        if self._maximum_cost is None:
+            return 0.0, 0.0
+        # A request can never need more than the whole bucket
+        cost = min(cost, self._maximum_cost)
+        shortfall = cost - self._current_available_cost()
+        if shortfall <= 0:
+            self._in_flight_cost += cost
+            return 0.0, cost
+        if self._restore_rate <= 0:
+            # Nothing is restored before the next response resynchronizes us
+            return 1.0 / self._refill_rate, 0.0
+        return shortfall / self._restore_rate, 0.0
+
+    def _raise_cost_timeout(self, wait_time: float) -> None:
+        """Raise the error for a request that cannot get cost capacity in time."""
+        self._throttled_requests += 1
+        raise RateLimitExceededError(
+            current_rate=self.current_rate,
+            max_rate=self._rate_limit,
+            retry_after=wait_time,
+        )
+
+    def acquire(
+        self,
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> float:
+        """Acquire a request token and cost capacity for one request.
+
+        Args:
+            tokens: Number of request tokens to acquire
+            timeout: Maximum time to wait (None for no timeout)
+            deadline: Latest ``time.monotonic()`` to wait until (None for no
+                deadline)
+            priority: Request priority class
+
+        Returns:
+            Cost reserved for the request, to pass to :meth:`settle` once it
+            completes
+
+        Raises:
+            RateLimitExceededError: If timeout is exceeded while waiting
+            ValueError: If tokens requested is invalid
+        """
+        if timeout is not None:
+            deadline = min(deadline or float("inf"), time.monotonic() + timeout)
+        super().acquire(tokens, deadline=deadline, priority=priority)
+
+        while True:
+            with self._lock:
+                wait_time, reserved = self._reserve_cost(self._expected_cost)
+                if wait_time == 0.0:
+                    return reserved
+                if deadline is not None and time.monotonic() + wait_time > deadline:
+                    self._raise_cost_timeout(wait_time)
+            time.sleep(wait_time)
+
+    async def acquire_async(
+        self,
+        tokens: float = 1.0,
+        timeout: Optional[float] = None,
+        deadline: Optional[float] = None,
+        priority: RequestPriority = RequestPriority.NORMAL,
+    ) -> float:
+        """Acquire a request token and cost capacity without blocking the loop.
+
+        Args:
+            tokens: Number of request tokens to acquire
+            timeout: Maximum time to wait (None for no timeout)
+            deadline: Latest ``time.monotonic()`` to wait until (None for no
+                deadline)
+            priority: Request priority class
+
+        Returns:
+            Cost reserved for the request, to pass to :meth:`settle` once it
+            completes
+
+        Raises:
+            RateLimitExceededError: If timeout is exceeded while waiting
+            ValueError: If tokens requested is invalid
+        """
+        if timeout is not None:
+            deadline = min(deadline or float("inf"), time.monotonic() + timeout)
+        await super().acquire_async(tokens, deadline=deadline, priority=priority)
+
+        while True:
+            with self._lock:
+                wait_time, reserved = self._reserve_cost(self._expected_cost)
+                if wait_time == 0.0:
+                    return reserved
+                if deadline is not None and time.monotonic() + wait_time > deadline:
+                    self._raise_cost_timeout(wait_time)
+            await asyncio.sleep(wait_time)
+
+    def settle(self, reserved: Optional[float]) -> None:
+        """Release the cost reserved for a request that has completed.
+
+        Args:
+            reserved: Cost returned by :meth:`acquire`
+        """
+        if not reserved:
+            return
+        with self._lock:
+            self._in_flight_cost = max(0.0, self._in_flight_cost - reserved)
+
+    def update_from_extensions(self, extensions: Optional[dict[str, Any]]) -> None:
+        """Synchronize the cost bucket with the server's reported state.
+
+        Args:
+            extensions: The ``extensions`` object of a GraphQL response
+        """
+        cost = extensions.get("cost") if isinstance(extensions, dict) else None
+        if not isinstance(cost, dict):
+            return
+
+        actual = cost.get("actualQueryCost")
+        if actual is None:
+            actual = cost.get("requestedQueryCost")
+        throttle_status = cost.get("throttleStatus") or {}
+
+        with self._lock:
+            if isinstance(actual, (int, float)):
+                self._expected_cost += self.COST_SMOOTHING * (
+                    float(actual) - self._expected_cost
+                )
+
+            try:
+                maximum = float(throttle_status["maximumAvailable"])
+                available = float(throttle_status["currentlyAvailable"])
+                restore_rate = float(throttle_status["restoreRate"])
+            except (KeyError, TypeError, ValueError):
+                return
+            self._maximum_cost = maximum
+            self._available_cost = available
+            self._restore_rate = restore_rate
+            self._last_sync = time.monotonic()
+
+    def reset(self) -> None:
+        """Reset the rate limiter to initial state."""
+        super().reset()
+        with self._lock:
+            self._maximum_cost = None
+            self._available_cost = 0.0
+            self._restore_rate = 0.0
+            self._last_sync = time.monotonic()
+            self._expected_cost = 1.0
+            self._in_flight_cost = 0.0
+            self._throttled_requests = 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary with rate limiter and cost bucket statistics
+        """
+        stats = super().get_stats()
+        stats.update(
+            {
+                "maximum_cost": self._maximum_cost,
+                "available_cost": self.available_cost,
+                "restore_rate": self._restore_rate,
+                "expected_cost": self._expected_cost,
+                "in_flight_cost": self._in_flight_cost,
+                "throttled_requests": self._throttled_requests,
+            }
+        )
+        return stats
+
+    def __repr__(self) -> str:
+        """String representation of the rate limiter."""
+        available = self.available_cost
+        return (
+            f"CostAwareRateLimiter("
+            f"rate_limit={self._rate_limit}, "
+            f"available_cost={'unknown' if available is None else f'{available:.1f}'}, "
+            f"expected_cost={self._expected_cost:.1f}"
+            f")"
+        )
+
+
+class AdaptiveRateLimiter(RateLimiter):
+    """Rate limiter that adapts its rate to server throttling (AIMD).
+
+    Every request the server accepts raises the rate additively by
+    ``increase`` requests per second, up to ``ceiling``. Every HTTP 429
+    multiplies the rate by ``decrease``, down to ``floor``, and a
+    ``Retry-After`` pauses the bucket for that long. Throttles arriving
+    within one back-off period of the previous decrease (e.g. from requests
+    that were already in flight) count as the same event.
+
+    Limiters created through :func:`create_rate_limiter` are shared by all
+    clients of the same organization in the process, so every caller backs
+    off together.
+    """
+
+    def __init__(
+        self,
+        rate_limit: Optional[float] = None,
+        settings: Optional[ShopifyPartnersSDKSettings] = None,
+        floor: Optional[float] = None,
+        ceiling: Optional[float] = None,
+        increase: Optional[float] = None,
+        decrease: Optional[float] = None,
+    ) -> None:
+        """Initialize the adaptive rate limiter.
+
+        Args:
+            rate_limit: Initial requests per second (defaults to settings value)
+            settings: SDK settings instance
+            floor: Minimum requests per second (defaults to settings value)
+            ceiling: Maximum requests per second (defaults to settings value,
+                or the initial rate)
+            increase: Requests per second added per accepted request
+            decrease: Factor the rate is multiplied by on a 429
+
+        Raises:
+            ValueError: If the parameters are inconsistent
+        """
+        super().__init__(rate_limit, settings)
+        settings = self._settings
+        self._floor = floor if floor is not None else settings.adaptive_rate_floor
+        self._ceiling = ceiling or settings.adaptive_rate_ceiling or self._rate_limit
+        self._increase = (
+            increase if increase is not None else settings.adaptive_rate_increase
+        )
+        self._decrease = (
+            decrease if decrease is not None else settings.adaptive_rate_decrease
+        )
+
+        if not 0 < self._floor <= self._ceiling:
+            raise ValueError("floor must be positive and not exceed ceiling")
+        if not 0 < self._decrease < 1:
+            raise ValueError("decrease must be between 0 and 1")
+        if self._increase < 0:
+            raise ValueError("increase must not be negative")
+
+        self._initial_rate = min(max(self._rate_limit, self._floor), self._ceiling)
+        self._set_rate(self._initial_rate)
+        self._tokens = self._bucket_capacity
+        self._last_decrease = float("-inf")
+        self._throttle_count = 0
+
+    @property
+    def floor(self) -> float:
+        """Get the minimum rate in requests per second."""
+        return self._floor
+
+    @property
+    def ceiling(self) -> float:
+        """Get the maximum rate in requests per second."""
+        return self._ceiling
+
+    @property
+    def throttle_count(self) -> int:
+        """Get the number of throttling events that decreased the rate."""
+        return self._throttle_count
+
+    def _set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens accumulated so far.
+
+        Must be called with the lock held (or before the limiter is shared).
+        """
+        self._refill_tokens()
+        self._rate_limit = rate
+        self._refill_rate = rate
+        self._bucket_capacity = max(1.0, rate)
+        self._tokens = min(self._tokens, self._bucket_capacity)
+
+    def record_success(self) -> None:
+        """Increase the rate additively after an accepted request."""
+        if self._increase == 0:
+            return
+        with self._lock:
+            if self._rate_limit < self._ceiling:
+                self._set_rate(min(self._ceiling, self._rate_limit + self._increase))
+
+    def record_throttle(self, retry_after: Optional[float] = None) -> None:
+        """Decrease the rate multiplicatively after an HTTP 429.
+
+        Args:
+            retry_after: Seconds the server asked to wait, if given
+        """
+        with self._lock:
+            now = time.monotonic()
+            backoff = retry_after if retry_after else 1.0 / self._rate_limit
+            if now - self._last_decrease >= backoff:
+                self._last_decrease = now
+                self._throttle_count += 1
+                self._set_rate(max(self._floor, self._rate_limit * self._decrease))
+                logger.warning(
+                    "Server throttled requests, reducing rate",
+                    extra={"rate_limit": self._rate_limit, "retry_after": retry_after},
+                )
+
+            if retry_after:
+                # Empty the bucket so the next token is due after retry_after
+                self._refill_tokens()
+                self._tokens = min(self._tokens, 1.0 - retry_after * self._refill_rate)
+
+    def reset(self) -> None:
+        """Reset the rate limiter to initial state."""
+        with self._lock:
+            self._set_rate(self._initial_rate)
+            self._last_decrease = float("-inf")
+            self._throttle_count = 0
+        super().reset()
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get rate limiter statistics.
+
+        Returns:
+            Dictionary with rate limiter and adaptation statistics
+        """
+        stats = super().get_stats()
+        stats.update(
+            {
+                "floor": self._floor,
+                "ceiling": self._ceiling,
+                "throttle_count": self._throttle_count,
+            }
+        )
+        return stats
+
+    def __repr__(self) -> str:
+        """String representation of the rate limiter."""
+        return (
+            f"AdaptiveRateLimiter("
+            f"rate_limit={self._rate_limit:.2f}, "
+            f"floor={self._floor}, "
+            f"ceiling={self._ceiling}, "
+            f"throttle_count={self._throttle_count}"
+            f")"
+        )
+
+
+# Adaptive limiters shared per organization, so the whole process backs off
+_shared_limiters: dict[tuple[Optional[str], str], AdaptiveRateLimiter] = {}
+_shared_limiters_lock = Lock()
+
+
+def create_rate_limiter(
+    settings: ShopifyPartnersSDKSettings,
+    organization_id: Optional[Union[int, str]] = None,
+) -> RateLimiter:
+    """Create the rate limiter selected by ``settings.rate_limit_strategy``.
+
+    Adaptive limiters are shared by all clients of the same organization and
+    base URL in the process; other strategies get a limiter per client. With
+    a ``rate_limit_backend`` other than ``"local"``, the request budget is
+    shared with other processes through that backend.
+
+    Args:
+        settings: SDK settings instance
+        organization_id: Organization the client is authenticated for
+            (defaults to ``settings.organization_id``)
+
+    Returns:
+        Rate limiter instance
+
+    Raises:
+        ValueError: If a shared backend is combined with a strategy other
+            than ``"fixed"``
+    """
+    if settings.rate_limit_backend != "local":
+        if settings.rate_limit_strategy != "fixed":
+            raise ValueError(
+                f"rate_limit_backend '{settings.rate_limit_backend}' only supports "
+                "the 'fixed' rate_limit_strategy"
+            )
+        # Imported here as the backends build on RateLimiter
+        from .limiter_backends import SharedRateLimiter, create_backend
+
+        return SharedRateLimiter(
+            create_backend(settings, organization_id), settings=settings
+        )
+    if settings.rate_limit_strategy == "cost":
+        return CostAwareRateLimiter(settings=settings)
+    if settings.rate_limit_strategy == "adaptive":
+        if organization_id is None:
+            organization_id = settings.organization_id
+        key = (
+            str(organization_id) if organization_id is not None else None,
+            settings.base_url,
+        )
+        with _shared_limiters_lock:
+            limiter = _shared_limiters.get(key)
+            if limiter is None:
+                limiter = AdaptiveRateLimiter(settings=settings)
+                _shared_limiters[key] = limiter
+            return limiter
+    return RateLimiter(settings=settings)
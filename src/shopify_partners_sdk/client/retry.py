@@ -1,5 +1,7 @@
 """Retry logic and backoff strategies for the Shopify Partners SDK."""
 
+import asyncio
+from collections.abc import Awaitable
 from contextlib import suppress
 import random
 import time
@@ -209,6 +211,55 @@ class RetryHandler:
             raise last_exception
         raise RuntimeError("Unexpected retry loop exit")
 
+    async def execute_with_retry_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Execute a coroutine function with retry logic.
+
+        Uses the same retry policy as :meth:`execute_with_retry`, but waits
+        between attempts with ``asyncio.sleep``.
+
+        Args:
+            func: The coroutine function to execute
+            *args: Positional arguments for the function
+            **kwargs: Keyword arguments for the function
+
+        Returns:
+            The result of the awaited function call
+
+        Raises:
+            The last exception if all retry attempts fail
+        """
+        last_exception: Optional[Exception] = None
+
+        for attempt in range(self.max_attempts + 1):
+            self._total_attempts += 1
+
+            try:
+                result = await func(*args, **kwargs)
+                self._successful_attempts += 1
+                return result
+
+            except Exception as e:
+                last_exception = e
+                self._failed_attempts += 1
+
+                if not self.should_retry(e, attempt):
+                    raise e
+
+                if attempt < self.max_attempts:
+                    delay = self.get_retry_delay(e, attempt)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+
+        # This should never be reached, but just in case
+        if last_exception:
+            raise last_exception
+        raise RuntimeError("Unexpected retry loop exit")
+
     def reset_stats(self) -> None:
         """Reset retry statistics."""
         self._total_attempts = 0
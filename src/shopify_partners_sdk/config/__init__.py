@@ -3,41 +3,65 @@
 from .defaults import (
     ACCESS_TOKEN_HEADER,
     CONTENT_TYPE_HEADER,
+    DEFAULT_ADAPTIVE_RATE_DECREASE,
+    DEFAULT_ADAPTIVE_RATE_FLOOR,
+    DEFAULT_ADAPTIVE_RATE_INCREASE,
     DEFAULT_API_VERSION,
     DEFAULT_BASE_URL,
+    DEFAULT_ENTITY_STORE_MAX_ENTITIES,
+    DEFAULT_ENTITY_STORE_TTL,
     DEFAULT_GRAPHQL_PATH,
     DEFAULT_LOG_LEVEL,
+    DEFAULT_MAX_BATCH_SIZE,
     DEFAULT_MAX_CONNECTIONS,
     DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_MAX_PAGE_SIZE,
     DEFAULT_MAX_RETRY_ATTEMPTS,
     DEFAULT_PAGE_SIZE,
+    DEFAULT_QUERY_CACHE_SIZE,
+    DEFAULT_RATE_LIMIT_COORDINATOR,
+    DEFAULT_RATE_LIMIT_MAX_DEFERRAL,
     DEFAULT_RATE_LIMIT_PER_SECOND,
+    DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    DEFAULT_RESPONSE_CACHE_TTL,
     DEFAULT_RETRY_BACKOFF_FACTOR,
     DEFAULT_RETRY_BASE_DELAY,
     DEFAULT_RETRY_MAX_DELAY,
     DEFAULT_TIMEOUT_SECONDS,
     USER_AGENT,
 )
+from .paths import user_cache_dir
 from .settings import ShopifyPartnersSDKSettings
 
 __all__ = [
     "ShopifyPartnersSDKSettings",
     "ACCESS_TOKEN_HEADER",
     "CONTENT_TYPE_HEADER",
+    "DEFAULT_ADAPTIVE_RATE_DECREASE",
+    "DEFAULT_ADAPTIVE_RATE_FLOOR",
+    "DEFAULT_ADAPTIVE_RATE_INCREASE",
     "DEFAULT_API_VERSION",
     "DEFAULT_BASE_URL",
+    "DEFAULT_ENTITY_STORE_MAX_ENTITIES",
+    "DEFAULT_ENTITY_STORE_TTL",
     "DEFAULT_GRAPHQL_PATH",
     "DEFAULT_LOG_LEVEL",
+    "DEFAULT_MAX_BATCH_SIZE",
     "DEFAULT_MAX_CONNECTIONS",
     "DEFAULT_MAX_KEEPALIVE_CONNECTIONS",
     "DEFAULT_MAX_PAGE_SIZE",
     "DEFAULT_MAX_RETRY_ATTEMPTS",
     "DEFAULT_PAGE_SIZE",
+    "DEFAULT_QUERY_CACHE_SIZE",
+    "DEFAULT_RATE_LIMIT_COORDINATOR",
+    "DEFAULT_RATE_LIMIT_MAX_DEFERRAL",
     "DEFAULT_RATE_LIMIT_PER_SECOND",
+    "DEFAULT_RESPONSE_CACHE_MAX_BYTES",
+    "DEFAULT_RESPONSE_CACHE_TTL",
     "DEFAULT_RETRY_BACKOFF_FACTOR",
     "DEFAULT_RETRY_BASE_DELAY",
     "DEFAULT_RETRY_MAX_DELAY",
     "DEFAULT_TIMEOUT_SECONDS",
     "USER_AGENT",
+    "user_cache_dir",
 ]
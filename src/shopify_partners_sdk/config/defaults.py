@@ -13,6 +13,11 @@ DEFAULT_MAX_RETRY_ATTEMPTS: Final[int] = 3
 DEFAULT_RETRY_BASE_DELAY: Final[float] = 1.0
 DEFAULT_RETRY_MAX_DELAY: Final[float] = 60.0
 DEFAULT_RETRY_BACKOFF_FACTOR: Final[float] = 2.0
+DEFAULT_ADAPTIVE_RATE_FLOOR: Final[float] = 0.5
+DEFAULT_ADAPTIVE_RATE_INCREASE: Final[float] = 0.05
+DEFAULT_ADAPTIVE_RATE_DECREASE: Final[float] = 0.5
+DEFAULT_RATE_LIMIT_COORDINATOR: Final[str] = "127.0.0.1:8765"
+DEFAULT_RATE_LIMIT_MAX_DEFERRAL: Final[float] = 10.0
 
 # HTTP Client
 DEFAULT_TIMEOUT_SECONDS: Final[float] = 30.0
@@ -23,6 +28,18 @@ DEFAULT_MAX_KEEPALIVE_CONNECTIONS: Final[int] = 5
 DEFAULT_PAGE_SIZE: Final[int] = 50
 DEFAULT_MAX_PAGE_SIZE: Final[int] = 250
 
+# Query Building
+DEFAULT_QUERY_CACHE_SIZE: Final[int] = 256
+DEFAULT_MAX_BATCH_SIZE: Final[int] = 25
+
+# Response Cache
+DEFAULT_RESPONSE_CACHE_TTL: Final[float] = 60.0
+DEFAULT_RESPONSE_CACHE_MAX_BYTES: Final[int] = 16 * 1024 * 1024
+
+# Entity Store
+DEFAULT_ENTITY_STORE_MAX_ENTITIES: Final[int] = 10_000
+DEFAULT_ENTITY_STORE_TTL: Final[float] = 60.0
+
 # Logging
 DEFAULT_LOG_LEVEL: Final[str] = "INFO"
 
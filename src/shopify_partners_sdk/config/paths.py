@@ -0,0 +1,38 @@
+"""Per-user locations for files the SDK keeps between runs."""
+
+import os
+from pathlib import Path
+
+CACHE_DIR_NAME = "shopify-partners-sdk"
+
+
+def user_cache_dir() -> Path:
+    """Get the per-user cache directory of the SDK, creating it if needed.
+
+    The directory is ``$XDG_CACHE_HOME/shopify-partners-sdk`` (or
+    ``~/.cache/shopify-partners-sdk``), and ``%LOCALAPPDATA%`` on Windows.
+    It is private to the user (mode 0700), since it holds API responses and
+    rate limit state.
+
+    Returns:
+        Cache directory path
+
+    Raises:
+        PermissionError: If the directory belongs to another user
+    """
+    if os.name == "nt":  # pragma: no cover - Windows
+        base = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    directory = Path(base) / CACHE_DIR_NAME
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    if os.name != "nt":
+        status = directory.stat()
+        if status.st_uid != os.getuid():
+            raise PermissionError(
+                f"Cache directory {directory} belongs to another user"
+            )
+        if status.st_mode & 0o077:
+            directory.chmod(0o700)
+    return directory
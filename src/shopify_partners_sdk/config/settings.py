@@ -1,19 +1,29 @@
 """Configuration settings for the Shopify Partners SDK using Pydantic."""
 
-from typing import Optional
+from typing import Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, ValidationInfo, field_validator
 
 from .defaults import (
+    DEFAULT_ADAPTIVE_RATE_DECREASE,
+    DEFAULT_ADAPTIVE_RATE_FLOOR,
+    DEFAULT_ADAPTIVE_RATE_INCREASE,
     DEFAULT_API_VERSION,
     DEFAULT_BASE_URL,
+    DEFAULT_ENTITY_STORE_MAX_ENTITIES,
+    DEFAULT_ENTITY_STORE_TTL,
     DEFAULT_LOG_LEVEL,
+    DEFAULT_MAX_BATCH_SIZE,
     DEFAULT_MAX_CONNECTIONS,
     DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
     DEFAULT_MAX_PAGE_SIZE,
     DEFAULT_MAX_RETRY_ATTEMPTS,
     DEFAULT_PAGE_SIZE,
+    DEFAULT_RATE_LIMIT_COORDINATOR,
+    DEFAULT_RATE_LIMIT_MAX_DEFERRAL,
     DEFAULT_RATE_LIMIT_PER_SECOND,
+    DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+    DEFAULT_RESPONSE_CACHE_TTL,
     DEFAULT_RETRY_BACKOFF_FACTOR,
     DEFAULT_RETRY_BASE_DELAY,
     DEFAULT_RETRY_MAX_DELAY,
@@ -63,6 +73,66 @@ class ShopifyPartnersSDKSettings(BaseModel):
         le=10.0,
         description="Maximum requests per second (4.0 is Shopify's limit)",
     )
+    rate_limit_strategy: Literal["fixed", "cost", "adaptive"] = Field(
+        default="fixed",
+        description="Rate limiting strategy: 'fixed' paces requests at "
+        "rate_limit_per_second, 'cost' additionally paces them on the query "
+        "cost budget reported in response extensions, 'adaptive' adjusts the "
+        "rate to server throttling (AIMD)",
+    )
+    rate_limit_max_deferral: float = Field(
+        default=DEFAULT_RATE_LIMIT_MAX_DEFERRAL,
+        ge=0.0,
+        description="Longest time in seconds a normal or bulk request yields "
+        "to higher-priority requests before it is queued in arrival order",
+    )
+    rate_limit_backend: Literal["local", "file", "socket"] = Field(
+        default="local",
+        description="Where the request token bucket lives: 'local' (this "
+        "process), 'file' (a lock file shared by processes on this host) or "
+        "'socket' (a rate limit coordinator shared by several hosts)",
+    )
+    rate_limit_file: Optional[str] = Field(
+        default=None,
+        description="Bucket file of the 'file' backend (defaults to a "
+        "per-organization file in the user's cache directory)",
+    )
+    rate_limit_coordinator: str = Field(
+        default=DEFAULT_RATE_LIMIT_COORDINATOR,
+        description="host:port of the rate limit coordinator used by the "
+        "'socket' backend",
+    )
+    rate_limit_coordinator_secret: Optional[str] = Field(
+        default=None,
+        description="Shared secret the 'socket' backend authenticates with; "
+        "the coordinator must be started with the same secret",
+    )
+    adaptive_rate_floor: float = Field(
+        default=DEFAULT_ADAPTIVE_RATE_FLOOR,
+        gt=0.0,
+        le=10.0,
+        description="Minimum requests per second of the adaptive strategy",
+    )
+    adaptive_rate_ceiling: Optional[float] = Field(
+        default=None,
+        gt=0.0,
+        le=10.0,
+        description="Maximum requests per second of the adaptive strategy "
+        "(defaults to rate_limit_per_second)",
+    )
+    adaptive_rate_increase: float = Field(
+        default=DEFAULT_ADAPTIVE_RATE_INCREASE,
+        ge=0.0,
+        description="Requests per second the adaptive strategy adds after "
+        "each accepted request",
+    )
+    adaptive_rate_decrease: float = Field(
+        default=DEFAULT_ADAPTIVE_RATE_DECREASE,
+        gt=0.0,
+        lt=1.0,
+        description="Factor the adaptive strategy multiplies the rate by "
+        "when the server throttles a request",
+    )
     max_retry_attempts: int = Field(
         default=DEFAULT_MAX_RETRY_ATTEMPTS,
         ge=0,
@@ -107,6 +177,12 @@ class ShopifyPartnersSDKSettings(BaseModel):
         le=50,
         description="Maximum number of keep-alive connections",
     )
+    coalesce_requests: bool = Field(
+        default=False,
+        description="Share one request between concurrent identical queries "
+        "(mutations are never coalesced); callers waiting on a shared request "
+        "get its result or error",
+    )
 
     # Pagination
     default_page_size: int = Field(
@@ -122,6 +198,102 @@ class ShopifyPartnersSDKSettings(BaseModel):
         description="Maximum allowed page size",
     )
 
+    # Query Building
+    pretty_queries: bool = Field(
+        default=False,
+        description="Send indented GraphQL documents (for debugging) "
+        "instead of minified ones",
+    )
+    max_query_cost: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum estimated cost of a query built with the "
+        "field-based API (None disables the check)",
+    )
+    split_expensive_queries: bool = Field(
+        default=True,
+        description="Split root connection queries above max_query_cost into "
+        "smaller pages instead of rejecting them",
+    )
+    max_batch_size: int = Field(
+        default=DEFAULT_MAX_BATCH_SIZE,
+        ge=1,
+        description="Maximum number of queries merged into one request by "
+        "query batches",
+    )
+
+    # Schema
+    use_schema: bool = Field(
+        default=True,
+        description="Type query variables from the schema of api_version "
+        "when a schema is available",
+    )
+    validate_queries: bool = Field(
+        default=False,
+        description="Validate queries against the schema of api_version "
+        "before sending them",
+    )
+    schema_dir: Optional[str] = Field(
+        default=None,
+        description="Directory containing <api_version>/introspection.json files",
+    )
+
+    # Response Cache
+    response_cache: Literal["none", "memory", "sqlite"] = Field(
+        default="none",
+        description="Cache responses of read-only queries: 'none', 'memory' "
+        "(in-process LRU) or 'sqlite' (a database file shared by processes)",
+    )
+    response_cache_ttl: float = Field(
+        default=DEFAULT_RESPONSE_CACHE_TTL,
+        ge=0.0,
+        description="Seconds a cached response stays fresh (0 caches only "
+        "operations listed in response_cache_ttls)",
+    )
+    response_cache_ttls: dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-operation TTLs keyed by operation name or root "
+        "field name (e.g. {'publicApiVersions': 3600}); 0 disables caching",
+    )
+    response_cache_stale_while_revalidate: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds an expired response may still be served while "
+        "it is refreshed in the background",
+    )
+    response_cache_max_bytes: int = Field(
+        default=DEFAULT_RESPONSE_CACHE_MAX_BYTES,
+        ge=0,
+        description="Maximum total size of the 'memory' cache",
+    )
+    response_cache_path: Optional[str] = Field(
+        default=None,
+        description="Database file of the 'sqlite' cache (defaults to a file "
+        "in the user's cache directory)",
+    )
+    entity_store: bool = Field(
+        default=False,
+        description="Deduplicate response objects by GlobalID in a normalized "
+        "entity store",
+    )
+    entity_store_max_entities: int = Field(
+        default=DEFAULT_ENTITY_STORE_MAX_ENTITIES,
+        ge=1,
+        description="Maximum number of objects in the entity store (least "
+        "recently used objects are evicted)",
+    )
+    entity_store_lookups: bool = Field(
+        default=False,
+        description="Answer lookups by ID from the entity store, without a "
+        "request, when it holds every selected field",
+    )
+    entity_store_ttl: float = Field(
+        default=DEFAULT_ENTITY_STORE_TTL,
+        ge=0,
+        description="Seconds after it was last fetched that an object may "
+        "answer lookups from the entity store",
+    )
+
     # Logging
     log_level: str = Field(
         default=DEFAULT_LOG_LEVEL,
@@ -165,18 +337,18 @@ class ShopifyPartnersSDKSettings(BaseModel):
 
     @field_validator("max_keepalive_connections")
     @classmethod
-    def validate_keepalive_connections(cls, v: int, values: dict) -> int:
+    def validate_keepalive_connections(cls, v: int, info: ValidationInfo) -> int:
         """Ensure keepalive connections don't exceed max connections."""
-        max_connections = values.get("max_connections", DEFAULT_MAX_CONNECTIONS)
+        max_connections = info.data.get("max_connections", DEFAULT_MAX_CONNECTIONS)
         if v > max_connections:
             raise ValueError("max_keepalive_connections cannot exceed max_connections")
         return v
 
     @field_validator("default_page_size")
     @classmethod
-    def validate_default_page_size(cls, v: int, values: dict) -> int:
+    def validate_default_page_size(cls, v: int, info: ValidationInfo) -> int:
         """Ensure default page size doesn't exceed max page size."""
-        max_page_size = values.get("max_page_size", DEFAULT_MAX_PAGE_SIZE)
+        max_page_size = info.data.get("max_page_size", DEFAULT_MAX_PAGE_SIZE)
         if v > max_page_size:
             raise ValueError("default_page_size cannot exceed max_page_size")
         return v
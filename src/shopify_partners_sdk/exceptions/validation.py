@@ -69,3 +69,25 @@ class InvalidDateRangeError(ValidationError):
         super().__init__(message, details)
         self.start_date = start_date
         self.end_date = end_date
+
+
+class QueryCostExceededError(ValidationError):
+    """Exception raised when a query's estimated cost exceeds the budget."""
+
+    def __init__(self, query_name: str, cost: int, budget: int) -> None:
+        """Initialize the query cost exceeded error.
+
+        Args:
+            query_name: Root field of the query
+            cost: Estimated query cost
+            budget: Maximum allowed query cost
+        """
+        message = (
+            f"Estimated cost of query '{query_name}' is {cost}, "
+            f"which exceeds the budget of {budget}"
+        )
+        details = {"query_name": query_name, "cost": cost, "budget": budget}
+        super().__init__(message, details)
+        self.query_name = query_name
+        self.cost = cost
+        self.budget = budget
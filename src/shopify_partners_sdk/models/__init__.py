@@ -42,6 +42,7 @@ from .objects import (
     AppEvent,
     AppEventConnection,
     AppEventEdge,
+    AppEventUnion,
     AppOneTimeSale,
     AppPurchaseOneTime,
     AppSaleAdjustment,
@@ -95,6 +96,7 @@ from .scalars import (
     Money,
     MoneyAmount,
 )
+from .store import EntityStore
 
 __all__ = [
     # Base classes
@@ -150,6 +152,7 @@ __all__ = [
     "AppEvent",
     "AppEventConnection",
     "AppEventEdge",
+    "AppEventUnion",
     "CreditApplied",
     "CreditFailed",
     "CreditPending",
@@ -189,4 +192,6 @@ __all__ = [
     "ReferralTransaction",
     "ReferralAdjustment",
     "LegacyTransaction",
+    # Normalized entity store
+    "EntityStore",
 ]
@@ -1,13 +1,18 @@
 """Base model classes for the Shopify Partners SDK."""
 
-from typing import Any, Optional, TypeVar
+from collections.abc import Sequence
+from typing import Annotated, Any, Optional, TypeVar, Union
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 
 from .scalars import GlobalID
 
 T = TypeVar("T", bound="ShopifyPartnersBaseModel")
 
+TYPENAME_FIELD = "__typename"
+# Tag of the member parsed when an object has no known __typename
+_FALLBACK_TAG = "__fallback__"
+
 
 class ShopifyPartnersBaseModel(BaseModel):
     """Base model for all Shopify Partners API objects.
@@ -172,6 +177,37 @@ class UserError(ShopifyPartnersBaseModel):
         return f"UserError(message='{self.message}')"
 
 
+def typename_union(members: Sequence[type], fallback: Any) -> Any:
+    """Build a union type that parses objects by their ``__typename``.
+
+    Objects carrying the ``__typename`` of a member (the member's class name)
+    are parsed straight into that member, instead of trying each member in
+    turn. Objects without it, or with a type the SDK does not know yet, are
+    parsed as ``fallback``.
+
+    Args:
+        members: Model classes of the union, named after their GraphQL types
+        fallback: Type to parse objects without a known ``__typename`` as
+
+    Returns:
+        Annotated union type usable as a field type
+    """
+    names = frozenset(member.__name__ for member in members)
+
+    def member_tag(value: Any) -> str:
+        if isinstance(value, dict):
+            typename = value.get(TYPENAME_FIELD)
+        else:
+            typename = type(value).__name__
+        return typename if typename in names else _FALLBACK_TAG
+
+    choices = tuple(Annotated[member, Tag(member.__name__)] for member in members)
+    return Annotated[
+        Union[(*choices, Annotated[fallback, Tag(_FALLBACK_TAG)])],
+        Discriminator(member_tag),
+    ]
+
+
 # Forward reference resolution
 PageInfo.model_rebuild()
 Connection.model_rebuild()
@@ -1,12 +1,16 @@
 """Object model types for the Shopify Partners SDK."""
 
+from shopify_partners_sdk.models.scalars import Money
+
 from .app import (
+    APP_EVENT_TYPES,
     App,
     AppCharge,
     AppCredit,
     AppEvent,
     AppEventConnection,
     AppEventEdge,
+    AppEventUnion,
     AppPurchaseOneTime,
     AppSubscription,
     AppSubscriptionCharge,
@@ -36,6 +40,7 @@ from .app import (
 from .organization import Organization
 from .shop import Shop
 from .transaction import (
+    TRANSACTION_TYPES,
     AppOneTimeSale,
     AppSaleAdjustment,
     AppSaleCredit,
@@ -56,6 +61,26 @@ from .transaction import (
 )
 from .version import ApiVersion
 
+# Forward reference resolution: models refer to models of other modules
+_namespace = {"App": App, "Money": Money, "Shop": Shop}
+for _model in (
+    AppCharge,
+    AppCredit,
+    AppPurchaseOneTime,
+    AppSubscription,
+    AppSubscriptionCharge,
+    AppUsageCharge,
+    App,
+    AppEvent,
+    *APP_EVENT_TYPES,
+    AppEventEdge,
+    AppEventConnection,
+    *TRANSACTION_TYPES,
+    TransactionEdge,
+    TransactionConnection,
+):
+    _model.model_rebuild(_types_namespace=_namespace)
+
 __all__ = [
     # App models
     "App",
@@ -64,6 +89,7 @@ __all__ = [
     "AppEvent",
     "AppEventConnection",
     "AppEventEdge",
+    "AppEventUnion",
     "AppPurchaseOneTime",
     "AppSubscription",
     "AppSubscriptionCharge",
@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional
 
 from pydantic import Field
 
-from shopify_partners_sdk.models.base import Connection, Edge, Node
+from shopify_partners_sdk.models.base import Connection, Edge, Node, typename_union
 from shopify_partners_sdk.models.enums import AppEventType
 from shopify_partners_sdk.models.scalars import DateTime
 
@@ -187,20 +187,49 @@ class UsageChargeApplied(AppEvent):
     )
 
 
+# App event types, named after their GraphQL types
+APP_EVENT_TYPES = (
+    CreditApplied,
+    CreditFailed,
+    CreditPending,
+    RelationshipInstalled,
+    RelationshipUninstalled,
+    RelationshipReactivated,
+    RelationshipDeactivated,
+    OneTimeChargeAccepted,
+    OneTimeChargeActivated,
+    OneTimeChargeDeclined,
+    OneTimeChargeExpired,
+    SubscriptionChargeAccepted,
+    SubscriptionChargeActivated,
+    SubscriptionChargeCanceled,
+    SubscriptionChargeDeclined,
+    SubscriptionChargeExpired,
+    SubscriptionChargeFrozen,
+    SubscriptionChargeUnfrozen,
+    SubscriptionCappedAmountUpdated,
+    SubscriptionApproachingCappedAmount,
+    UsageChargeApplied,
+)
+
+# Union type for all app event types, parsed by __typename when selected
+AppEventUnion = typename_union(APP_EVENT_TYPES, AppEvent)
+
+
 class AppEventEdge(Edge):
     """Edge for app event connections."""
 
-    node: AppEvent = Field(..., description="The app event")
+    node: AppEventUnion = Field(..., description="The app event")
 
 
 class AppEventConnection(Connection):
     """Connection for paginated app events."""
 
     edges: list[AppEventEdge] = Field(..., description="List of app event edges")
-    nodes: Optional[list[AppEvent]] = Field(None, description="List of app events")
+    nodes: Optional[list[AppEventUnion]] = Field(None, description="List of app events")
 
     @property
-    def events(self) -> list[AppEvent]:
+    def events(self) -> list[AppEventUnion]:
         """Get list of app events from edges."""
         return [edge.node for edge in self.edges]
 
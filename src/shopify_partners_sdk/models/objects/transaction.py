@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from pydantic import Field
 
-from shopify_partners_sdk.models.base import Connection, Edge, Node
+from shopify_partners_sdk.models.base import Connection, Edge, Node, typename_union
 from shopify_partners_sdk.models.enums import AppPricingInterval, TaxType
 from shopify_partners_sdk.models.scalars import DateTime, GlobalID, Money
 
@@ -315,8 +315,8 @@ class LegacyTransaction(Transaction):
         return f"LegacyTransaction(amount={self.amount})"
 
 
-# Union type for all transaction types
-TransactionUnion = Union[
+# Transaction types, named after their GraphQL types
+TRANSACTION_TYPES = (
     AppOneTimeSale,
     AppSubscriptionSale,
     AppUsageSale,
@@ -330,7 +330,10 @@ TransactionUnion = Union[
     ReferralTransaction,
     ReferralAdjustment,
     LegacyTransaction,
-]
+)
+
+# Union type for all transaction types, parsed by __typename when selected
+TransactionUnion = typename_union(TRANSACTION_TYPES, Union[TRANSACTION_TYPES])
 
 
 class TransactionEdge(Edge):
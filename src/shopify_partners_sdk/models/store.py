@@ -0,0 +1,332 @@
+"""Normalized store of API objects keyed by their GlobalID."""
+
+from collections import OrderedDict
+from collections.abc import Iterator
+import copy
+from threading import RLock
+import time
+from typing import TYPE_CHECKING, Any, Optional, TypeVar
+
+from shopify_partners_sdk.config.defaults import DEFAULT_ENTITY_STORE_MAX_ENTITIES
+
+if TYPE_CHECKING:
+    from shopify_partners_sdk.queries.fields import FieldSelector
+
+    from .base import ShopifyPartnersBaseModel
+
+M = TypeVar("M", bound="ShopifyPartnersBaseModel")
+
+GLOBAL_ID_PREFIX = "gid://partners/"
+_INLINE_FRAGMENT_PREFIX = "... on "
+
+
+def _is_global_id(value: Any) -> bool:
+    """Check whether a value looks like a Partners API GlobalID."""
+    return isinstance(value, str) and value.startswith(GLOBAL_ID_PREFIX)
+
+
+class EntityStore:
+    """Normalized cache deduplicating response objects by their GlobalID.
+
+    Within a response, occurrences of an object with a GlobalID ``id`` and
+    identical fields share one dictionary, so the same ``App`` or ``Shop``
+    nested in thousands of events is held once. Occurrences with different
+    fields (e.g. aliased selections of the same object) are left as they
+    are. The store keeps its own copy of each object, merged across
+    occurrences and responses, so partial selections of an object from
+    different queries combine and objects can be read back without a
+    request.
+
+    Responses never share dictionaries with the store or with each other,
+    and every read returns a copy, so a later response does not change data
+    a caller already holds. The store holds at most ``max_entities``
+    objects and evicts the least recently used ones beyond that.
+
+    Merging is field by field with the latest response winning, so a field
+    fetched with different arguments (e.g. a connection with another page
+    size) keeps the last value received.
+
+    Example:
+        >>> store = EntityStore(max_entities=1000)
+        >>> data = store.normalize(response["data"])
+        >>> app = store.get("gid://partners/App/123")
+        >>> store.get_model("gid://partners/App/123", App)
+    """
+
+    def __init__(self, max_entities: int = DEFAULT_ENTITY_STORE_MAX_ENTITIES) -> None:
+        """Initialize an empty store.
+
+        Args:
+            max_entities: Maximum number of stored objects
+
+        Raises:
+            ValueError: If max_entities is not positive
+        """
+        if max_entities < 1:
+            raise ValueError("max_entities must be positive")
+        self._max_entities = max_entities
+        # GlobalID -> (fields, monotonic time of the last merge), oldest first
+        self._entities: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+        self._models: dict[str, dict[type, Any]] = {}
+        self._lock = RLock()
+        self._merges = 0
+        self._evictions = 0
+        self._lookups = 0
+        self._lookup_hits = 0
+
+    @property
+    def max_entities(self) -> int:
+        """Get the maximum number of stored objects."""
+        return self._max_entities
+
+    def normalize(self, data: Any) -> Any:
+        """Deduplicate the objects of response data and merge them into the store.
+
+        Objects with the same ID and equal fields are replaced, in place, by
+        one shared dictionary; no object's fields are changed. The store
+        merges a copy of every occurrence, in response order.
+
+        Args:
+            data: Response data (dictionaries, lists and scalars)
+
+        Returns:
+            The data, with identical objects deduplicated
+        """
+        occurrences: list[tuple[str, dict[str, Any]]] = []
+        data = self._normalize(data, {}, occurrences)
+        merged: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            for global_id, value in occurrences:
+                # Repeats of the object merged last would change nothing
+                if merged.get(global_id) is not value:
+                    self._merge(global_id, copy.deepcopy(value))
+                    merged[global_id] = value
+        return data
+
+    def _normalize(
+        self,
+        value: Any,
+        objects: dict[str, list[dict[str, Any]]],
+        occurrences: list[tuple[str, dict[str, Any]]],
+    ) -> Any:
+        """Deduplicate a value against the objects already seen in its response.
+
+        Args:
+            value: Part of the response data
+            objects: Distinct objects seen so far, per GlobalID
+            occurrences: Every object with a GlobalID, collected for merging
+
+        Returns:
+            The value, or an equal object seen earlier in the response
+        """
+        if isinstance(value, list):
+            for index, item in enumerate(value):
+                value[index] = self._normalize(item, objects, occurrences)
+            return value
+        if not isinstance(value, dict):
+            return value
+
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                value[key] = self._normalize(item, objects, occurrences)
+
+        global_id = value.get("id")
+        if not _is_global_id(global_id):
+            return value
+        distinct = objects.setdefault(global_id, [])
+        shared = next((seen for seen in distinct if seen == value), None)
+        if shared is None:
+            distinct.append(value)
+            shared = value
+        occurrences.append((global_id, shared))
+        return shared
+
+    def _merge(self, global_id: str, value: dict[str, Any]) -> None:
+        """Merge an object into the store. Must be called with the lock held."""
+        stored = self._entities.pop(global_id, None)
+        if stored is not None:
+            stored[0].update(value)
+            value = stored[0]
+            self._merges += 1
+            self._models.pop(global_id, None)
+        self._entities[global_id] = (value, time.monotonic())
+
+        while len(self._entities) > self._max_entities:
+            evicted, _ = self._entities.popitem(last=False)
+            self._models.pop(evicted, None)
+            self._evictions += 1
+
+    def _entity(
+        self, global_id: str, max_age: Optional[float] = None
+    ) -> Optional[dict[str, Any]]:
+        """Get a stored object, marking it recently used.
+
+        Must be called with the lock held.
+        """
+        stored = self._entities.get(global_id)
+        if stored is None:
+            return None
+        entity, merged_at = stored
+        if max_age is not None and time.monotonic() - merged_at > max_age:
+            return None
+        self._entities.move_to_end(global_id)
+        return entity
+
+    def get(self, global_id: str) -> Optional[dict[str, Any]]:
+        """Get the stored fields of an object.
+
+        Args:
+            global_id: GlobalID of the object
+
+        Returns:
+            A copy of the stored fields, or None if the object is not stored
+        """
+        with self._lock:
+            entity = self._entity(global_id)
+            return copy.deepcopy(entity) if entity is not None else None
+
+    def lookup(
+        self,
+        global_id: str,
+        fields: Optional["FieldSelector"],
+        max_age: Optional[float] = None,
+    ) -> Optional[dict[str, Any]]:
+        """Get an object if the store holds every field of a selection.
+
+        Used for cache-first reads: a query for one object by ID can be
+        answered from the store when all its selected fields are known.
+        Fields with arguments (such as connections) are never considered
+        known, since the store does not record the arguments they were
+        fetched with.
+
+        Args:
+            global_id: GlobalID of the object
+            fields: Field selection the object must cover
+            max_age: Maximum seconds since the object was last merged
+                (None for no limit)
+
+        Returns:
+            A copy of the stored fields, or None if the object is missing,
+            older than ``max_age`` or lacks part of the selection
+        """
+        with self._lock:
+            self._lookups += 1
+            entity = self._entity(global_id, max_age)
+            if entity is None or fields is None or not self._covers(entity, fields):
+                return None
+            self._lookup_hits += 1
+            return copy.deepcopy(entity)
+
+    def _covers(self, value: Any, fields: "FieldSelector") -> bool:
+        """Check whether a stored value holds every field of a selection."""
+        if isinstance(value, list):
+            return all(self._covers(item, fields) for item in value)
+        if not isinstance(value, dict):
+            return value is None
+
+        for name, selection in fields._fields.items():
+            if isinstance(selection, str):
+                if name not in value:
+                    return False
+                continue
+            if getattr(selection, "_connection_args", None):
+                return False
+            if name.startswith(_INLINE_FRAGMENT_PREFIX):
+                if not self._covers(value, selection):
+                    return False
+                continue
+            if name not in value or not self._covers(value[name], selection):
+                return False
+        return True
+
+    def get_model(self, global_id: str, model_type: type[M]) -> Optional[M]:
+        """Get an object parsed into a model, parsing it once per change.
+
+        Args:
+            global_id: GlobalID of the object
+            model_type: Model class to parse the object into
+
+        Returns:
+            A copy of the parsed model, or None if the object is not stored
+
+        Raises:
+            pydantic.ValidationError: If the stored fields do not fit the model
+        """
+        with self._lock:
+            entity = self._entity(global_id)
+            if entity is None:
+                return None
+            models = self._models.setdefault(global_id, {})
+            model = models.get(model_type)
+            if model is None:
+                model = models[model_type] = model_type.from_graphql(entity)
+            return model.model_copy(deep=True)
+
+    def of_type(self, object_type: str) -> list[dict[str, Any]]:
+        """Get the stored objects of a GlobalID type.
+
+        Args:
+            object_type: Type part of the GlobalID (e.g. 'App', 'Shop')
+
+        Returns:
+            Copies of the stored fields of the objects
+        """
+        prefix = f"{GLOBAL_ID_PREFIX}{object_type}/"
+        with self._lock:
+            return [
+                copy.deepcopy(entity)
+                for global_id, (entity, _) in self._entities.items()
+                if global_id.startswith(prefix)
+            ]
+
+    def evict(self, global_id: str) -> None:
+        """Remove an object from the store."""
+        with self._lock:
+            self._entities.pop(global_id, None)
+            self._models.pop(global_id, None)
+
+    def clear(self) -> None:
+        """Remove all objects and reset statistics."""
+        with self._lock:
+            self._entities.clear()
+            self._models.clear()
+            self._merges = 0
+            self._evictions = 0
+            self._lookups = 0
+            self._lookup_hits = 0
+
+    def __contains__(self, global_id: object) -> bool:
+        """Check whether an object is stored."""
+        return global_id in self._entities
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the stored GlobalIDs."""
+        with self._lock:
+            return iter(list(self._entities))
+
+    def __len__(self) -> int:
+        """Get the number of stored objects."""
+        return len(self._entities)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get store statistics.
+
+        Returns:
+            Dictionary with store statistics
+        """
+        return {
+            "entities": len(self._entities),
+            "max_entities": self._max_entities,
+            "parsed_models": sum(len(models) for models in self._models.values()),
+            "merges": self._merges,
+            "evictions": self._evictions,
+            "lookups": self._lookups,
+            "lookup_hits": self._lookup_hits,
+        }
+
+    def __repr__(self) -> str:
+        """String representation of the store."""
+        return (
+            f"EntityStore(entities={len(self._entities)}, "
+            f"max_entities={self._max_entities})"
+        )
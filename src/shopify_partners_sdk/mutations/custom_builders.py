@@ -1,8 +1,19 @@
 """Custom GraphQL mutation builders with field selection."""
 
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-from shopify_partners_sdk.queries.fields import FieldSelector
+from shopify_partners_sdk.queries.cache import get_query_cache
+from shopify_partners_sdk.queries.document import build_operation
+from shopify_partners_sdk.queries.fields import CommonFields, FieldSelector
+
+if TYPE_CHECKING:
+    from shopify_partners_sdk.schema import SchemaIndex
+
+_DEFAULT_MUTATION_FIELDS = (
+    FieldSelector()
+    .add_nested_field("userErrors", CommonFields.user_error(frozen=True))
+    .freeze()
+)
 
 
 class CustomMutationBuilder:
@@ -13,6 +24,7 @@ class CustomMutationBuilder:
         mutation_name: str,
         fields: Optional[FieldSelector] = None,
         operation_name: Optional[str] = None,
+        schema: Optional["SchemaIndex"] = None,
     ) -> None:
         """Initialize dynamic mutation builder.
 
@@ -20,10 +32,13 @@ class CustomMutationBuilder:
             mutation_name: The root mutation field name (e.g., 'appCreditCreate')
             fields: Field selector for the mutation result
             operation_name: Optional GraphQL operation name
+            schema: Schema index used to type variables (inferred from the
+                Python values when not given)
         """
         self._mutation_name = mutation_name
         self._fields = fields
         self._operation_name = operation_name
+        self._schema = schema
         self._variables: dict[str, Any] = {}
         self._fragments: list[str] = []
 
@@ -60,6 +75,18 @@ class CustomMutationBuilder:
                 self._variables[name] = value
         return self
 
+    def with_schema(self, schema: Optional["SchemaIndex"]) -> "CustomMutationBuilder":
+        """Set the schema index used to type variables.
+
+        Args:
+            schema: Schema index (None to infer types from the Python values)
+
+        Returns:
+            Self for method chaining
+        """
+        self._schema = schema
+        return self
+
     def get_mutation_name(self) -> str:
         """Get the root mutation field name."""
         return self._mutation_name
@@ -78,18 +105,37 @@ class CustomMutationBuilder:
         """
         return self.add_variable(variable_name, input_data)
 
-    def build_variable_definitions(self) -> str:
+    def build_variable_definitions(
+        self, signature: Optional[tuple[tuple[str, str], ...]] = None
+    ) -> str:
         """Build GraphQL variable definitions from current variables."""
-        if not self._variables:
+        if signature is None:
+            signature = self._variable_signature()
+        if not signature:
             return ""
 
-        definitions = []
-        for name, value in self._variables.items():
-            var_type = self._infer_variable_type(value, name)
-            definitions.append(f"${name}: {var_type}")
-
+        definitions = [f"${name}: {var_type}" for name, var_type in signature]
         return "(" + ", ".join(definitions) + ")"
 
+    def _variable_signature(self) -> tuple[tuple[str, str], ...]:
+        """Get the names and GraphQL types of the current variables.
+
+        Types come from the mutation's argument definitions when a schema
+        index is set, and are inferred from the Python values otherwise.
+
+        Raises:
+            GraphQLValidationError: If the schema has no such mutation or
+                argument
+        """
+        if self._schema is not None:
+            return self._schema.resolve_root_arguments(
+                "mutation", self._mutation_name, self._variables
+            )
+        return tuple(
+            (name, self._infer_variable_type(value, name))
+            for name, value in self._variables.items()
+        )
+
     def _infer_variable_type(self, value: Any, variable_name: str = "") -> str:
         """Infer GraphQL type from Python value."""
         if isinstance(value, bool):
@@ -118,42 +164,41 @@ class CustomMutationBuilder:
             return "JSON!"
         return "String!"
 
-    def build_mutation(self) -> str:
-        """Build the complete GraphQL mutation string."""
-        # Build variable definitions
-        variable_defs = self.build_variable_definitions()
-
-        # Build operation name
-        operation_name = f" {self._operation_name}" if self._operation_name else ""
-
-        # Build field selection
-        field_selection = ""
-        if self._fields:
-            field_selection = self._fields.build(2)
-        else:
-            # Default mutation result fields
-            field_selection = """    userErrors {
-      field
-      message
-    }"""
-
-        # Build mutation arguments
-        mutation_args = ""
-        if self._variables:
-            args = [f"{name}: ${name}" for name in self._variables]
-            mutation_args = f"({', '.join(args)})"
-
-        # Build fragments
-        fragments = "\n".join(self._fragments) if self._fragments else ""
-
-        return f"""
-mutation{operation_name}{variable_defs} {{
-  {self._mutation_name}{mutation_args} {{
-{field_selection}
-  }}
-}}
-{fragments}
-        """.strip()
+    def build_mutation(self, pretty: bool = False) -> str:
+        """Build the complete GraphQL mutation string.
+
+        Compiled mutations are cached by structure, like queries built by
+        :class:`~shopify_partners_sdk.queries.CustomQueryBuilder`.
+
+        Args:
+            pretty: Whether to build an indented mutation for debugging
+                instead of the minified mutation sent on the wire
+
+        Returns:
+            GraphQL mutation document
+        """
+        signature = self._variable_signature()
+        key = (
+            type(self),
+            self._mutation_name,
+            self._operation_name,
+            self._fields.fingerprint() if self._fields else None,
+            signature,
+            tuple(self._fragments),
+            pretty,
+        )
+        return get_query_cache().get_or_build(
+            key,
+            lambda: build_operation(
+                "mutation",
+                self._operation_name,
+                self._mutation_name,
+                signature,
+                self._fields or _DEFAULT_MUTATION_FIELDS,
+                self._fragments,
+                pretty,
+            ),
+        )
 
     def get_result_type(self) -> type:
         """Get the expected result type (returns dict for dynamic mutations)."""
@@ -1,15 +1,25 @@
 """Pagination utilities for the Shopify Partners SDK."""
 
+from .checkpoint import (
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    PaginationCheckpoint,
+    SQLiteCheckpointStore,
+)
 from .cursor import (
     CursorManager,
     PaginationHelper,
     PaginationInfo,
 )
+from .incremental import IncrementalSync, Watermark
 from .iterator import (
     AsyncNodeIterator,
     AsyncPageIterator,
     PaginatedResult,
+    PrefetchingPageIterator,
 )
+from .sharded import ShardedPaginator, TimeWindow
 
 __all__ = [
     # Cursor management
@@ -20,4 +30,18 @@ __all__ = [
     "AsyncPageIterator",
     "AsyncNodeIterator",
     "PaginatedResult",
+    # Background prefetching
+    "PrefetchingPageIterator",
+    # Parallel time-window pagination
+    "ShardedPaginator",
+    "TimeWindow",
+    # Resumable pagination
+    "CheckpointStore",
+    "FileCheckpointStore",
+    "MemoryCheckpointStore",
+    "PaginationCheckpoint",
+    "SQLiteCheckpointStore",
+    # Incremental sync
+    "IncrementalSync",
+    "Watermark",
 ]
@@ -0,0 +1,270 @@
+"""Durable checkpoint storage for resumable pagination."""
+
+from abc import ABC, abstractmethod
+import hashlib
+import json
+import os
+from pathlib import Path
+import sqlite3
+import tempfile
+from threading import Lock
+import time
+from typing import Any, Optional, Union
+
+
+class PaginationCheckpoint:
+    """Committed pagination state for one cursor chain."""
+
+    def __init__(
+        self,
+        cursor: Optional[str] = None,
+        pages: int = 0,
+        items: int = 0,
+        has_more: bool = True,
+        updated_at: Optional[float] = None,
+    ) -> None:
+        """Initialize the checkpoint.
+
+        Args:
+            cursor: Cursor to continue after (None to start from the beginning)
+            pages: Number of pages committed so far
+            items: Number of items committed so far
+            has_more: Whether more pages were available after the cursor
+            updated_at: Unix time of the commit
+        """
+        self.cursor = cursor
+        self.pages = pages
+        self.items = items
+        self.has_more = has_more
+        self.updated_at = updated_at
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the checkpoint to a JSON-serializable dictionary."""
+        return {
+            "cursor": self.cursor,
+            "pages": self.pages,
+            "items": self.items,
+            "has_more": self.has_more,
+            "updated_at": self.updated_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "PaginationCheckpoint":
+        """Create a checkpoint from a dictionary produced by :meth:`to_dict`.
+
+        Args:
+            data: Stored checkpoint data
+
+        Returns:
+            Checkpoint instance
+        """
+        return cls(
+            cursor=data.get("cursor"),
+            pages=data.get("pages", 0),
+            items=data.get("items", 0),
+            has_more=data.get("has_more", True),
+            updated_at=data.get("updated_at"),
+        )
+
+    def __repr__(self) -> str:
+        """String representation of the checkpoint."""
+        return (
+            f"PaginationCheckpoint("
+            f"pages={self.pages}, "
+            f"items={self.items}, "
+            f"has_more={self.has_more}"
+            f")"
+        )
+
+
+class CheckpointStore(ABC):
+    """Key-value store for JSON-serializable pagination state."""
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        """Load the state stored under a key.
+
+        Args:
+            key: State key
+
+        Returns:
+            Stored state, or None if nothing is stored
+        """
+
+    @abstractmethod
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        """Durably store state under a key, replacing any previous state.
+
+        Args:
+            key: State key
+            state: JSON-serializable state
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Delete the state stored under a key, if any.
+
+        Args:
+            key: State key
+        """
+
+    def load_checkpoint(self, key: str) -> Optional[PaginationCheckpoint]:
+        """Load a pagination checkpoint.
+
+        Args:
+            key: Checkpoint key
+
+        Returns:
+            Stored checkpoint, or None if nothing is stored
+        """
+        state = self.load(key)
+        return PaginationCheckpoint.from_dict(state) if state is not None else None
+
+    def save_checkpoint(self, key: str, checkpoint: PaginationCheckpoint) -> None:
+        """Store a pagination checkpoint.
+
+        Args:
+            key: Checkpoint key
+            checkpoint: Checkpoint to store
+        """
+        checkpoint.updated_at = time.time()
+        self.save(key, checkpoint.to_dict())
+
+
+class MemoryCheckpointStore(CheckpointStore):
+    """In-process checkpoint store, mainly useful for tests."""
+
+    def __init__(self) -> None:
+        """Initialize the memory store."""
+        self._states: dict[str, str] = {}
+        self._lock = Lock()
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        """Load the state stored under a key."""
+        with self._lock:
+            raw = self._states.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        """Store state under a key."""
+        raw = json.dumps(state)
+        with self._lock:
+            self._states[key] = raw
+
+    def delete(self, key: str) -> None:
+        """Delete the state stored under a key."""
+        with self._lock:
+            self._states.pop(key, None)
+
+
+class FileCheckpointStore(CheckpointStore):
+    """Checkpoint store keeping one JSON file per key in a directory.
+
+    Files are replaced atomically, and the directory is synced after the
+    rename, so a crash mid-write leaves the previous checkpoint intact and a
+    completed save survives a power loss.
+    """
+
+    def __init__(self, directory: Union[str, Path]) -> None:
+        """Initialize the file store.
+
+        Args:
+            directory: Directory for checkpoint files (created if missing)
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Get the file path for a key."""
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+        return self._directory / f"{digest}.json"
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        """Load the state stored under a key."""
+        path = self._path(key)
+        try:
+            with path.open(encoding="utf-8") as f:
+                return json.load(f)["state"]
+        except FileNotFoundError:
+            return None
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        """Atomically store state under a key."""
+        path = self._path(key)
+        fd, tmp_name = tempfile.mkstemp(dir=self._directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "state": state}, f)
+                f.flush()
+                os.fsync(f.fileno())
+            Path(tmp_name).replace(path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._sync_directory()
+
+    def _sync_directory(self) -> None:
+        """Flush the directory entry of a renamed file to disk.
+
+        Not every platform can open a directory (Windows cannot); there the
+        rename is as durable as the OS makes it.
+        """
+        try:
+            fd = os.open(self._directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def delete(self, key: str) -> None:
+        """Delete the state stored under a key."""
+        self._path(key).unlink(missing_ok=True)
+
+
+class SQLiteCheckpointStore(CheckpointStore):
+    """Checkpoint store backed by a local SQLite database file."""
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """Initialize the SQLite store.
+
+        Args:
+            path: Database file path (created if missing)
+        """
+        self._path = str(path)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(self._path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS pagination_checkpoints ("
+                "key TEXT PRIMARY KEY, state TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> Optional[dict[str, Any]]:
+        """Load the state stored under a key."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT state FROM pagination_checkpoints WHERE key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save(self, key: str, state: dict[str, Any]) -> None:
+        """Store state under a key in a single transaction."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO pagination_checkpoints "
+                "(key, state, updated_at) VALUES (?, ?, ?)",
+                (key, json.dumps(state), time.time()),
+            )
+
+    def delete(self, key: str) -> None:
+        """Delete the state stored under a key."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM pagination_checkpoints WHERE key = ?", (key,)
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._connection.close()
@@ -1,15 +1,58 @@
 """Iterators for paginated GraphQL results."""
 
-from typing import Any, Callable, Optional, TypeVar
+import asyncio
+from collections.abc import Awaitable
+import contextlib
+import queue
+import threading
+from typing import Any, Callable, Optional, TypeVar, Union
+import weakref
 
 from shopify_partners_sdk.models.base import Connection, Node
 
+from .checkpoint import CheckpointStore, PaginationCheckpoint
+
 T = TypeVar("T", bound=Node)
 ConnectionType = TypeVar("ConnectionType", bound=Connection)
 
+# Marks the end of a read-ahead page stream
+_END_OF_PAGES = object()
+
+
+class _PrefetchFailure:
+    """Carries an exception raised by a background fetch to the consumer."""
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _end_cursor(connection: Connection) -> Optional[str]:
+    """Get the cursor to continue pagination after a connection page.
+
+    The Partners API ``PageInfo`` type has no cursor fields, so the cursor of
+    the last edge is used.
+
+    Args:
+        connection: Connection page
+
+    Returns:
+        Cursor of the last edge, or None if the page is empty
+    """
+    edges = getattr(connection, "edges", None)
+    if edges:
+        return edges[-1].cursor
+    return None
+
 
 class PageIterator:
-    """Iterator for paginating through GraphQL connections."""
+    """Iterator for paginating through GraphQL connections.
+
+    With a checkpoint store, the iterator resumes from the last committed
+    checkpoint and commits the cursor and counters for a page once the caller
+    asks for the following one (or iteration ends). A crash while a page is
+    being processed therefore re-delivers that page on restart rather than
+    skipping it.
+    """
 
     def __init__(
         self,
@@ -18,6 +61,8 @@ class PageIterator:
         page_size: int = 50,
         max_pages: Optional[int] = None,
         max_items: Optional[int] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
     ) -> None:
         """Initialize the page iterator.
 
@@ -27,18 +72,37 @@ class PageIterator:
             page_size: Number of items per page
             max_pages: Maximum number of pages to fetch
             max_items: Maximum number of items to fetch
+            checkpoint_store: Store for durable pagination state (optional)
+            checkpoint_key: Key identifying this pagination in the store
+
+        Raises:
+            ValueError: If a checkpoint store is given without a key
         """
+        if checkpoint_store is not None and not checkpoint_key:
+            raise ValueError("checkpoint_key is required with a checkpoint_store")
+
         self._fetch_func = fetch_func
         self._initial_args = initial_args.copy()
         self._page_size = page_size
         self._max_pages = max_pages
         self._max_items = max_items
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint_key = checkpoint_key
 
         # State tracking
         self._current_page = 0
         self._total_items = 0
         self._has_more = True
         self._next_cursor: Optional[str] = None
+        self._pending_checkpoint: Optional[PaginationCheckpoint] = None
+
+        if checkpoint_store is not None:
+            checkpoint = checkpoint_store.load_checkpoint(checkpoint_key)
+            if checkpoint is not None:
+                self._current_page = checkpoint.pages
+                self._total_items = checkpoint.items
+                self._has_more = checkpoint.has_more
+                self._next_cursor = checkpoint.cursor
 
     def __iter__(self) -> "PageIterator":
         """Return iterator."""
@@ -52,12 +116,41 @@ class PageIterator:
 
         Raises:
             StopIteration: When no more pages are available
+            Exception: Whatever the fetch function raised for the next page;
+                this ends the iteration, leaving the last committed
+                checkpoint in place
         """
-        if not self._has_more:
+        # The caller is back for more, so the previous page has been handled
+        self.commit()
+
+        try:
+            connection = self.fetch_page()
+        except Exception:
+            self._has_more = False
+            raise
+        if connection is None:
             raise StopIteration
+        return connection
+
+    def fetch_page(self) -> Optional[ConnectionType]:
+        """Fetch the next page without committing the previous one.
+
+        A failed fetch raises the fetch function's error and leaves the
+        iterator where it was. The checkpoint of the fetched page is left
+        pending; see :meth:`take_checkpoint`.
+
+        Returns:
+            Connection object with page data, or None when no more pages are
+            available
+
+        Raises:
+            Exception: Whatever the fetch function raised
+        """
+        if not self._has_more:
+            return None
 
         if self._max_pages and self._current_page >= self._max_pages:
-            raise StopIteration
+            return None
 
         # Build query arguments for this page
         query_args = self._initial_args.copy()
@@ -67,23 +160,61 @@ class PageIterator:
             query_args["after"] = self._next_cursor
 
         # Fetch the page
-        try:
-            connection = self._fetch_func(**query_args)
-        except Exception:
-            raise StopIteration
+        connection = self._fetch_func(**query_args)
 
         # Update state
         self._current_page += 1
         self._total_items += len(connection.edges)
         self._has_more = connection.page_info.has_next_page
-        self._next_cursor = connection.page_info.end_cursor
+        self._next_cursor = _end_cursor(connection)
 
         # Check item limit
         if self._max_items and self._total_items >= self._max_items:
             self._has_more = False
 
+        if self._checkpoint_store is not None:
+            self._pending_checkpoint = PaginationCheckpoint(
+                cursor=self._next_cursor,
+                pages=self._current_page,
+                items=self._total_items,
+                has_more=self._has_more,
+            )
         return connection
 
+    def commit(self) -> None:
+        """Persist the state after the most recently returned page.
+
+        Called automatically when the next page is requested; call it
+        directly to commit a page before asking for the next one.
+        """
+        self.save_checkpoint(self.take_checkpoint())
+
+    def take_checkpoint(self) -> Optional[PaginationCheckpoint]:
+        """Take the checkpoint of the most recently fetched page.
+
+        The checkpoint is no longer pending afterwards, so it is only saved
+        if the caller passes it to :meth:`save_checkpoint`.
+
+        Returns:
+            The pending checkpoint, or None if there is none (or no store)
+        """
+        checkpoint, self._pending_checkpoint = self._pending_checkpoint, None
+        return checkpoint
+
+    def save_checkpoint(self, checkpoint: Optional[PaginationCheckpoint]) -> None:
+        """Persist a checkpoint taken from this iterator.
+
+        Args:
+            checkpoint: Checkpoint to save (None is ignored)
+        """
+        if checkpoint is None or self._checkpoint_store is None:
+            return
+        self._checkpoint_store.save_checkpoint(self._checkpoint_key, checkpoint)
+
+    def close(self) -> None:
+        """Stop pagination; no further pages are fetched."""
+        self._has_more = False
+
     @property
     def current_page(self) -> int:
         """Get current page number (0-based)."""
@@ -100,12 +231,188 @@ class PageIterator:
         return self._has_more
 
 
+def _put_unless_stopped(
+    items: queue.Queue, item: object, stop_event: threading.Event
+) -> bool:
+    """Put an item on a prefetch queue unless the consumer has stopped.
+
+    Args:
+        items: Bounded prefetch queue
+        item: Page, failure or end marker
+        stop_event: Set when the consumer closes or is garbage collected
+
+    Returns:
+        False if the consumer stopped while waiting for space
+    """
+    while not stop_event.is_set():
+        try:
+            items.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def _prefetch_pages(
+    page_iterator: "PageIterator", items: queue.Queue, stop_event: threading.Event
+) -> None:
+    """Worker loop feeding pages of a page iterator into a prefetch queue.
+
+    Takes only the state it needs, not the prefetching iterator, so an
+    abandoned iterator can be garbage collected (which stops this loop).
+
+    Args:
+        page_iterator: Page iterator to drive
+        items: Bounded prefetch queue
+        stop_event: Set when the consumer closes or is garbage collected
+    """
+    while not stop_event.is_set():
+        try:
+            connection = page_iterator.fetch_page()
+        except Exception as e:
+            _put_unless_stopped(items, _PrefetchFailure(e), stop_event)
+            return
+        if connection is None:
+            break
+        # Committed once the caller has consumed the page
+        checkpoint = page_iterator.take_checkpoint()
+        if not _put_unless_stopped(items, (connection, checkpoint), stop_event):
+            return
+    _put_unless_stopped(items, _END_OF_PAGES, stop_event)
+
+
+class PrefetchingPageIterator:
+    """Page iterator that fetches upcoming pages on a background thread.
+
+    Wraps a :class:`PageIterator` and drives it from a worker thread that
+    keeps up to ``depth`` pages in a bounded queue, so page N+1 is downloaded
+    while page N is being consumed. Requests still go through the fetch
+    function, and therefore through the client's shared rate limiter.
+    Pages, and any error raised while fetching them, are delivered in order;
+    an error ends the iteration. Close the iterator (or use it as a context
+    manager) when abandoning it early, so the worker thread stops right away;
+    the worker holds no reference to this iterator and also stops once the
+    iterator is garbage collected.
+
+    Checkpoints of a checkpointed page iterator are committed as pages are
+    consumed, not as they are prefetched.
+    """
+
+    def __init__(self, page_iterator: PageIterator, depth: int = 1) -> None:
+        """Initialize the prefetching iterator.
+
+        Args:
+            page_iterator: Page iterator to drive in the background
+            depth: Maximum number of pages to hold ahead of the consumer
+        """
+        if depth < 1:
+            raise ValueError("depth must be at least 1")
+
+        self._page_iterator = page_iterator
+        self._pending_checkpoint: Optional[PaginationCheckpoint] = None
+        self._queue: queue.Queue[Union[tuple, _PrefetchFailure, object]] = (
+            queue.Queue(maxsize=depth)
+        )
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._finished = False
+        weakref.finalize(self, self._stop_event.set)
+
+        # Caller-side state
+        self._current_page = 0
+        self._total_items = 0
+
+    def __iter__(self) -> "PrefetchingPageIterator":
+        """Return iterator."""
+        return self
+
+    def __next__(self) -> ConnectionType:
+        """Get the next page of results.
+
+        Returns:
+            Connection object with page data
+
+        Raises:
+            StopIteration: When no more pages are available
+        """
+        self.commit()
+
+        if self._finished:
+            raise StopIteration
+
+        if self._worker is None:
+            self._worker = threading.Thread(
+                target=_prefetch_pages,
+                args=(self._page_iterator, self._queue, self._stop_event),
+                name="PageIteratorPrefetch",
+                daemon=True,
+            )
+            self._worker.start()
+
+        item = self._queue.get()
+        if item is _END_OF_PAGES:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, _PrefetchFailure):
+            self._finished = True
+            raise item.error
+
+        connection, self._pending_checkpoint = item
+        self._current_page += 1
+        self._total_items += len(connection.edges)
+        return connection
+
+    def commit(self) -> None:
+        """Persist the checkpoint of the most recently returned page, if any."""
+        checkpoint, self._pending_checkpoint = self._pending_checkpoint, None
+        self._page_iterator.save_checkpoint(checkpoint)
+
+    def close(self) -> None:
+        """Stop the background worker and discard prefetched pages."""
+        self._finished = True
+        self._stop_event.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    @property
+    def current_page(self) -> int:
+        """Get number of pages returned to the caller so far."""
+        return self._current_page
+
+    @property
+    def total_items_fetched(self) -> int:
+        """Get total number of items returned to the caller so far."""
+        return self._total_items
+
+    @property
+    def has_more_pages(self) -> bool:
+        """Check if more pages are available."""
+        if self._finished:
+            return False
+        return not self._queue.empty() or self._page_iterator.has_more_pages
+
+
 class NodeIterator:
-    """Iterator for individual nodes across paginated results."""
+    """Iterator for individual nodes across paginated results.
+
+    Close it (or use it as a context manager) when abandoning it early, to
+    stop a prefetching page iterator's worker thread.
+    """
 
     def __init__(
         self,
-        page_iterator: PageIterator,
+        page_iterator: Union[PageIterator, PrefetchingPageIterator],
     ) -> None:
         """Initialize the node iterator.
 
@@ -147,6 +454,18 @@ class NodeIterator:
         self._current_node_index += 1
         return node
 
+    def close(self) -> None:
+        """Stop the underlying page iterator."""
+        self._page_iterator.close()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
     @property
     def total_nodes_fetched(self) -> int:
         """Get total number of nodes fetched so far."""
@@ -157,6 +476,243 @@ class NodeIterator:
         )
 
 
+class AsyncPageIterator:
+    """Async iterator for paginating through GraphQL connections.
+
+    Supports ``async for``. With ``read_ahead`` greater than zero, a
+    background task keeps up to that many pages downloaded ahead of the
+    caller, so the next page is fetched while the current one is processed.
+    An error raised while fetching a page is raised to the caller in page
+    order, after the pages before it, and ends the iteration.
+
+    Example:
+        >>> async def fetch(**args):
+        ...     data = await client.connection_query('transactions', fields, **args)
+        ...     return TransactionConnection.model_validate(data['transactions'])
+        >>> async for page in AsyncPageIterator(fetch, {}, read_ahead=1):
+        ...     handle(page)
+    """
+
+    def __init__(
+        self,
+        fetch_func: Callable[..., Awaitable[ConnectionType]],
+        initial_args: dict[str, Any],
+        page_size: int = 50,
+        max_pages: Optional[int] = None,
+        max_items: Optional[int] = None,
+        read_ahead: int = 0,
+    ) -> None:
+        """Initialize the async page iterator.
+
+        Args:
+            fetch_func: Coroutine function to fetch connection pages
+            initial_args: Initial query arguments
+            page_size: Number of items per page
+            max_pages: Maximum number of pages to fetch
+            max_items: Maximum number of items to fetch
+            read_ahead: Number of pages to download ahead of the caller
+                (0 fetches each page on demand)
+        """
+        if read_ahead < 0:
+            raise ValueError("read_ahead must not be negative")
+
+        self._fetch_func = fetch_func
+        self._initial_args = initial_args.copy()
+        self._page_size = page_size
+        self._max_pages = max_pages
+        self._max_items = max_items
+        self._read_ahead = read_ahead
+
+        # Fetch-side state
+        self._pages_fetched = 0
+        self._items_fetched = 0
+        self._has_more = True
+        self._next_cursor: Optional[str] = None
+
+        # Caller-side state
+        self._current_page = 0
+        self._total_items = 0
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._producer: Optional[asyncio.Task] = None
+        self._finished = False
+
+    def __aiter__(self) -> "AsyncPageIterator":
+        """Return async iterator."""
+        return self
+
+    async def __anext__(self) -> ConnectionType:
+        """Get the next page of results.
+
+        Returns:
+            Connection object with page data
+
+        Raises:
+            StopAsyncIteration: When no more pages are available
+            Exception: Whatever the fetch function raised for the next page
+        """
+        if self._finished:
+            raise StopAsyncIteration
+
+        if self._read_ahead:
+            if self._producer is None:
+                self._queue = asyncio.Queue(maxsize=self._read_ahead)
+                self._producer = asyncio.ensure_future(self._produce())
+            connection = await self._queue.get()
+            if connection is _END_OF_PAGES:
+                self._finished = True
+                raise StopAsyncIteration
+            if isinstance(connection, _PrefetchFailure):
+                self._finished = True
+                raise connection.error
+        else:
+            try:
+                connection = await self._fetch_next_page()
+            except Exception:
+                self._finished = True
+                raise
+            if connection is None:
+                self._finished = True
+                raise StopAsyncIteration
+
+        self._current_page += 1
+        self._total_items += len(connection.edges)
+        return connection
+
+    async def _fetch_next_page(self) -> Optional[ConnectionType]:
+        """Fetch the next page in the cursor chain.
+
+        Returns:
+            Connection page, or None when pagination is finished
+
+        Raises:
+            Exception: Whatever the fetch function raised
+        """
+        if not self._has_more:
+            return None
+
+        if self._max_pages and self._pages_fetched >= self._max_pages:
+            self._has_more = False
+            return None
+
+        # Build query arguments for this page
+        query_args = self._initial_args.copy()
+        query_args["first"] = self._page_size
+
+        if self._next_cursor:
+            query_args["after"] = self._next_cursor
+
+        # Fetch the page
+        connection = await self._fetch_func(**query_args)
+
+        # Update state
+        self._pages_fetched += 1
+        self._items_fetched += len(connection.edges)
+        self._has_more = connection.page_info.has_next_page
+        self._next_cursor = _end_cursor(connection)
+
+        # Check item limit
+        if self._max_items and self._items_fetched >= self._max_items:
+            self._has_more = False
+
+        return connection
+
+    async def _produce(self) -> None:
+        """Download pages ahead of the caller until pagination finishes."""
+        while True:
+            try:
+                connection = await self._fetch_next_page()
+            except Exception as e:
+                await self._queue.put(_PrefetchFailure(e))
+                return
+            if connection is None:
+                break
+            await self._queue.put(connection)
+        await self._queue.put(_END_OF_PAGES)
+
+    async def aclose(self) -> None:
+        """Stop any read-ahead download in progress and end the iteration."""
+        self._finished = True
+        self._has_more = False
+        if self._producer is not None and not self._producer.done():
+            self._producer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._producer
+
+    @property
+    def current_page(self) -> int:
+        """Get number of pages returned to the caller so far."""
+        return self._current_page
+
+    @property
+    def total_items_fetched(self) -> int:
+        """Get total number of items returned to the caller so far."""
+        return self._total_items
+
+    @property
+    def has_more_pages(self) -> bool:
+        """Check if more pages are available."""
+        if self._finished:
+            return False
+        if self._queue is not None and not self._queue.empty():
+            return True
+        return self._has_more
+
+
+class AsyncNodeIterator:
+    """Async iterator for individual nodes across paginated results."""
+
+    def __init__(
+        self,
+        page_iterator: AsyncPageIterator,
+    ) -> None:
+        """Initialize the async node iterator.
+
+        Args:
+            page_iterator: Async page iterator to get data from
+        """
+        self._page_iterator = page_iterator
+        self._current_page_nodes: list[T] = []
+        self._current_node_index = 0
+
+    def __aiter__(self) -> "AsyncNodeIterator":
+        """Return async iterator."""
+        return self
+
+    async def __anext__(self) -> T:
+        """Get the next node.
+
+        Returns:
+            Next node from the results
+
+        Raises:
+            StopAsyncIteration: When no more nodes are available
+        """
+        # If we've exhausted current page nodes, get next page
+        while self._current_node_index >= len(self._current_page_nodes):
+            connection = await self._page_iterator.__anext__()
+            self._current_page_nodes = [edge.node for edge in connection.edges]
+            self._current_node_index = 0
+
+        # Return current node and advance index
+        node = self._current_page_nodes[self._current_node_index]
+        self._current_node_index += 1
+        return node
+
+    async def aclose(self) -> None:
+        """Stop any read-ahead download in progress."""
+        await self._page_iterator.aclose()
+
+    @property
+    def total_nodes_fetched(self) -> int:
+        """Get total number of nodes returned so far."""
+        return (
+            self._page_iterator.total_items_fetched
+            - len(self._current_page_nodes)
+            + self._current_node_index
+        )
+
+
 class PaginatedResult:
     """Container for paginated query results with iteration capabilities."""
 
@@ -167,6 +723,8 @@ class PaginatedResult:
         page_size: int = 50,
         max_pages: Optional[int] = None,
         max_items: Optional[int] = None,
+        checkpoint_store: Optional[CheckpointStore] = None,
+        checkpoint_key: Optional[str] = None,
     ) -> None:
         """Initialize paginated result.
 
@@ -176,34 +734,55 @@ class PaginatedResult:
             page_size: Number of items per page
             max_pages: Maximum number of pages to fetch
             max_items: Maximum number of items to fetch
+            checkpoint_store: Store for durable pagination state, so an
+                interrupted pagination resumes from its last committed page
+            checkpoint_key: Key identifying this pagination in the store
         """
         self._fetch_func = fetch_func
         self._initial_args = initial_args
         self._page_size = page_size
         self._max_pages = max_pages
         self._max_items = max_items
+        self._checkpoint_store = checkpoint_store
+        self._checkpoint_key = checkpoint_key
 
-    def pages(self) -> PageIterator:
+    def pages(
+        self, prefetch: int = 0
+    ) -> Union[PageIterator, PrefetchingPageIterator]:
         """Get iterator for pages.
 
+        Args:
+            prefetch: Number of pages to fetch ahead on a background thread
+                (0 fetches each page on demand)
+
         Returns:
             Iterator yielding Connection objects
         """
-        return PageIterator(
+        page_iterator = PageIterator(
             self._fetch_func,
             self._initial_args,
             self._page_size,
             self._max_pages,
             self._max_items,
+            self._checkpoint_store,
+            self._checkpoint_key,
         )
+        if prefetch:
+            return PrefetchingPageIterator(page_iterator, prefetch)
+        return page_iterator
 
-    def nodes(self) -> NodeIterator:
+    def nodes(self, prefetch: int = 0) -> NodeIterator:
         """Get iterator for individual nodes.
 
+        Args:
+            prefetch: Number of pages to fetch ahead on a background thread
+                (0 fetches each page on demand)
+
         Returns:
-            Iterator yielding individual node objects
+            Iterator yielding individual node objects; with ``prefetch``,
+            close it (or use it as a context manager) when stopping early
         """
-        page_iterator = self.pages()
+        page_iterator = self.pages(prefetch)
         return NodeIterator(page_iterator)
 
     def first_page(self) -> ConnectionType:
@@ -271,6 +850,8 @@ class PaginatedResult:
             size,
             self._max_pages,
             self._max_items,
+            self._checkpoint_store,
+            self._checkpoint_key,
         )
 
     def limit(self, max_items: int) -> "PaginatedResult":
@@ -288,6 +869,8 @@ class PaginatedResult:
             self._page_size,
             self._max_pages,
             max_items,
+            self._checkpoint_store,
+            self._checkpoint_key,
         )
 
     def max_pages(self, pages: int) -> "PaginatedResult":
@@ -305,4 +888,11 @@ class PaginatedResult:
             self._page_size,
             pages,
             self._max_items,
+            self._checkpoint_store,
+            self._checkpoint_key,
         )
+
+    def reset_checkpoint(self) -> None:
+        """Discard the stored checkpoint so pagination starts from the beginning."""
+        if self._checkpoint_store is not None and self._checkpoint_key:
+            self._checkpoint_store.delete(self._checkpoint_key)
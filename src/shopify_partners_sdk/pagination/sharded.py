@@ -0,0 +1,364 @@
+"""Time-window sharded pagination for date-filterable connections."""
+
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+import queue
+import threading
+from typing import Any, Callable, Optional, Union
+
+from shopify_partners_sdk.exceptions.validation import InvalidDateRangeError
+from shopify_partners_sdk.models.base import Connection
+
+from .iterator import _END_OF_PAGES, _end_cursor, _PrefetchFailure
+
+DateLike = Union[datetime, str]
+
+
+def _parse_datetime(value: DateLike) -> datetime:
+    """Parse an ISO-8601 string or datetime into an aware UTC datetime."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def _format_datetime(value: datetime) -> str:
+    """Format a datetime as an ISO-8601 UTC string for query variables."""
+    return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _node_value(node: Any, attribute: str, key: str) -> Any:
+    """Read a value from a model node (attribute) or a raw dict node (key)."""
+    if isinstance(node, dict):
+        return node.get(key)
+    return getattr(node, attribute, None)
+
+
+class TimeWindow:
+    """A closed date range ``[start, end]`` covered by one cursor chain."""
+
+    def __init__(self, start: datetime, end: datetime, depth: int = 0) -> None:
+        """Initialize the time window.
+
+        Args:
+            start: Window start (inclusive)
+            end: Window end (inclusive)
+            depth: How many times this window's range has been re-split
+        """
+        self.start = start
+        self.end = end
+        self.depth = depth
+
+    @property
+    def span(self) -> timedelta:
+        """Get the length of the window."""
+        return self.end - self.start
+
+    def split(self, parts: int) -> list["TimeWindow"]:
+        """Split the window into equal, contiguous sub-windows.
+
+        Args:
+            parts: Number of sub-windows
+
+        Returns:
+            Sub-windows in chronological order
+        """
+        step = self.span / parts
+        bounds = [self.start + step * i for i in range(parts)] + [self.end]
+        return [
+            TimeWindow(bounds[i], bounds[i + 1], self.depth + 1) for i in range(parts)
+        ]
+
+    def __repr__(self) -> str:
+        """String representation of the time window."""
+        return (
+            f"TimeWindow(start={_format_datetime(self.start)}, "
+            f"end={_format_datetime(self.end)})"
+        )
+
+
+class _SplitWindow:
+    """Result of a window probe that turned out too dense to fetch serially."""
+
+    def __init__(self, windows: list[TimeWindow]) -> None:
+        self.windows = windows
+
+
+class _WindowStream:
+    """Pages of one window, passed from its fetch thread to the consumer."""
+
+    def __init__(self, window: TimeWindow, max_pages: int) -> None:
+        self.window = window
+        self.pages: queue.Queue[Any] = queue.Queue(maxsize=max_pages)
+        self.thread: Optional[threading.Thread] = None
+
+
+class ShardedPaginator:
+    """Paginate a date-filterable connection over parallel time windows.
+
+    A cursor chain is strictly sequential, so a long history is split into
+    independent date windows (``createdAtMin``/``createdAtMax``), each with
+    its own cursor chain. Up to ``max_workers`` windows are fetched
+    concurrently on background threads; every request still goes through the
+    fetch function and therefore the client's shared rate limiter.
+
+    Windows are yielded in chronological order, and the nodes of a window in
+    the order the connection returns them, so results are in ``createdAt``
+    order when the connection is sorted by ``createdAt``. Each window streams
+    its pages through a queue of at most ``window_buffer`` pages, so memory
+    stays bounded however large a window is. Fetching stops between pages
+    once iteration ends, is abandoned or fails.
+
+    With ``adaptive`` enabled, a window whose first page already reports
+    more pages is split further (down to ``min_window``), so dense periods
+    are spread over more workers. The probe page of a split window is
+    discarded and its sub-windows are fetched from the start.
+
+    Example:
+        >>> def fetch(**args):
+        ...     data = client.connection_query('transactions', fields, **args)
+        ...     return TransactionConnection.model_validate(data['transactions'])
+        >>> paginator = ShardedPaginator(
+        ...     fetch, {}, start='2022-01-01T00:00:00Z',
+        ...     end='2025-01-01T00:00:00Z', shards=8,
+        ... )
+        >>> for transaction in paginator.nodes():
+        ...     export(transaction)
+    """
+
+    def __init__(
+        self,
+        fetch_func: Callable[..., Connection],
+        initial_args: dict[str, Any],
+        start: DateLike,
+        end: DateLike,
+        shards: int = 4,
+        page_size: int = 50,
+        max_workers: Optional[int] = None,
+        adaptive: bool = True,
+        min_window: timedelta = timedelta(hours=1),
+        max_split_depth: int = 4,
+        window_buffer: int = 2,
+        min_arg: str = "createdAtMin",
+        max_arg: str = "createdAtMax",
+        timestamp_attribute: str = "created_at",
+        timestamp_key: str = "createdAt",
+    ) -> None:
+        """Initialize the sharded paginator.
+
+        Args:
+            fetch_func: Function to fetch connection pages
+            initial_args: Query arguments shared by every window
+            start: Start of the date range (inclusive)
+            end: End of the date range (inclusive)
+            shards: Number of initial windows
+            page_size: Number of items per page
+            max_workers: Maximum concurrent windows (defaults to ``shards``)
+            adaptive: Whether to re-split windows that turn out to be dense
+            min_window: Smallest window produced by adaptive splitting
+            max_split_depth: Maximum number of times a window is re-split
+            window_buffer: Maximum number of fetched pages held per window
+                ahead of the consumer
+            min_arg: Query argument for the window start
+            max_arg: Query argument for the window end
+            timestamp_attribute: Node attribute holding the ordering timestamp
+            timestamp_key: Raw dict key holding the ordering timestamp
+
+        Raises:
+            InvalidDateRangeError: If start is after end
+            ValueError: If shards or window_buffer is not positive
+        """
+        self._start = _parse_datetime(start)
+        self._end = _parse_datetime(end)
+        if self._start > self._end:
+            raise InvalidDateRangeError(str(start), str(end))
+        if shards < 1:
+            raise ValueError("shards must be positive")
+        if window_buffer < 1:
+            raise ValueError("window_buffer must be positive")
+
+        self._fetch_func = fetch_func
+        self._initial_args = initial_args.copy()
+        self._shards = shards
+        self._page_size = page_size
+        self._max_workers = max_workers or shards
+        self._adaptive = adaptive
+        self._min_window = min_window
+        self._max_split_depth = max_split_depth
+        self._window_buffer = window_buffer
+        self._min_arg = min_arg
+        self._max_arg = max_arg
+        self._timestamp_attribute = timestamp_attribute
+        self._timestamp_key = timestamp_key
+
+        self._pages_fetched = 0
+        self._windows_split = 0
+
+    @property
+    def pages_fetched(self) -> int:
+        """Get the number of pages fetched so far, including split probes."""
+        return self._pages_fetched
+
+    @property
+    def windows_split(self) -> int:
+        """Get the number of windows that were re-split as too dense."""
+        return self._windows_split
+
+    def windows(self) -> list[TimeWindow]:
+        """Get the initial windows covering the date range.
+
+        Returns:
+            Windows in chronological order
+        """
+        return TimeWindow(self._start, self._end).split(self._shards)
+
+    def _sort_key(self, node: Any) -> datetime:
+        """Get the ordering timestamp of a node."""
+        value = _node_value(node, self._timestamp_attribute, self._timestamp_key)
+        if value is None:
+            return self._start
+        return _parse_datetime(value)
+
+    def _can_split(self, window: TimeWindow) -> bool:
+        """Check whether adaptive splitting may split a window further."""
+        return (
+            self._adaptive
+            and window.depth < self._max_split_depth
+            and window.span >= self._min_window * 2
+        )
+
+    def _fetch_window(self, stream: _WindowStream, stop: threading.Event) -> None:
+        """Fetch the pages of a window into its stream.
+
+        Puts each page's nodes, then an end marker. A probe page that shows
+        the window is too dense is replaced by the sub-windows to fetch
+        instead, and a fetch error by a failure marker.
+
+        Args:
+            stream: Stream of the window to fetch
+            stop: Event set when the consumer no longer wants pages
+        """
+        window = stream.window
+        args = self._initial_args.copy()
+        args[self._min_arg] = _format_datetime(window.start)
+        args[self._max_arg] = _format_datetime(window.end)
+        args["first"] = self._page_size
+
+        cursor: Optional[str] = None
+        try:
+            while not stop.is_set():
+                if cursor:
+                    args["after"] = cursor
+                connection = self._fetch_func(**args)
+                self._pages_fetched += 1
+
+                has_next = connection.page_info.has_next_page
+                if has_next and cursor is None and self._can_split(window):
+                    self._windows_split += 1
+                    self._put(stream, _SplitWindow(window.split(2)), stop)
+                    return
+
+                nodes = [edge.node for edge in connection.edges]
+                if not self._put(stream, nodes, stop):
+                    return
+                cursor = _end_cursor(connection)
+                if not has_next or cursor is None:
+                    break
+        except Exception as e:
+            self._put(stream, _PrefetchFailure(e), stop)
+            return
+        self._put(stream, _END_OF_PAGES, stop)
+
+    @staticmethod
+    def _put(stream: _WindowStream, item: Any, stop: threading.Event) -> bool:
+        """Put an item on a window stream unless the consumer stopped.
+
+        Returns:
+            False if the consumer stopped while waiting for space
+        """
+        while not stop.is_set():
+            try:
+                stream.pages.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _start_windows(self, streams: list[_WindowStream], stop: threading.Event) -> None:
+        """Start the fetch threads of the first ``max_workers`` windows."""
+        for stream in streams[: self._max_workers]:
+            if stream.thread is None:
+                stream.thread = threading.Thread(
+                    target=self._fetch_window,
+                    args=(stream, stop),
+                    name="ShardedPaginatorWindow",
+                    daemon=True,
+                )
+                stream.thread.start()
+
+    def nodes(self) -> Iterator[Any]:
+        """Iterate over all nodes in the date range in window order.
+
+        Windows are fetched concurrently, but a window's nodes are yielded
+        only once all earlier windows have been yielded. Nodes on a shared
+        window boundary are yielded once.
+
+        Yields:
+            Nodes, window by window
+
+        Raises:
+            Exception: Any error raised by the fetch function
+        """
+        stop = threading.Event()
+        streams = [
+            _WindowStream(window, self._window_buffer) for window in self.windows()
+        ]
+        # Windows share their bounds, so nodes on the end bound of a window
+        # are skipped when the next window returns them again
+        boundary: Optional[datetime] = None
+        boundary_ids: set[Any] = set()
+        end_ids: set[Any] = set()
+
+        try:
+            while streams:
+                # Threads only run for the leading windows, so the head window
+                # is always being fetched even while later ones wait for space
+                self._start_windows(streams, stop)
+                head = streams[0]
+                item = head.pages.get()
+
+                if isinstance(item, _SplitWindow):
+                    streams[0:1] = [
+                        _WindowStream(window, self._window_buffer)
+                        for window in item.windows
+                    ]
+                    continue
+                if isinstance(item, _PrefetchFailure):
+                    raise item.error
+                if item is _END_OF_PAGES:
+                    streams.pop(0)
+                    boundary, boundary_ids, end_ids = head.window.end, end_ids, set()
+                    continue
+
+                for node in item:
+                    node_id = _node_value(node, "id", "id")
+                    timestamp = self._sort_key(node)
+                    if timestamp == boundary and node_id in boundary_ids:
+                        continue
+                    if timestamp == head.window.end:
+                        end_ids.add(node_id)
+                    yield node
+        finally:
+            stop.set()
+
+    def all_nodes(self) -> list[Any]:
+        """Fetch all nodes in the date range.
+
+        Returns:
+            List of all nodes in timestamp order
+
+        Warning:
+            This can fetch a large amount of data. Use with caution.
+        """
+        return list(self.nodes())
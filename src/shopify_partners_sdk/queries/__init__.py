@@ -1,12 +1,15 @@
 """Modern field-based query system for the Shopify Partners SDK."""
 
 from .base import QueryResult
+from .batch import QueryBatch
+from .cache import CompiledQueryCache, get_query_cache
+from .cost import estimate_cost, estimate_selection_cost, max_page_size_within
 from .custom_builders import (
     CustomConnectionQueryBuilder,
     CustomFilterableQueryBuilder,
     CustomQueryBuilder,
 )
-from .fields import CommonFields, FieldSelector
+from .fields import CommonFields, FieldSelector, FrozenFieldSelector
 
 __all__ = [
     # Core result container
@@ -17,5 +20,15 @@ __all__ = [
     "CustomFilterableQueryBuilder",
     # Field selection system
     "FieldSelector",
+    "FrozenFieldSelector",
     "CommonFields",
+    # Compiled query cache
+    "CompiledQueryCache",
+    "get_query_cache",
+    # Query batching
+    "QueryBatch",
+    # Cost estimation
+    "estimate_cost",
+    "estimate_selection_cost",
+    "max_page_size_within",
 ]
@@ -0,0 +1,194 @@
+"""Batching of several root queries into one aliased GraphQL document."""
+
+from collections.abc import Iterable
+from typing import Any, Optional
+
+from shopify_partners_sdk.config import DEFAULT_MAX_BATCH_SIZE
+
+from .cache import get_query_cache
+from .cost import estimate_cost
+from .custom_builders import CustomQueryBuilder
+from .document import build_batch_operation
+
+BATCH_OPERATION_NAME = "Batch"
+
+
+class QueryBatch:
+    """Several query builders sent as one request with aliased root fields.
+
+    Each builder becomes a root field aliased ``a0``, ``a1``, ... and its
+    variables are renamed after the alias (``a0: app(id: $a0_id)``), so 50
+    ``app`` lookups cost one request, one rate limit token and one round trip
+    per chunk instead of 50. Builders are split into chunks that stay under a
+    size and an estimated cost ceiling.
+
+    Example:
+        >>> batch = QueryBatch()
+        >>> for app_id in app_ids:
+        ...     batch.add(client.field_based.query('app', fields, id=app_id))
+        >>> apps = client.field_based.execute_batch(batch)
+    """
+
+    def __init__(self, builders: Optional[Iterable[CustomQueryBuilder]] = None) -> None:
+        """Initialize the batch.
+
+        Args:
+            builders: Query builders to add
+        """
+        self._builders: list[CustomQueryBuilder] = []
+        for builder in builders or ():
+            self.add(builder)
+
+    @property
+    def builders(self) -> list[CustomQueryBuilder]:
+        """Get the query builders in the batch, in order."""
+        return self._builders.copy()
+
+    def add(self, builder: CustomQueryBuilder) -> "QueryBatch":
+        """Add a query builder to the batch.
+
+        Args:
+            builder: Query builder to add
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            TypeError: If the builder is not a query builder
+        """
+        if not isinstance(builder, CustomQueryBuilder):
+            raise TypeError(
+                f"Only query builders can be batched, got {type(builder).__name__}"
+            )
+        self._builders.append(builder)
+        return self
+
+    def chunks(
+        self,
+        max_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_cost: Optional[int] = None,
+    ) -> list[list[CustomQueryBuilder]]:
+        """Split the batch into chunks sent as one request each.
+
+        Builders are kept in order and added to the current chunk while it
+        has fewer than ``max_size`` builders and its total estimated cost
+        stays within ``max_cost``. A builder over ``max_cost`` on its own gets
+        a chunk to itself.
+
+        Args:
+            max_size: Maximum number of builders per chunk
+            max_cost: Maximum total estimated cost per chunk (None for no limit)
+
+        Returns:
+            Chunks of builders
+
+        Raises:
+            ValueError: If max_size is not positive
+        """
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+
+        chunks: list[list[CustomQueryBuilder]] = []
+        chunk: list[CustomQueryBuilder] = []
+        chunk_cost = 0
+        for builder in self._builders:
+            cost = estimate_cost(builder) if max_cost is not None else 0
+            if chunk and (
+                len(chunk) >= max_size
+                or (max_cost is not None and chunk_cost + cost > max_cost)
+            ):
+                chunks.append(chunk)
+                chunk, chunk_cost = [], 0
+            chunk.append(builder)
+            chunk_cost += cost
+        if chunk:
+            chunks.append(chunk)
+        return chunks
+
+    @staticmethod
+    def alias(index: int) -> str:
+        """Get the alias of the root field of the builder at ``index``."""
+        return f"a{index}"
+
+    @classmethod
+    def build_query(
+        cls, builders: list[CustomQueryBuilder], pretty: bool = False
+    ) -> tuple[str, dict[str, Any]]:
+        """Build the document and variables of one chunk.
+
+        Documents are cached by the structure of their builders, like single
+        queries, so a chunk of the same lookups with new values reuses the
+        cached text.
+
+        Args:
+            builders: Builders of the chunk
+            pretty: Whether to build an indented document for debugging
+
+        Returns:
+            GraphQL document and its namespaced variables
+        """
+        roots = []
+        fragments: list[str] = []
+        variables: dict[str, Any] = {}
+        for index, builder in enumerate(builders):
+            alias = cls.alias(index)
+            signature = builder._variable_signature()
+            roots.append(
+                (
+                    alias,
+                    builder.get_query_name(),
+                    signature,
+                    builder._fields or builder._default_fields(),
+                )
+            )
+            for fragment in builder._fragments:
+                if fragment not in fragments:
+                    fragments.append(fragment)
+            for name, value in builder.variables.items():
+                variables[f"{alias}_{name}"] = value
+
+        key = (
+            cls,
+            tuple(
+                (
+                    type(builder),
+                    query_name,
+                    fields.fingerprint() if fields is not None else None,
+                    signature,
+                )
+                for builder, (_, query_name, signature, fields) in zip(builders, roots)
+            ),
+            tuple(fragments),
+            pretty,
+        )
+        query = get_query_cache().get_or_build(
+            key,
+            lambda: build_batch_operation(
+                "query", BATCH_OPERATION_NAME, roots, fragments, pretty
+            ),
+        )
+        return query, variables
+
+    @classmethod
+    def split_response(
+        cls, builders: list[CustomQueryBuilder], data: Optional[dict[str, Any]]
+    ) -> list[Any]:
+        """Split the response data of one chunk back per builder.
+
+        Args:
+            builders: Builders of the chunk
+            data: ``data`` of the chunk's response
+
+        Returns:
+            Value of each builder's root field, in order
+        """
+        data = data or {}
+        return [data.get(cls.alias(index)) for index in range(len(builders))]
+
+    def __len__(self) -> int:
+        """Get the number of builders in the batch."""
+        return len(self._builders)
+
+    def __repr__(self) -> str:
+        """String representation of the batch."""
+        return f"QueryBatch(size={len(self._builders)})"
@@ -0,0 +1,111 @@
+"""Bounded LRU cache of compiled GraphQL documents."""
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import Lock
+from typing import Any, Callable
+
+from shopify_partners_sdk.config import DEFAULT_QUERY_CACHE_SIZE
+
+
+class CompiledQueryCache:
+    """Thread-safe LRU cache mapping query structure keys to GraphQL text.
+
+    Builders key documents on their structural fingerprint (root field,
+    field selection, variable names and types), so calls with the same shape
+    but different variable values reuse the compiled string.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_QUERY_CACHE_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of documents kept (0 disables caching)
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """Get the maximum number of cached documents."""
+        return self._maxsize
+
+    def get_or_build(self, key: Hashable, build: Callable[[], str]) -> str:
+        """Get a compiled document, building and caching it on a miss.
+
+        Args:
+            key: Structural key of the document
+            build: Function compiling the document
+
+        Returns:
+            Compiled GraphQL document
+        """
+        with self._lock:
+            document = self._entries.get(key)
+            if document is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return document
+            self._misses += 1
+
+        document = build()
+
+        if self._maxsize:
+            with self._lock:
+                self._entries[key] = document
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        return document
+
+    def resize(self, maxsize: int) -> None:
+        """Change the cache size, evicting least recently used entries.
+
+        Args:
+            maxsize: New maximum number of documents (0 disables caching)
+        """
+        if maxsize < 0:
+            raise ValueError("maxsize must not be negative")
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached documents and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def __len__(self) -> int:
+        """Get the number of cached documents."""
+        return len(self._entries)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics
+        """
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self._maxsize,
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits / lookups) * 100 if lookups else 0.0,
+        }
+
+
+_query_cache = CompiledQueryCache()
+
+
+def get_query_cache() -> CompiledQueryCache:
+    """Get the process-wide compiled query cache used by the builders."""
+    return _query_cache
@@ -0,0 +1,206 @@
+"""Offline query cost estimation for field-selected queries."""
+
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from shopify_partners_sdk.config import DEFAULT_PAGE_SIZE
+from shopify_partners_sdk.schema.index import named_type
+
+from .fields import FieldSelector
+
+if TYPE_CHECKING:
+    from shopify_partners_sdk.schema import SchemaIndex
+
+    from .custom_builders import CustomQueryBuilder
+
+# Cost model: scalars are free, every object costs 1, and a connection
+# costs 2 plus its page size times the cost of one node (the node object
+# itself plus its nested selections).
+OBJECT_COST = 1
+CONNECTION_COST = 2
+
+_INLINE_FRAGMENT_PREFIX = "... on "
+
+
+def _page_size(arguments: dict[str, Any], default_page_size: int) -> int:
+    """Get the number of nodes a connection returns per page."""
+    size = arguments.get("first") or arguments.get("last")
+    return size if isinstance(size, int) and size > 0 else default_page_size
+
+
+def _field_type(
+    schema: Optional["SchemaIndex"], parent_type: Optional[str], field_name: str
+) -> Optional[str]:
+    """Get the named type of a field from the schema, if known."""
+    if schema is None or parent_type is None:
+        return None
+    type_ref = schema.get_field_type(parent_type, field_name)
+    return named_type(type_ref) if type_ref else None
+
+
+def _is_connection(selector: FieldSelector, type_name: Optional[str]) -> bool:
+    """Check whether a selection is on a connection field."""
+    if type_name is not None:
+        return type_name.endswith("Connection")
+    return "edges" in selector._fields or "nodes" in selector._fields
+
+
+def _node_selection(
+    selector: FieldSelector,
+    type_name: Optional[str],
+    schema: Optional["SchemaIndex"],
+) -> tuple[Optional[FieldSelector], Optional[str]]:
+    """Get the node selection of a connection selection and its type."""
+    edges = selector._fields.get("edges")
+    if isinstance(edges, FieldSelector):
+        edge_type = _field_type(schema, type_name, "edges")
+        node = edges._fields.get("node")
+        if isinstance(node, FieldSelector):
+            return node, _field_type(schema, edge_type, "node")
+    nodes = selector._fields.get("nodes")
+    if isinstance(nodes, FieldSelector):
+        return nodes, _field_type(schema, type_name, "nodes")
+    return None, None
+
+
+def _field_cost(
+    selector: FieldSelector,
+    type_name: Optional[str],
+    arguments: dict[str, Any],
+    schema: Optional["SchemaIndex"],
+    default_page_size: int,
+) -> int:
+    """Get the cost of one object or connection field and its selections."""
+    if _is_connection(selector, type_name):
+        node, node_type = _node_selection(selector, type_name, schema)
+        node_cost = OBJECT_COST
+        if node is not None:
+            node_cost += _selection_cost(node, node_type, schema, default_page_size)
+        return CONNECTION_COST + _page_size(arguments, default_page_size) * node_cost
+    return OBJECT_COST + _selection_cost(selector, type_name, schema, default_page_size)
+
+
+def _selection_cost(
+    selector: FieldSelector,
+    type_name: Optional[str],
+    schema: Optional["SchemaIndex"],
+    default_page_size: int,
+) -> int:
+    """Get the cost of the nested selections of an object."""
+    total = 0
+    for field_name, field_value in selector._fields.items():
+        if not isinstance(field_value, FieldSelector):
+            continue
+        if field_name.startswith(_INLINE_FRAGMENT_PREFIX):
+            # Only one fragment applies per object; count the fragment as if
+            # every object matched it, which over-estimates safely
+            condition = field_name[len(_INLINE_FRAGMENT_PREFIX) :]
+            total += _selection_cost(field_value, condition, schema, default_page_size)
+            continue
+        arguments = getattr(field_value, "_connection_args", None) or {}
+        total += _field_cost(
+            field_value,
+            _field_type(schema, type_name, field_name),
+            arguments,
+            schema,
+            default_page_size,
+        )
+    return total
+
+
+def estimate_selection_cost(
+    fields: Union[FieldSelector, None],
+    type_name: Optional[str] = None,
+    schema: Optional["SchemaIndex"] = None,
+    default_page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Estimate the cost of a field selection on an object.
+
+    Args:
+        fields: Field selection
+        type_name: GraphQL type the selection is made on (enables schema
+            lookups for connection detection)
+        schema: Schema index used to recognize connection fields
+        default_page_size: Page size assumed for connections without
+            ``first``/``last``
+
+    Returns:
+        Estimated cost
+    """
+    if fields is None:
+        return 0
+    return _selection_cost(fields, type_name, schema, default_page_size)
+
+
+def estimate_cost(
+    builder: "CustomQueryBuilder",
+    schema: Optional["SchemaIndex"] = None,
+    default_page_size: int = DEFAULT_PAGE_SIZE,
+) -> int:
+    """Estimate the cost of a query builder before it is sent.
+
+    Every object field costs 1, scalars are free, and a connection costs 2
+    plus its ``first``/``last`` page size times the cost of one node. So a
+    nested connection multiplies by the page sizes of all connections above
+    it. Connections are recognized through the schema index when one is
+    available (the builder's own index is used by default), and by their
+    ``edges``/``nodes`` selection otherwise.
+
+    Args:
+        builder: Query builder to estimate
+        schema: Schema index (defaults to the builder's schema index)
+        default_page_size: Page size assumed for connections without
+            ``first``/``last``
+
+    Returns:
+        Estimated cost
+
+    Example:
+        >>> events = FieldSelector().add_field('type')
+        >>> fields = FieldSelector().add_connection_field('events', events, first=100)
+        >>> estimate_cost(client.field_based.query('app', fields, id=app_id))
+        103
+    """
+    schema = schema if schema is not None else builder._schema
+    root_type = schema.query_type if schema is not None else None
+    fields = builder._fields
+    if fields is None:
+        # Builders without fields select the default connection fields
+        fields = builder._default_fields()
+    if fields is None:
+        return OBJECT_COST
+    return _field_cost(
+        fields,
+        _field_type(schema, root_type, builder.get_query_name()),
+        builder._variables,
+        schema,
+        default_page_size,
+    )
+
+
+def max_page_size_within(
+    builder: "CustomQueryBuilder",
+    budget: int,
+    schema: Optional["SchemaIndex"] = None,
+    default_page_size: int = DEFAULT_PAGE_SIZE,
+) -> Optional[int]:
+    """Get the largest root page size that keeps a query within a budget.
+
+    Cost is linear in the root connection's ``first``, so the page size
+    follows from the cost of a single node.
+
+    Args:
+        builder: Query builder on a root connection
+        budget: Maximum allowed cost
+        schema: Schema index (defaults to the builder's schema index)
+        default_page_size: Page size assumed for nested connections
+
+    Returns:
+        Largest page size within the budget, or None if even one node per
+        page exceeds it
+    """
+    single = builder.copy().add_variable("first", 1)
+    node_cost = estimate_cost(single, schema, default_page_size) - CONNECTION_COST
+    if node_cost <= 0:
+        return None
+    page_size = (budget - CONNECTION_COST) // node_cost
+    return page_size if page_size >= 1 else None
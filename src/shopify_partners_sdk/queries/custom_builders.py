@@ -1,10 +1,26 @@
 """Custom GraphQL query builders with field selection."""
 
-from typing import Any, Optional
+import copy
+from typing import TYPE_CHECKING, Any, Optional
 
 from shopify_partners_sdk.models.enums import AppEventType, TransactionType
 
-from .fields import FieldSelector
+from .cache import get_query_cache
+from .document import build_operation
+from .fields import CommonFields, FieldSelector
+
+if TYPE_CHECKING:
+    from shopify_partners_sdk.schema import SchemaIndex
+
+_DEFAULT_CONNECTION_FIELDS = (
+    FieldSelector()
+    .add_nested_field(
+        "edges",
+        FieldSelector(["cursor"]).add_nested_field("node", FieldSelector(["id"])),
+    )
+    .add_nested_field("pageInfo", CommonFields.page_info(frozen=True))
+    .freeze()
+)
 
 
 class CustomQueryBuilder:
@@ -15,6 +31,7 @@ class CustomQueryBuilder:
         query_name: str,
         fields: Optional[FieldSelector] = None,
         operation_name: Optional[str] = None,
+        schema: Optional["SchemaIndex"] = None,
     ) -> None:
         """Initialize custom query builder.
 
@@ -22,10 +39,13 @@ class CustomQueryBuilder:
             query_name: The root query field name (e.g., 'apps', 'transactions')
             fields: Field selector for the query
             operation_name: Optional GraphQL operation name
+            schema: Schema index used to type variables (inferred from the
+                Python values when not given)
         """
         self._query_name = query_name
         self._fields = fields
         self._operation_name = operation_name
+        self._schema = schema
         self._variables: dict[str, Any] = {}
         self._fragments: list[str] = []
 
@@ -86,53 +106,105 @@ class CustomQueryBuilder:
         self._operation_name = name
         return self
 
+    def with_schema(self, schema: Optional["SchemaIndex"]) -> "CustomQueryBuilder":
+        """Set the schema index used to type variables.
+
+        Args:
+            schema: Schema index (None to infer types from the Python values)
+
+        Returns:
+            Self for method chaining
+        """
+        self._schema = schema
+        return self
+
     def get_query_name(self) -> str:
         """Get the root query field name."""
         return self._query_name
 
-    def build_query(self) -> str:
-        """Build the complete GraphQL query string."""
-        # Build variable definitions
-        variable_defs = self._build_variable_definitions()
-
-        # Build operation name
-        operation_name = f" {self._operation_name}" if self._operation_name else ""
-
-        # Build field selection
-        field_selection = ""
-        if self._fields:
-            field_selection = self._fields.build(2)
-        else:
-            field_selection = "  # No fields specified"
-
-        # Build query arguments
-        query_args = ""
-        if self._variables:
-            args = [f"{name}: ${name}" for name in self._variables]
-            query_args = f"({', '.join(args)})"
-
-        # Build fragments
-        fragments = "\n".join(self._fragments) if self._fragments else ""
-
-        return f"""
-query{operation_name}{variable_defs} {{
-  {self._query_name}{query_args} {{
-{field_selection}
-  }}
-}}
-{fragments}
-        """.strip()
-
-    def _build_variable_definitions(self) -> str:
+    def copy(self) -> "CustomQueryBuilder":
+        """Create a copy of this builder with its own variables.
+
+        The field selection and schema index are shared with the copy.
+
+        Returns:
+            New builder of the same type
+        """
+        clone = copy.copy(self)
+        clone._variables = self._variables.copy()
+        clone._fragments = self._fragments.copy()
+        return clone
+
+    def build_query(self, pretty: bool = False) -> str:
+        """Build the complete GraphQL query string.
+
+        Compiled queries are cached by structure (root field, field selection,
+        variable names and types), so rebuilding a query with new variable
+        values reuses the cached text.
+
+        Args:
+            pretty: Whether to build an indented query for debugging instead
+                of the minified query sent on the wire
+
+        Returns:
+            GraphQL query document
+        """
+        signature = self._variable_signature()
+        key = (
+            type(self),
+            self._query_name,
+            self._operation_name,
+            self._fields.fingerprint() if self._fields else None,
+            signature,
+            tuple(self._fragments),
+            pretty,
+        )
+        return get_query_cache().get_or_build(
+            key,
+            lambda: build_operation(
+                "query",
+                self._operation_name,
+                self._query_name,
+                signature,
+                self._fields or self._default_fields(),
+                self._fragments,
+                pretty,
+            ),
+        )
+
+    def _default_fields(self) -> Optional[FieldSelector]:
+        """Get the field selection used when no fields are specified."""
+        return None
+
+    def _variable_signature(self) -> tuple[tuple[str, str], ...]:
+        """Get the names and GraphQL types of the current variables.
+
+        Types come from the root field's argument definitions when a schema
+        index is set, and are inferred from the Python values otherwise.
+
+        Raises:
+            GraphQLValidationError: If the schema has no such root field or
+                argument
+        """
+        if self._schema is not None:
+            return self._schema.resolve_root_arguments(
+                "query", self._query_name, self._variables
+            )
+        return tuple(
+            (name, self._infer_variable_type(value, name))
+            for name, value in self._variables.items()
+        )
+
+    def _build_variable_definitions(
+        self, signature: Optional[tuple[tuple[str, str], ...]] = None
+    ) -> str:
         """Build GraphQL variable definitions from current variables."""
-        if not self._variables:
+        if signature is None:
+            signature = self._variable_signature()
+        if not signature:
             return ""
 
-        definitions = []
-        for name, value in self._variables.items():
-            var_type = self._infer_variable_type(value, name)
-            definitions.append(f"${name}: {var_type}")
-
+        definitions = [f"${name}: {var_type}" for name, var_type in signature]
         return "(" + ", ".join(definitions) + ")"
 
     def _infer_variable_type(self, value: Any, variable_name: str = "") -> str:
@@ -181,6 +253,7 @@ class CustomConnectionQueryBuilder(CustomQueryBuilder):
         query_name: str,
         fields: Optional[FieldSelector] = None,
         operation_name: Optional[str] = None,
+        schema: Optional["SchemaIndex"] = None,
     ) -> None:
         """Initialize custom connection query builder.
 
@@ -188,8 +261,9 @@ class CustomConnectionQueryBuilder(CustomQueryBuilder):
             query_name: The root query field name
             fields: Field selector for the query
             operation_name: Optional GraphQL operation name
+            schema: Schema index used to type variables
         """
-        super().__init__(query_name, fields, operation_name)
+        super().__init__(query_name, fields, operation_name, schema)
         self._pagination: Optional[dict] = None
 
     def paginate(
@@ -255,48 +329,9 @@ class CustomConnectionQueryBuilder(CustomQueryBuilder):
             return self.add_variable("after", cursor)
         return self.add_variable("before", cursor)
 
-    def build_query(self) -> str:
-        """Build the complete GraphQL query string."""
-        # Build variable definitions
-        variable_defs = self._build_variable_definitions()
-
-        # Build operation name
-        operation_name = f" {self._operation_name}" if self._operation_name else ""
-
-        # Build field selection
-        field_selection = ""
-        if self._fields:
-            field_selection = self._fields.build(2)
-        else:
-            # Default connection fields if none specified
-            field_selection = """    edges {
-      cursor
-      node {
-        id
-      }
-    }
-    pageInfo {
-      hasNextPage
-      hasPreviousPage
-    }"""
-
-        # Build query arguments
-        query_args = ""
-        if self._variables:
-            args = [f"{name}: ${name}" for name in self._variables]
-            query_args = f"({', '.join(args)})"
-
-        # Build fragments
-        fragments = "\n".join(self._fragments) if self._fragments else ""
-
-        return f"""
-query{operation_name}{variable_defs} {{
-  {self._query_name}{query_args} {{
-{field_selection}
-  }}
-}}
-{fragments}
-        """.strip()
+    def _default_fields(self) -> Optional[FieldSelector]:
+        """Get the default connection fields used when none are specified."""
+        return _DEFAULT_CONNECTION_FIELDS
 
 
 class CustomFilterableQueryBuilder(CustomQueryBuilder):
@@ -307,6 +342,7 @@ class CustomFilterableQueryBuilder(CustomQueryBuilder):
         query_name: str,
         fields: Optional[FieldSelector] = None,
         operation_name: Optional[str] = None,
+        schema: Optional["SchemaIndex"] = None,
     ) -> None:
         """Initialize custom filterable query builder.
 
@@ -314,8 +350,9 @@ class CustomFilterableQueryBuilder(CustomQueryBuilder):
             query_name: The root query field name
             fields: Field selector for the query
             operation_name: Optional GraphQL operation name
+            schema: Schema index used to type variables
         """
-        super().__init__(query_name, fields, operation_name)
+        super().__init__(query_name, fields, operation_name, schema)
         self._date_range: Optional[dict] = None
 
     def with_date_range(
@@ -0,0 +1,173 @@
+"""Assembly of complete GraphQL operation documents."""
+
+from collections.abc import Sequence
+from typing import Optional
+
+from .fields import FieldSelector
+
+VariableSignature = tuple[tuple[str, str], ...]
+
+# (alias, root field, variable signature, field selection) of a batched root
+BatchRoot = tuple[str, str, VariableSignature, Optional[FieldSelector]]
+
+
+def build_operation(
+    operation_type: str,
+    operation_name: Optional[str],
+    root_field: str,
+    signature: VariableSignature,
+    fields: Optional[FieldSelector],
+    fragments: list[str],
+    pretty: bool = False,
+) -> str:
+    """Build a single-root-field GraphQL operation document.
+
+    Every variable is declared on the operation and passed to the root field
+    as the argument of the same name.
+
+    Args:
+        operation_type: 'query' or 'mutation'
+        operation_name: Optional operation name
+        root_field: Root field name
+        signature: Variable names and GraphQL types
+        fields: Field selection on the root field
+        fragments: Fragment definitions appended to the document
+        pretty: Whether to emit an indented document instead of a minified one
+
+    Returns:
+        GraphQL document
+    """
+    if pretty:
+        return _build_pretty(
+            operation_type, operation_name, root_field, signature, fields, fragments
+        )
+
+    parts = [operation_type]
+    if operation_name:
+        parts.append(f" {operation_name}")
+    if signature:
+        definitions = ",".join(f"${name}:{var_type}" for name, var_type in signature)
+        parts.append(f"({definitions})")
+    parts.append("{")
+    parts.append(root_field)
+    if signature:
+        arguments = ",".join(f"{name}:${name}" for name, _ in signature)
+        parts.append(f"({arguments})")
+    if fields is not None and fields._fields:
+        parts.append("{")
+        fields._write_compact(parts)
+        parts.append("}")
+    parts.append("}")
+    for fragment in fragments:
+        parts.append(" ")
+        parts.append(fragment)
+    return "".join(parts)
+
+
+def build_batch_operation(
+    operation_type: str,
+    operation_name: Optional[str],
+    roots: Sequence[BatchRoot],
+    fragments: list[str],
+    pretty: bool = False,
+) -> str:
+    """Build a GraphQL operation document with several aliased root fields.
+
+    The variables of each root are declared on the operation prefixed with
+    its alias (``$a0_id`` for argument ``id`` of root ``a0``), so roots using
+    the same argument names do not collide.
+
+    Args:
+        operation_type: 'query' or 'mutation'
+        operation_name: Optional operation name
+        roots: Alias, root field, variables and field selection of each root
+        fragments: Fragment definitions appended to the document
+        pretty: Whether to emit an indented document instead of a minified one
+
+    Returns:
+        GraphQL document
+    """
+    definitions = [
+        (f"{alias}_{name}", var_type)
+        for alias, _, signature, _ in roots
+        for name, var_type in signature
+    ]
+    separator = ", " if pretty else ","
+
+    header = operation_type
+    if operation_name:
+        header += f" {operation_name}"
+    if definitions:
+        if pretty:
+            variables = separator.join(f"${n}: {t}" for n, t in definitions)
+        else:
+            variables = separator.join(f"${n}:{t}" for n, t in definitions)
+        header += f"({variables})"
+
+    selections = []
+    for alias, root_field, signature, fields in roots:
+        selection = f"{alias}: {root_field}" if pretty else f"{alias}:{root_field}"
+        if signature:
+            arguments = separator.join(
+                f"{name}: ${alias}_{name}" if pretty else f"{name}:${alias}_{name}"
+                for name, _ in signature
+            )
+            selection += f"({arguments})"
+        if fields is not None and fields._fields:
+            if pretty:
+                selection += " {\n" + fields.build(2) + "\n  }"
+            else:
+                parts = ["{"]
+                fields._write_compact(parts)
+                parts.append("}")
+                selection += "".join(parts)
+        selections.append(selection)
+
+    if pretty:
+        body = "\n".join(f"  {selection}" for selection in selections)
+        document = f"{header} {{\n{body}\n}}"
+        return "\n".join([document, *fragments])
+    return " ".join([f"{header}{{{' '.join(selections)}}}", *fragments])
+
+
+def _build_pretty(
+    operation_type: str,
+    operation_name: Optional[str],
+    root_field: str,
+    signature: VariableSignature,
+    fields: Optional[FieldSelector],
+    fragments: list[str],
+) -> str:
+    """Build an indented GraphQL operation document for debugging."""
+    # Build variable definitions
+    variable_defs = ""
+    if signature:
+        definitions = [f"${name}: {var_type}" for name, var_type in signature]
+        variable_defs = "(" + ", ".join(definitions) + ")"
+
+    # Build operation name
+    name = f" {operation_name}" if operation_name else ""
+
+    # Build field selection
+    if fields is not None:
+        field_selection = fields.build(2)
+    else:
+        field_selection = "  # No fields specified"
+
+    # Build root field arguments
+    root_args = ""
+    if signature:
+        args = [f"{arg}: ${arg}" for arg, _ in signature]
+        root_args = f"({', '.join(args)})"
+
+    # Build fragments
+    fragment_text = "\n".join(fragments) if fragments else ""
+
+    return f"""
+{operation_type}{name}{variable_defs} {{
+  {root_field}{root_args} {{
+{field_selection}
+  }}
+}}
+{fragment_text}
+        """.strip()
@@ -1,6 +1,31 @@
 """Field selection utilities for dynamic GraphQL query building."""
 
-from typing import Optional, Union
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Optional, Union
+from weakref import WeakSet, WeakValueDictionary
+
+
+def _selection_fingerprint(
+    fields: dict[str, Any], connection_args: Optional[dict[str, Any]]
+) -> tuple:
+    """Build the structural fingerprint of a selection."""
+    args = (
+        tuple((name, repr(value)) for name, value in connection_args.items())
+        if connection_args
+        else ()
+    )
+
+    selection = []
+    for field_name, field_value in fields.items():
+        if isinstance(field_value, FieldSelector):
+            selection.append((field_name, field_value.fingerprint()))
+        elif isinstance(field_value, list):
+            selection.append((field_name, tuple(field_value)))
+        else:
+            selection.append((field_name, None))
+
+    return (args, tuple(selection))
 
 
 class FieldSelector:
@@ -13,10 +38,61 @@ class FieldSelector:
             base_fields: Base fields to always include
         """
         self._fields: dict[str, Union[str, FieldSelector, list[str]]] = {}
+        # Memoized fingerprint, dropped when this selection or a nested one
+        # changes; nested selections know their parents to propagate that
+        self._fingerprint_memo: Optional[tuple] = None
+        self._parents: WeakSet[FieldSelector] = WeakSet()
         if base_fields:
             for field in base_fields:
                 self._fields[field] = field
 
+    def _mutated(self) -> None:
+        """Drop the memoized fingerprints of this selection and its parents."""
+        pending = [self]
+        while pending:
+            selector = pending.pop()
+            if selector._fingerprint_memo is None:
+                # Parents are only memoized while their nested selections are
+                continue
+            selector._fingerprint_memo = None
+            pending.extend(selector._parents)
+
+    def _set_field(
+        self, field: str, value: Union[str, "FieldSelector", list[str]]
+    ) -> None:
+        """Set a field, linking a nested mutable selection to this one."""
+        self._unlink(self._fields.get(field))
+        self._fields[field] = value
+        self._link(value)
+
+    def _link(self, value: Any) -> None:
+        """Register this selection as a parent of a nested mutable selection."""
+        if isinstance(value, FieldSelector) and not isinstance(
+            value, FrozenFieldSelector
+        ):
+            value._parents.add(self)
+
+    def _unlink(self, value: Any) -> None:
+        """Unregister this selection as a parent of a nested selection."""
+        if isinstance(value, FieldSelector) and not isinstance(
+            value, FrozenFieldSelector
+        ):
+            value._parents.discard(self)
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Get the picklable state (parent links and memo are rebuilt)."""
+        state = self.__dict__.copy()
+        state.pop("_parents", None)
+        state["_fingerprint_memo"] = None
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore pickled state and re-link nested selections."""
+        self.__dict__.update(state)
+        self._parents = WeakSet()
+        for value in self._fields.values():
+            self._link(value)
+
     def add_field(self, field: str) -> "FieldSelector":
         """Add a simple field.
 
@@ -26,7 +102,8 @@ class FieldSelector:
         Returns:
             Self for chaining
         """
-        self._fields[field] = field
+        self._set_field(field, field)
+        self._mutated()
         return self
 
     def add_fields(self, *fields: str) -> "FieldSelector":
@@ -39,7 +116,8 @@ class FieldSelector:
             Self for chaining
         """
         for field in fields:
-            self._fields[field] = field
+            self._set_field(field, field)
+        self._mutated()
         return self
 
     def add_nested_field(
@@ -54,7 +132,8 @@ class FieldSelector:
         Returns:
             Self for chaining
         """
-        self._fields[field] = subfields
+        self._set_field(field, subfields)
+        self._mutated()
         return self
 
     def add_nested_fields(
@@ -68,7 +147,12 @@ class FieldSelector:
     def add_interface_field(
         self, field: str, subfields: "FieldSelector"
     ) -> "FieldSelector":
-        """Add a GraphQL interface field with inline fragment syntax."""
+        """Add a GraphQL interface field with inline fragment syntax.
+
+        ``__typename`` is selected alongside, so the response can be parsed
+        straight into the right model.
+        """
+        self._fields.setdefault("__typename", "__typename")
         return self.add_nested_field(f"... on {field}", subfields)
 
     def add_interface_fields(
@@ -117,7 +201,8 @@ class FieldSelector:
         if connection_args:
             connection_selector._connection_args = connection_args
 
-        self._fields[field] = connection_selector
+        self._set_field(field, connection_selector)
+        self._mutated()
         return self
 
     def add_money_field(self, field: str) -> "FieldSelector":
@@ -130,7 +215,8 @@ class FieldSelector:
             Self for chaining
         """
         money_selector = FieldSelector(["amount", "currencyCode"])
-        self._fields[field] = money_selector
+        self._set_field(field, money_selector)
+        self._mutated()
         return self
 
     def remove_field(self, field: str) -> "FieldSelector":
@@ -142,7 +228,8 @@ class FieldSelector:
         Returns:
             Self for chaining
         """
-        self._fields.pop(field, None)
+        self._unlink(self._fields.pop(field, None))
+        self._mutated()
         return self
 
     def build(self, indent: int = 0) -> str:
@@ -193,6 +280,96 @@ class FieldSelector:
 
         return "\n".join(lines)
 
+    def build_compact(self) -> str:
+        """Build the field selection string with minimal whitespace.
+
+        Returns:
+            GraphQL fields string, e.g. ``id money{amount currencyCode}``
+        """
+        parts: list[str] = []
+        self._write_compact(parts)
+        return "".join(parts)
+
+    def _write_compact(self, parts: list[str]) -> None:
+        """Append the minified field selection to a list of string parts.
+
+        Nested selections write into the same list, so the whole document
+        is joined once by the caller.
+
+        Args:
+            parts: Output parts
+        """
+        # Names only need a separator when directly following another name
+        after_name = False
+        for field_name, field_value in self._fields.items():
+            if isinstance(field_value, str):
+                if after_name:
+                    parts.append(" ")
+                parts.append(field_name)
+                after_name = True
+            elif isinstance(field_value, FieldSelector):
+                if after_name:
+                    parts.append(" ")
+                parts.append(field_name)
+                connection_args = getattr(field_value, "_connection_args", None)
+                if connection_args:
+                    args = []
+                    for arg_name, arg_value in connection_args.items():
+                        if isinstance(arg_value, str):
+                            args.append(f'{arg_name}:"{arg_value}"')
+                        else:
+                            args.append(f"{arg_name}:{arg_value}")
+                    parts.append(f"({','.join(args)})")
+                if field_value._fields:
+                    parts.append("{")
+                    field_value._write_compact(parts)
+                    parts.append("}")
+                    after_name = False
+                else:
+                    after_name = True
+            elif isinstance(field_value, list):
+                for subfield in field_value:
+                    if after_name:
+                        parts.append(" ")
+                    parts.append(f"{field_name}.{subfield}")
+                    after_name = True
+
+    def fingerprint(self) -> tuple:
+        """Get a hashable fingerprint of the selection structure.
+
+        Two selectors with the same fingerprint build the same GraphQL text,
+        so it can be used as a cache key for compiled queries. The
+        fingerprint is memoized until this selection or one nested in it is
+        modified.
+
+        Returns:
+            Nested tuple describing fields, nesting and connection arguments
+        """
+        if self._fingerprint_memo is None:
+            self._fingerprint_memo = _selection_fingerprint(
+                self._fields, getattr(self, "_connection_args", None)
+            )
+        return self._fingerprint_memo
+
+    def freeze(self) -> "FrozenFieldSelector":
+        """Get an immutable, interned equivalent of this selector.
+
+        Returns:
+            Frozen selector shared by every structurally equal selection
+        """
+        fields: dict[str, Any] = {}
+        for field_name, field_value in self._fields.items():
+            if isinstance(field_value, FieldSelector):
+                fields[field_name] = field_value.freeze()
+            elif isinstance(field_value, list):
+                fields[field_name] = list(field_value)
+            else:
+                fields[field_name] = field_value
+
+        return FrozenFieldSelector._intern(
+            fields, getattr(self, "_connection_args", None)
+        )
+
     def __str__(self) -> str:
         """String representation."""
         return self.build()
@@ -207,41 +384,272 @@ class FieldSelector:
         for field_name, field_value in self._fields.items():
             if isinstance(field_value, str):
                 new_selector._fields[field_name] = field_value
+            elif isinstance(field_value, FrozenFieldSelector):
+                # Frozen selections are immutable and can be shared
+                new_selector._fields[field_name] = field_value
             elif isinstance(field_value, FieldSelector):
-                new_selector._fields[field_name] = field_value.copy()
+                new_selector._set_field(field_name, field_value.copy())
             else:
                 new_selector._fields[field_name] = field_value
 
+        connection_args = getattr(self, "_connection_args", None)
+        if connection_args:
+            new_selector._connection_args = dict(connection_args)
+
         return new_selector
 
 
-# Predefined common field selectors
+def _restore_frozen(selector: FieldSelector) -> "FrozenFieldSelector":
+    """Re-intern a frozen selector after unpickling."""
+    return selector.freeze()
+
+
+class FrozenFieldSelector(FieldSelector):
+    """Immutable, hashable field selector.
+
+    Frozen selectors are interned: structurally equal selections share one
+    instance, including nested selections, so equality and hashing are cheap
+    and built field strings are computed once per indentation level. The
+    ``add_*`` and ``remove_field`` methods return a new frozen selector
+    instead of modifying this one, and ``copy()`` returns a mutable
+    :class:`FieldSelector`.
+
+    Example:
+        >>> base = FieldSelector().add_fields('id', 'name').freeze()
+        >>> extended = base.add_field('createdAt')  # base is unchanged
+        >>> base == FrozenFieldSelector(['id', 'name'])
+        True
+    """
+
+    _interned: "WeakValueDictionary[tuple, FrozenFieldSelector]" = WeakValueDictionary()
+    _intern_lock = Lock()
+
+    def __new__(cls, base_fields: Optional[list[str]] = None):
+        """Get the interned frozen selector for a list of simple fields."""
+        return FieldSelector(base_fields).freeze()
+
+    def __init__(self, base_fields: Optional[list[str]] = None) -> None:
+        """Initialize frozen field selector (state is set when interned).
+
+        Args:
+            base_fields: Base fields to always include
+        """
+
+    @classmethod
+    def _intern(
+        cls, fields: dict[str, Any], connection_args: Optional[dict[str, Any]]
+    ) -> "FrozenFieldSelector":
+        """Get the shared instance for a selection, creating it if needed.
+
+        Args:
+            fields: Selection with nested selectors already frozen
+            connection_args: Connection arguments of the selection
+
+        Returns:
+            Interned frozen selector
+        """
+        fingerprint = _selection_fingerprint(fields, connection_args)
+        with cls._intern_lock:
+            selector = cls._interned.get(fingerprint)
+            if selector is None:
+                selector = object.__new__(cls)
+                object.__setattr__(selector, "_fields", MappingProxyType(fields))
+                if connection_args:
+                    object.__setattr__(
+                        selector,
+                        "_connection_args",
+                        MappingProxyType(dict(connection_args)),
+                    )
+                object.__setattr__(selector, "_fingerprint", fingerprint)
+                object.__setattr__(selector, "_hash", hash(fingerprint))
+                object.__setattr__(selector, "_built", {})
+                cls._interned[fingerprint] = selector
+        return selector
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Reject attribute assignment."""
+        raise AttributeError("FrozenFieldSelector is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        """Reject attribute deletion."""
+        raise AttributeError("FrozenFieldSelector is immutable")
+
+    def __eq__(self, other: object) -> bool:
+        """Compare selections structurally."""
+        if self is other:
+            return True
+        if isinstance(other, FrozenFieldSelector):
+            return self._hash == other._hash and self._fingerprint == other._fingerprint
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        """Hash of the selection structure."""
+        return self._hash
+
+    def __reduce__(self) -> tuple:
+        """Pickle as a mutable selection that is re-interned on load."""
+        return (_restore_frozen, (self.copy(),))
+
+    def __copy__(self) -> "FrozenFieldSelector":
+        """Frozen selectors are immutable, so copies are the same instance."""
+        return self
+
+    def __deepcopy__(self, memo: dict) -> "FrozenFieldSelector":
+        """Frozen selectors are immutable, so copies are the same instance."""
+        return self
+
+    def __repr__(self) -> str:
+        """String representation of the frozen selector."""
+        return f"FrozenFieldSelector(fields={list(self._fields)!r})"
+
+    def fingerprint(self) -> tuple:
+        """Get the (precomputed) fingerprint of the selection structure."""
+        return self._fingerprint
+
+    def freeze(self) -> "FrozenFieldSelector":
+        """Return self, as the selector is already frozen."""
+        return self
+
+    def build(self, indent: int = 0) -> str:
+        """Build the GraphQL field selection string, memoized per indent.
+
+        Args:
+            indent: Indentation level
+
+        Returns:
+            GraphQL fields string
+        """
+        built = self._built.get(indent)
+        if built is None:
+            built = super().build(indent)
+            self._built[indent] = built
+        return built
+
+    def build_compact(self) -> str:
+        """Build the minified field selection string, memoized.
+
+        Returns:
+            GraphQL fields string with minimal whitespace
+        """
+        built = self._built.get(None)
+        if built is None:
+            parts: list[str] = []
+            super()._write_compact(parts)
+            built = "".join(parts)
+            self._built[None] = built
+        return built
+
+    def _write_compact(self, parts: list[str]) -> None:
+        """Append the memoized minified selection to a list of parts."""
+        parts.append(self.build_compact())
+
+    def _evolve(self, method: str, *args: Any, **kwargs: Any) -> "FrozenFieldSelector":
+        """Apply a mutating method to a copy and freeze the result."""
+        selector = self.copy()
+        getattr(selector, method)(*args, **kwargs)
+        return selector.freeze()
+
+    def add_field(self, field: str) -> "FrozenFieldSelector":
+        """Return a new frozen selector with a simple field added."""
+        return self._evolve("add_field", field)
+
+    def add_fields(self, *fields: str) -> "FrozenFieldSelector":
+        """Return a new frozen selector with simple fields added."""
+        return self._evolve("add_fields", *fields)
+
+    def add_nested_field(
+        self, field: str, subfields: FieldSelector
+    ) -> "FrozenFieldSelector":
+        """Return a new frozen selector with a nested field added."""
+        return self._evolve("add_nested_field", field, subfields)
+
+    def add_nested_fields(
+        self, field_subfields: dict[str, FieldSelector]
+    ) -> "FrozenFieldSelector":
+        """Return a new frozen selector with nested fields added."""
+        return self._evolve("add_nested_fields", field_subfields)
+
+    def add_interface_field(
+        self, field: str, subfields: FieldSelector
+    ) -> "FrozenFieldSelector":
+        """Return a new frozen selector with an inline fragment added."""
+        return self._evolve("add_interface_field", field, subfields)
+
+    def add_interface_fields(
+        self, field_subfields: dict[str, FieldSelector]
+    ) -> "FrozenFieldSelector":
+        """Return a new frozen selector with inline fragments added."""
+        return self._evolve("add_interface_fields", field_subfields)
+
+    def add_connection_field(
+        self,
+        field: str,
+        node_fields: FieldSelector,
+        include_page_info: bool = True,
+        include_edges: bool = True,
+        **connection_args: Any,
+    ) -> "FrozenFieldSelector":
+        """Return a new frozen selector with a connection field added."""
+        return self._evolve(
+            "add_connection_field",
+            field,
+            node_fields,
+            include_page_info,
+            include_edges,
+            **connection_args,
+        )
+
+    def add_money_field(self, field: str) -> "FrozenFieldSelector":
+        """Return a new frozen selector with a Money field added."""
+        return self._evolve("add_money_field", field)
+
+    def remove_field(self, field: str) -> "FrozenFieldSelector":
+        """Return a new frozen selector without a field."""
+        return self._evolve("remove_field", field)
+
+
 class CommonFields:
-    """Common field selectors for frequent use cases."""
+    """Common field selectors for frequent use cases.
+
+    Each call returns a new mutable selector. Pass ``frozen=True`` to get
+    the shared immutable :class:`FrozenFieldSelector` instead, which is not
+    rebuilt on every call and makes compiled-query cache lookups cheap; its
+    ``add_*`` methods return an extended copy rather than modifying it.
+    """
 
     @staticmethod
-    def basic_node() -> FieldSelector:
+    def basic_node(frozen: bool = False) -> FieldSelector:
         """Basic node fields (id, createdAt, updatedAt)."""
+        if frozen:
+            return _FROZEN_COMMON_FIELDS["basic_node"]
         return FieldSelector(["id", "createdAt", "updatedAt"])
 
     @staticmethod
-    def money_fields() -> FieldSelector:
+    def money_fields(frozen: bool = False) -> FieldSelector:
         """Money type fields."""
+        if frozen:
+            return _FROZEN_COMMON_FIELDS["money_fields"]
         return FieldSelector(["amount", "currencyCode"])
 
     @staticmethod
-    def page_info() -> FieldSelector:
+    def page_info(frozen: bool = False) -> FieldSelector:
         """Standard pagination info."""
+        if frozen:
+            return _FROZEN_COMMON_FIELDS["page_info"]
         return FieldSelector(["hasNextPage", "hasPreviousPage"])
 
     @staticmethod
-    def user_error() -> FieldSelector:
+    def user_error(frozen: bool = False) -> FieldSelector:
         """User error fields."""
+        if frozen:
+            return _FROZEN_COMMON_FIELDS["user_error"]
         return FieldSelector(["field", "message"])
 
     @staticmethod
-    def basic_app() -> FieldSelector:
+    def basic_app(frozen: bool = False) -> FieldSelector:
         """Basic app fields."""
+        if frozen:
+            return _FROZEN_COMMON_FIELDS["basic_app"]
         return (
             FieldSelector()
             .add_fields("id", "title", "handle", "appStoreAppUrl", "developerName")
@@ -250,8 +658,10 @@ class CommonFields:
         )
 
     @staticmethod
-    def basic_transaction() -> FieldSelector:
+    def basic_transaction(frozen: bool = False) -> FieldSelector:
         """Basic transaction fields."""
+        if frozen:
+            return _FROZEN_COMMON_FIELDS["basic_transaction"]
         return (
             FieldSelector()
             .add_fields("id", "createdAt", "test")
@@ -260,10 +670,27 @@ class CommonFields:
         )
 
     @staticmethod
-    def basic_shop() -> FieldSelector:
+    def basic_shop(frozen: bool = False) -> FieldSelector:
         """Basic shop fields."""
+        if frozen:
+            return _FROZEN_COMMON_FIELDS["basic_shop"]
         return (
             FieldSelector()
             .add_fields("id", "name", "myshopifyDomain", "url")
             .add_field("createdAt")
         )
+
+
+# Shared frozen instances returned with frozen=True
+_FROZEN_COMMON_FIELDS: dict[str, FrozenFieldSelector] = {
+    name: getattr(CommonFields, name)().freeze()
+    for name in (
+        "basic_node",
+        "money_fields",
+        "page_info",
+        "user_error",
+        "basic_app",
+        "basic_transaction",
+        "basic_shop",
+    )
+}
@@ -0,0 +1,23 @@
+"""Schema indexes for schema-aware query building."""
+
+from .artifact import load_artifact, write_artifact
+from .index import SchemaIndex, named_type
+from .loader import (
+    SCHEMA_DIR_ENV_VAR,
+    clear_schema_cache,
+    find_introspection_file,
+    get_schema_index,
+)
+from .validator import QueryValidator
+
+__all__ = [
+    "SCHEMA_DIR_ENV_VAR",
+    "QueryValidator",
+    "SchemaIndex",
+    "clear_schema_cache",
+    "find_introspection_file",
+    "get_schema_index",
+    "load_artifact",
+    "named_type",
+    "write_artifact",
+]
@@ -0,0 +1,159 @@
+"""Compact schema index artifacts.
+
+An artifact stores the tables of a :class:`SchemaIndex` so they can be
+loaded without parsing the whole introspection JSON. The file is
+memory-mapped and each type's table is decoded only when it is first
+looked up.
+
+Layout::
+
+    MAGIC (4 bytes) | format (1 byte) | header length (uint32, little endian)
+    header (JSON: query type, mutation type, {type name: [offset, length]})
+    type tables (compact JSON, one per type, offsets relative to their start)
+
+Every part is UTF-8 JSON behind a fixed struct preamble, so an artifact
+reads the same on every Python version and implementation.
+"""
+
+from collections.abc import Iterator, Mapping
+import json
+import mmap
+from pathlib import Path
+import struct
+from threading import Lock
+from typing import Any, Optional, Union
+
+from .index import INDEX_FORMAT_VERSION, SchemaIndex
+
+MAGIC = b"SPSI"
+
+_PREAMBLE = struct.Struct("<4sBI")
+
+# Table entries stored as JSON arrays that the index exposes as tuples
+_TUPLE_KEYS = ("possible_types", "interfaces", "enum_values")
+
+
+def _encode(value: Any) -> bytes:
+    """Encode a header or type table as compact UTF-8 JSON."""
+    return json.dumps(value, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+
+def _decode_entry(raw: bytes) -> dict[str, Any]:
+    """Decode a type table, restoring the tuples that JSON stores as arrays."""
+    entry = json.loads(raw)
+    fields = entry.get("fields")
+    if fields is not None:
+        entry["fields"] = {
+            name: (type_ref, arguments, tuple(required))
+            for name, (type_ref, arguments, required) in fields.items()
+        }
+    for key in _TUPLE_KEYS:
+        if key in entry:
+            entry[key] = tuple(entry[key])
+    return entry
+
+
+def write_artifact(index: SchemaIndex, path: Union[str, Path]) -> int:
+    """Write the tables of a schema index to an artifact file.
+
+    Args:
+        index: Schema index to store
+        path: Artifact file path
+
+    Returns:
+        Size of the written file in bytes
+    """
+    data = index.to_data()
+
+    blobs = []
+    offsets: dict[str, tuple[int, int]] = {}
+    position = 0
+    for type_name, entry in data["types"].items():
+        blob = _encode(entry)
+        offsets[type_name] = (position, len(blob))
+        blobs.append(blob)
+        position += len(blob)
+
+    header = _encode(
+        {
+            "query_type": data["query_type"],
+            "mutation_type": data["mutation_type"],
+            "offsets": offsets,
+        }
+    )
+    content = b"".join(
+        [_PREAMBLE.pack(MAGIC, INDEX_FORMAT_VERSION, len(header)), header, *blobs]
+    )
+    Path(path).write_bytes(content)
+    return len(content)
+
+
+class _LazyTypeTable(Mapping):
+    """Read-only mapping of type name to type table, decoded on first access."""
+
+    def __init__(
+        self, buffer: mmap.mmap, base: int, offsets: dict[str, list[int]]
+    ) -> None:
+        self._buffer = buffer
+        self._base = base
+        self._offsets = offsets
+        self._decoded: dict[str, dict[str, Any]] = {}
+        self._lock = Lock()
+
+    def __getitem__(self, type_name: str) -> dict[str, Any]:
+        entry = self._decoded.get(type_name)
+        if entry is not None:
+            return entry
+        offset, length = self._offsets[type_name]
+        start = self._base + offset
+        with self._lock:
+            entry = _decode_entry(self._buffer[start : start + length])
+            self._decoded[type_name] = entry
+        return entry
+
+    def __contains__(self, type_name: object) -> bool:
+        return type_name in self._offsets
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._offsets)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+
+def load_artifact(
+    path: Union[str, Path], api_version: Optional[str] = None
+) -> SchemaIndex:
+    """Load a schema index from an artifact file.
+
+    Only the header is decoded up front; type tables are decoded lazily
+    from the memory-mapped file.
+
+    Args:
+        path: Artifact file path
+        api_version: API version the schema belongs to
+
+    Returns:
+        Schema index
+
+    Raises:
+        ValueError: If the file is not a compatible artifact
+    """
+    with Path(path).open("rb") as f:
+        buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(buffer) < _PREAMBLE.size:
+        raise ValueError(f"Schema artifact is truncated: {path}")
+    magic, format_version, header_length = _PREAMBLE.unpack_from(buffer)
+    if magic != MAGIC or format_version != INDEX_FORMAT_VERSION:
+        raise ValueError(f"Incompatible schema artifact: {path}")
+
+    header_end = _PREAMBLE.size + header_length
+    header = json.loads(buffer[_PREAMBLE.size : header_end])
+    data = {
+        "format": INDEX_FORMAT_VERSION,
+        "query_type": header["query_type"],
+        "mutation_type": header["mutation_type"],
+        "types": _LazyTypeTable(buffer, header_end, header["offsets"]),
+    }
+    return SchemaIndex(data, api_version)
@@ -0,0 +1,86 @@
+"""Build the packaged schema index artifacts from introspection files.
+
+Run from a source checkout after updating ``schema/versions``::
+
+    python -m shopify_partners_sdk.schema.build
+
+Versions whose introspection files are identical share one artifact.
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+import sys
+from typing import Optional, Union
+
+from .artifact import write_artifact
+from .index import INDEX_FORMAT_VERSION, SchemaIndex
+from .loader import ARTIFACT_DIR, MANIFEST_NAME, SOURCE_SCHEMA_DIR
+
+
+def build_artifacts(
+    schema_dir: Union[str, Path] = SOURCE_SCHEMA_DIR,
+    output_dir: Union[str, Path] = ARTIFACT_DIR,
+) -> dict[str, str]:
+    """Build one artifact per distinct introspection file and a manifest.
+
+    Args:
+        schema_dir: Directory containing ``<version>/introspection.json``
+        output_dir: Directory for the artifacts and ``manifest.json``
+
+    Returns:
+        Mapping of API version to artifact file name
+    """
+    schema_dir = Path(schema_dir)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    versions: dict[str, str] = {}
+    for path in sorted(schema_dir.glob("*/introspection.json")):
+        raw = path.read_bytes()
+        artifact_name = f"{hashlib.sha256(raw).hexdigest()[:16]}.idx"
+        artifact_path = output_dir / artifact_name
+        if artifact_name not in versions.values():
+            index = SchemaIndex.from_introspection(json.loads(raw))
+            write_artifact(index, artifact_path)
+        versions[path.parent.name] = artifact_name
+
+    # Remove artifacts no longer referenced by any version
+    for stale in output_dir.glob("*.idx"):
+        if stale.name not in versions.values():
+            stale.unlink()
+
+    manifest = {"format": INDEX_FORMAT_VERSION, "versions": versions}
+    (output_dir / MANIFEST_NAME).write_text(
+        json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8"
+    )
+    return versions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--schema-dir",
+        default=str(SOURCE_SCHEMA_DIR),
+        help="directory containing <version>/introspection.json",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=str(ARTIFACT_DIR),
+        help="directory for the artifacts and manifest",
+    )
+    args = parser.parse_args(argv)
+
+    versions = build_artifacts(args.schema_dir, args.output_dir)
+    if not versions:
+        print(f"No introspection files found in {args.schema_dir}", file=sys.stderr)
+        return 1
+    for version, artifact_name in sorted(versions.items()):
+        print(f"{version}: {artifact_name}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
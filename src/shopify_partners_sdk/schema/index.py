@@ -0,0 +1,288 @@
+"""Precomputed lookup tables built from a GraphQL introspection result."""
+
+from collections.abc import Iterable
+import json
+from pathlib import Path
+from typing import Any, Optional, Union
+
+from shopify_partners_sdk.exceptions.graphql import GraphQLValidationError
+
+# Field table entry: (type reference, {argument: type reference}, required arguments)
+FieldEntry = tuple[str, dict[str, str], tuple[str, ...]]
+
+# Version of the index data layout, bumped whenever it changes
+INDEX_FORMAT_VERSION = 2
+
+
+def _type_reference(type_ref: dict[str, Any]) -> str:
+    """Render an introspection type reference as GraphQL type syntax."""
+    kind = type_ref["kind"]
+    if kind == "NON_NULL":
+        return _type_reference(type_ref["ofType"]) + "!"
+    if kind == "LIST":
+        return "[" + _type_reference(type_ref["ofType"]) + "]"
+    return type_ref["name"]
+
+
+def named_type(type_ref: str) -> str:
+    """Get the named type of a type reference (e.g. ``[ID!]!`` -> ``ID``).
+
+    Args:
+        type_ref: GraphQL type reference
+
+    Returns:
+        Name of the innermost type
+    """
+    return type_ref.strip("[]!")
+
+
+class SchemaIndex:
+    """Field, argument and type tables of one GraphQL schema version.
+
+    The tables are plain dictionaries and tuples keyed by type and field
+    name, so lookups are constant time and the whole index can be stored
+    in a compact serialized form.
+
+    Example:
+        >>> index = SchemaIndex.from_file('schema/versions/2025-04/introspection.json')
+        >>> index.get_argument_type('QueryRoot', 'transactions', 'types')
+        '[TransactionType!]'
+    """
+
+    def __init__(self, data: dict[str, Any], api_version: Optional[str] = None) -> None:
+        """Initialize the index from its table data.
+
+        Args:
+            data: Table data produced by :meth:`to_data`
+            api_version: API version the schema belongs to
+        """
+        if data.get("format") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported schema index format: {data.get('format')!r}")
+        self._data = data
+        self._types: dict[str, dict[str, Any]] = data["types"]
+        self.api_version = api_version
+
+    @classmethod
+    def from_introspection(
+        cls, introspection: dict[str, Any], api_version: Optional[str] = None
+    ) -> "SchemaIndex":
+        """Build an index from an introspection query result.
+
+        Args:
+            introspection: Introspection result (with or without ``data``)
+            api_version: API version the schema belongs to
+
+        Returns:
+            Schema index
+        """
+        schema = introspection.get("data", introspection)["__schema"]
+
+        types: dict[str, dict[str, Any]] = {}
+        for type_def in schema["types"]:
+            entry: dict[str, Any] = {"kind": type_def["kind"]}
+
+            fields: dict[str, FieldEntry] = {}
+            for field in type_def.get("fields") or []:
+                arguments = {}
+                required = []
+                for arg in field.get("args") or []:
+                    arguments[arg["name"]] = _type_reference(arg["type"])
+                    if (
+                        arg["type"]["kind"] == "NON_NULL"
+                        and arg.get("defaultValue") is None
+                    ):
+                        required.append(arg["name"])
+                fields[field["name"]] = (
+                    _type_reference(field["type"]),
+                    arguments,
+                    tuple(required),
+                )
+            for input_field in type_def.get("inputFields") or []:
+                fields[input_field["name"]] = (
+                    _type_reference(input_field["type"]),
+                    {},
+                    (),
+                )
+            if fields:
+                entry["fields"] = fields
+
+            if type_def.get("possibleTypes"):
+                entry["possible_types"] = tuple(
+                    possible["name"] for possible in type_def["possibleTypes"]
+                )
+            if type_def.get("interfaces"):
+                entry["interfaces"] = tuple(
+                    interface["name"] for interface in type_def["interfaces"]
+                )
+            if type_def.get("enumValues"):
+                entry["enum_values"] = tuple(
+                    value["name"] for value in type_def["enumValues"]
+                )
+
+            types[type_def["name"]] = entry
+
+        mutation_type = schema.get("mutationType")
+        data = {
+            "format": INDEX_FORMAT_VERSION,
+            "query_type": schema["queryType"]["name"],
+            "mutation_type": mutation_type["name"] if mutation_type else None,
+            "types": types,
+        }
+        return cls(data, api_version)
+
+    @classmethod
+    def from_file(
+        cls, path: Union[str, Path], api_version: Optional[str] = None
+    ) -> "SchemaIndex":
+        """Build an index from an introspection JSON file.
+
+        Args:
+            path: Path to the introspection JSON file
+            api_version: API version the schema belongs to
+
+        Returns:
+            Schema index
+        """
+        with Path(path).open(encoding="utf-8") as f:
+            return cls.from_introspection(json.load(f), api_version)
+
+    def to_data(self) -> dict[str, Any]:
+        """Get the table data of the index (builtin types only)."""
+        return self._data
+
+    @property
+    def query_type(self) -> str:
+        """Get the name of the query root type."""
+        return self._data["query_type"]
+
+    @property
+    def mutation_type(self) -> Optional[str]:
+        """Get the name of the mutation root type, if the schema has one."""
+        return self._data["mutation_type"]
+
+    def root_type(self, operation_type: str) -> Optional[str]:
+        """Get the root type name of an operation type.
+
+        Args:
+            operation_type: 'query' or 'mutation'
+
+        Returns:
+            Root type name, or None if the schema does not support the operation
+        """
+        if operation_type == "query":
+            return self.query_type
+        if operation_type == "mutation":
+            return self.mutation_type
+        return None
+
+    def has_type(self, type_name: str) -> bool:
+        """Check whether a named type exists."""
+        return type_name in self._types
+
+    def get_type_kind(self, type_name: str) -> Optional[str]:
+        """Get the kind of a named type (e.g. 'OBJECT', 'INTERFACE')."""
+        entry = self._types.get(type_name)
+        return entry["kind"] if entry is not None else None
+
+    def get_field(self, type_name: str, field_name: str) -> Optional[FieldEntry]:
+        """Get the table entry of a field.
+
+        Args:
+            type_name: Name of the object, interface or input type
+            field_name: Field name
+
+        Returns:
+            ``(type reference, arguments, required arguments)``, or None if
+            the field does not exist
+        """
+        entry = self._types.get(type_name)
+        if entry is None:
+            return None
+        return entry.get("fields", {}).get(field_name)
+
+    def get_field_type(self, type_name: str, field_name: str) -> Optional[str]:
+        """Get the type reference of a field, or None if it does not exist."""
+        field = self.get_field(type_name, field_name)
+        return field[0] if field is not None else None
+
+    def get_argument_type(
+        self, type_name: str, field_name: str, argument: str
+    ) -> Optional[str]:
+        """Get the type reference of a field argument.
+
+        Args:
+            type_name: Name of the type declaring the field
+            field_name: Field name
+            argument: Argument name
+
+        Returns:
+            Argument type reference, or None if the field or argument does not exist
+        """
+        field = self.get_field(type_name, field_name)
+        return field[1].get(argument) if field is not None else None
+
+    def resolve_root_arguments(
+        self, operation_type: str, field_name: str, arguments: Iterable[str]
+    ) -> tuple[tuple[str, str], ...]:
+        """Look up the types of arguments passed to a root field.
+
+        Args:
+            operation_type: 'query' or 'mutation'
+            field_name: Root field name
+            arguments: Argument names
+
+        Returns:
+            ``(argument, type reference)`` pairs in the given order
+
+        Raises:
+            GraphQLValidationError: If the root field or an argument does not exist
+        """
+        root_type = self.root_type(operation_type)
+        field = self.get_field(root_type, field_name) if root_type else None
+        if field is None:
+            raise GraphQLValidationError(
+                f"Field '{field_name}' doesn't exist on type '{root_type}'"
+                f"{self._version_suffix()}"
+            )
+
+        resolved = []
+        for argument in arguments:
+            arg_type = field[1].get(argument)
+            if arg_type is None:
+                raise GraphQLValidationError(
+                    f"Field '{field_name}' doesn't accept argument '{argument}'"
+                    f"{self._version_suffix()}"
+                )
+            resolved.append((argument, arg_type))
+        return tuple(resolved)
+
+    def _version_suffix(self) -> str:
+        """Get an error message suffix naming the API version."""
+        return f" in API version {self.api_version}" if self.api_version else ""
+
+    def get_possible_types(self, type_name: str) -> tuple[str, ...]:
+        """Get the object types an abstract type can resolve to.
+
+        Args:
+            type_name: Interface, union or object type name
+
+        Returns:
+            Implementing object types (the type itself for object types)
+        """
+        entry = self._types.get(type_name)
+        if entry is None:
+            return ()
+        if entry["kind"] == "OBJECT":
+            return (type_name,)
+        return entry.get("possible_types", ())
+
+    def get_enum_values(self, type_name: str) -> tuple[str, ...]:
+        """Get the values of an enum type."""
+        entry = self._types.get(type_name)
+        return entry.get("enum_values", ()) if entry is not None else ()
+
+    def __repr__(self) -> str:
+        """String representation of the schema index."""
+        return (
+            f"SchemaIndex(api_version={self.api_version!r}, types={len(self._types)})"
+        )
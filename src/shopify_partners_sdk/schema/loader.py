@@ -0,0 +1,137 @@
+"""Locating and caching schema indexes per API version."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from threading import Lock
+from typing import Any, Optional, Union
+
+from .artifact import load_artifact
+from .index import INDEX_FORMAT_VERSION, SchemaIndex
+
+logger = logging.getLogger(__name__)
+
+# Environment variable pointing at a directory of <version>/introspection.json
+SCHEMA_DIR_ENV_VAR = "SHOPIFY_PARTNERS_SCHEMA_DIR"
+
+# Precompiled artifacts shipped with the package (see schema.build)
+ARTIFACT_DIR = Path(__file__).resolve().parent / "data"
+MANIFEST_NAME = "manifest.json"
+
+# schema/versions/ of a source checkout (src/shopify_partners_sdk/schema/loader.py)
+SOURCE_SCHEMA_DIR = Path(__file__).resolve().parents[3] / "schema" / "versions"
+
+_indexes: dict[tuple[str, Optional[str]], Optional[SchemaIndex]] = {}
+_artifact_data: dict[str, dict[str, Any]] = {}
+_manifest: Optional[dict[str, str]] = None
+_indexes_lock = Lock()
+
+
+def find_introspection_file(
+    api_version: str, schema_dir: Optional[Union[str, Path]] = None
+) -> Optional[Path]:
+    """Find the introspection JSON file of an API version.
+
+    Looks in ``schema_dir``, then the directory named by the
+    ``SHOPIFY_PARTNERS_SCHEMA_DIR`` environment variable, then the
+    ``schema/versions`` directory of a source checkout.
+
+    Args:
+        api_version: API version (e.g. '2025-04')
+        schema_dir: Directory containing ``<version>/introspection.json``
+
+    Returns:
+        Path of the introspection file, or None if none was found
+    """
+    candidates = [schema_dir, os.environ.get(SCHEMA_DIR_ENV_VAR), SOURCE_SCHEMA_DIR]
+    for directory in candidates:
+        if not directory:
+            continue
+        path = Path(directory) / api_version / "introspection.json"
+        if path.is_file():
+            return path
+    return None
+
+
+def _load_manifest() -> dict[str, str]:
+    """Read the packaged artifact manifest (version -> artifact file name)."""
+    global _manifest
+    if _manifest is None:
+        _manifest = {}
+        try:
+            with (ARTIFACT_DIR / MANIFEST_NAME).open(encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return _manifest
+        if manifest.get("format") == INDEX_FORMAT_VERSION:
+            _manifest = manifest.get("versions", {})
+    return _manifest
+
+
+def _load_packaged_index(api_version: str) -> Optional[SchemaIndex]:
+    """Load the packaged artifact of an API version, if there is a usable one."""
+    artifact_name = _load_manifest().get(api_version)
+    if artifact_name is None:
+        return None
+
+    # Versions with identical schemas share one artifact and its tables
+    data = _artifact_data.get(artifact_name)
+    if data is None:
+        try:
+            data = load_artifact(ARTIFACT_DIR / artifact_name).to_data()
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(
+                "Could not load schema artifact, falling back to JSON",
+                extra={"artifact": artifact_name, "error": str(e)},
+            )
+            return None
+        _artifact_data[artifact_name] = data
+    return SchemaIndex(data, api_version)
+
+
+def get_schema_index(
+    api_version: str, schema_dir: Optional[Union[str, Path]] = None
+) -> Optional[SchemaIndex]:
+    """Get the schema index of an API version, loading it on first use.
+
+    An explicit ``schema_dir`` or ``SHOPIFY_PARTNERS_SCHEMA_DIR`` takes
+    precedence. Otherwise the precompiled artifact shipped with the package
+    is used, falling back to the introspection JSON of a source checkout.
+    Indexes are cached per version and directory for the life of the process.
+
+    Args:
+        api_version: API version (e.g. '2025-04')
+        schema_dir: Directory containing ``<version>/introspection.json``
+
+    Returns:
+        Schema index, or None if no schema is available for the version
+    """
+    key = (api_version, str(schema_dir) if schema_dir else None)
+    with _indexes_lock:
+        if key in _indexes:
+            return _indexes[key]
+
+        index = None
+        if not schema_dir and not os.environ.get(SCHEMA_DIR_ENV_VAR):
+            index = _load_packaged_index(api_version)
+        if index is None:
+            path = find_introspection_file(api_version, schema_dir)
+            if path is not None:
+                index = SchemaIndex.from_file(path, api_version)
+        if index is None:
+            logger.debug(
+                "No schema available for API version",
+                extra={"api_version": api_version},
+            )
+        _indexes[key] = index
+        return index
+
+
+def clear_schema_cache() -> None:
+    """Forget all loaded schema indexes."""
+    global _manifest
+    with _indexes_lock:
+        _indexes.clear()
+        _artifact_data.clear()
+        _manifest = None
@@ -0,0 +1,499 @@
+"""Offline validation of GraphQL documents against a schema index."""
+
+import re
+from threading import Lock
+from typing import Any, Optional, Union
+
+from shopify_partners_sdk.exceptions.graphql import (
+    GraphQLMultipleErrors,
+    GraphQLSyntaxError,
+    GraphQLValidationError,
+)
+
+from .index import SchemaIndex, named_type
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<skip>[\s,\ufeff]+|\#[^\n\r]*)
+    |(?P<spread>\.\.\.)
+    |(?P<block>\"\"\"(?:\\\"\"\"|[^"]|"(?!""))*\"\"\")
+    |(?P<string>"(?:\\.|[^"\\\n])*")
+    |(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+    |(?P<name>[_A-Za-z][_0-9A-Za-z]*)
+    |(?P<punct>[!$&():=@\[\]{|}])
+    """,
+    re.VERBOSE,
+)
+
+_COMPOSITE_KINDS = frozenset({"OBJECT", "INTERFACE", "UNION"})
+
+
+class _ParseError(Exception):
+    """Raised by the parser for malformed documents."""
+
+
+class _Field:
+    """Parsed field selection."""
+
+    __slots__ = ("arguments", "name", "selections")
+
+    def __init__(
+        self, name: str, arguments: list[str], selections: Optional[list]
+    ) -> None:
+        self.name = name
+        self.arguments = arguments
+        self.selections = selections
+
+
+class _InlineFragment:
+    """Parsed inline fragment (``... on Type { ... }``)."""
+
+    __slots__ = ("selections", "type_condition")
+
+    def __init__(self, type_condition: Optional[str], selections: list) -> None:
+        self.type_condition = type_condition
+        self.selections = selections
+
+
+class _FragmentSpread:
+    """Parsed named fragment spread (``...Name``)."""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+Selection = Union[_Field, _InlineFragment, _FragmentSpread]
+
+
+class _Parser:
+    """Recursive-descent parser for the executable subset of GraphQL.
+
+    Only the structure needed for validation is kept: operations, field
+    names, argument names, inline fragments, fragment spreads and variable
+    definitions and usages. Values and directives are skipped.
+    """
+
+    def __init__(self, document: str) -> None:
+        self._tokens: list[tuple[str, str]] = []
+        position = 0
+        while position < len(document):
+            match = _TOKEN_RE.match(document, position)
+            if match is None:
+                raise _ParseError(
+                    f"Unexpected character {document[position]!r} at {position}"
+                )
+            if match.lastgroup != "skip":
+                kind = match.lastgroup
+                value = match.group()
+                if kind == "block":
+                    kind = "string"
+                self._tokens.append((kind, value))
+            position = match.end()
+        self._position = 0
+
+        self.operations: list[dict[str, Any]] = []
+        self.fragments: dict[str, tuple[str, list[Selection]]] = {}
+        self._variables_used: set[str] = set()
+
+    def _peek(self) -> tuple[str, str]:
+        if self._position < len(self._tokens):
+            return self._tokens[self._position]
+        return ("eof", "")
+
+    def _next(self) -> tuple[str, str]:
+        token = self._peek()
+        if token[0] == "eof":
+            raise _ParseError("Unexpected end of document")
+        self._position += 1
+        return token
+
+    def _at(self, value: str) -> bool:
+        kind, token = self._peek()
+        return token == value and kind in ("punct", "spread", "name")
+
+    def _expect(self, value: str) -> None:
+        token = self._next()
+        if token[1] != value:
+            raise _ParseError(f"Expected {value!r}, found {token[1]!r}")
+
+    def _name(self) -> str:
+        kind, value = self._next()
+        if kind != "name":
+            raise _ParseError(f"Expected a name, found {value!r}")
+        return value
+
+    def parse(self) -> "_Parser":
+        """Parse the whole document."""
+        if self._peek()[0] == "eof":
+            raise _ParseError("Document contains no operations")
+        while self._peek()[0] != "eof":
+            if self._at("{"):
+                self._add_operation("query", set(), self._selection_set())
+            elif self._at("fragment"):
+                self._next()
+                name = self._name()
+                self._expect("on")
+                type_condition = self._name()
+                self._directives()
+                self.fragments[name] = (type_condition, self._selection_set())
+            elif self._peek()[1] in ("query", "mutation", "subscription"):
+                operation_type = self._next()[1]
+                if self._peek()[0] == "name":
+                    self._next()
+                defined = self._variable_definitions()
+                self._directives()
+                self._add_operation(operation_type, defined, self._selection_set())
+            else:
+                raise _ParseError(f"Unexpected {self._peek()[1]!r}")
+        return self
+
+    def _add_operation(
+        self, operation_type: str, defined: set[str], selections: list[Selection]
+    ) -> None:
+        self.operations.append(
+            {
+                "type": operation_type,
+                "defined": defined,
+                "used": self._variables_used,
+                "selections": selections,
+            }
+        )
+        self._variables_used = set()
+
+    def _variable_definitions(self) -> set[str]:
+        defined: set[str] = set()
+        if not self._at("("):
+            return defined
+        self._next()
+        while not self._at(")"):
+            self._expect("$")
+            defined.add(self._name())
+            self._expect(":")
+            self._type()
+            if self._at("="):
+                self._next()
+                self._value()
+            self._directives()
+        self._next()
+        return defined
+
+    def _type(self) -> None:
+        if self._at("["):
+            self._next()
+            self._type()
+            self._expect("]")
+        else:
+            self._name()
+        if self._at("!"):
+            self._next()
+
+    def _selection_set(self) -> list[Selection]:
+        self._expect("{")
+        selections: list[Selection] = []
+        while not self._at("}"):
+            selections.append(self._selection())
+        self._next()
+        if not selections:
+            raise _ParseError("Selection set must not be empty")
+        return selections
+
+    def _selection(self) -> Selection:
+        if self._at("..."):
+            self._next()
+            if self._at("on"):
+                self._next()
+                type_condition = self._name()
+                self._directives()
+                return _InlineFragment(type_condition, self._selection_set())
+            if self._at("{") or self._at("@"):
+                self._directives()
+                return _InlineFragment(None, self._selection_set())
+            name = self._name()
+            self._directives()
+            return _FragmentSpread(name)
+
+        name = self._name()
+        if self._at(":"):
+            # Aliased field: the second name is the schema field
+            self._next()
+            name = self._name()
+        arguments = self._arguments()
+        self._directives()
+        selections = self._selection_set() if self._at("{") else None
+        return _Field(name, arguments, selections)
+
+    def _arguments(self) -> list[str]:
+        names: list[str] = []
+        if not self._at("("):
+            return names
+        self._next()
+        while not self._at(")"):
+            names.append(self._name())
+            self._expect(":")
+            self._value()
+        self._next()
+        return names
+
+    def _directives(self) -> None:
+        while self._at("@"):
+            self._next()
+            self._name()
+            self._arguments()
+
+    def _value(self) -> None:
+        kind, value = self._next()
+        if value == "$" and kind == "punct":
+            self._variables_used.add(self._name())
+        elif value == "[" and kind == "punct":
+            while not self._at("]"):
+                self._value()
+            self._next()
+        elif value == "{" and kind == "punct":
+            while not self._at("}"):
+                self._name()
+                self._expect(":")
+                self._value()
+            self._next()
+        elif kind not in ("name", "number", "string"):
+            raise _ParseError(f"Unexpected {value!r} in value")
+
+
+class QueryValidator:
+    """Validate GraphQL documents against a schema index without a request.
+
+    Checks that every selected field exists on its parent type, that inline
+    fragment and fragment spread conditions can apply, that arguments exist
+    and required arguments are given, that leaf and composite fields are
+    selected correctly, and that every variable used is defined. Results
+    are cached per document, so validating a compiled query again is a
+    dictionary lookup.
+
+    Example:
+        >>> validator = QueryValidator(get_schema_index('2025-04'))
+        >>> validator.validate('{ app(id: "1") { nmae } }')
+        ("Field 'nmae' doesn't exist on type 'App' (at app.nmae)",)
+    """
+
+    def __init__(self, schema: SchemaIndex, max_cached: int = 1024) -> None:
+        """Initialize the validator.
+
+        Args:
+            schema: Schema index to validate against
+            max_cached: Maximum number of documents whose results are kept
+        """
+        self._schema = schema
+        self._max_cached = max_cached
+        self._results: dict[str, tuple[Optional[str], tuple[str, ...]]] = {}
+        self._lock = Lock()
+
+    @property
+    def schema(self) -> SchemaIndex:
+        """Get the schema index used for validation."""
+        return self._schema
+
+    def validate(self, document: str) -> tuple[str, ...]:
+        """Validate a document.
+
+        Args:
+            document: GraphQL document
+
+        Returns:
+            Error messages (empty if the document is valid)
+        """
+        syntax_error, errors = self._check(document)
+        if syntax_error is not None:
+            return (f"Syntax Error: {syntax_error}",)
+        return errors
+
+    def assert_valid(self, document: str) -> None:
+        """Validate a document and raise on the first problem found.
+
+        Args:
+            document: GraphQL document
+
+        Raises:
+            GraphQLSyntaxError: If the document cannot be parsed
+            GraphQLValidationError: If the document has one validation error
+            GraphQLMultipleErrors: If the document has several validation errors
+        """
+        syntax_error, errors = self._check(document)
+        if syntax_error is not None:
+            raise GraphQLSyntaxError(f"Syntax Error: {syntax_error}")
+        if len(errors) == 1:
+            raise GraphQLValidationError(errors[0])
+        if errors:
+            raise GraphQLMultipleErrors(
+                [GraphQLValidationError(message) for message in errors]
+            )
+
+    def _check(self, document: str) -> tuple[Optional[str], tuple[str, ...]]:
+        """Get the cached result for a document, validating it on a miss."""
+        result = self._results.get(document)
+        if result is not None:
+            return result
+
+        try:
+            parsed = _Parser(document).parse()
+        except _ParseError as e:
+            result = (str(e), ())
+        else:
+            result = (None, tuple(self._validate_document(parsed)))
+
+        with self._lock:
+            if len(self._results) >= self._max_cached:
+                # Drop the oldest entry (dicts keep insertion order)
+                self._results.pop(next(iter(self._results)))
+            self._results[document] = result
+        return result
+
+    def _validate_document(self, parsed: _Parser) -> list[str]:
+        """Validate every operation of a parsed document."""
+        errors: list[str] = []
+        for operation in parsed.operations:
+            root_type = self._schema.root_type(operation["type"])
+            if root_type is None:
+                errors.append(f"Schema does not support {operation['type']} operations")
+                continue
+            self._validate_selections(
+                root_type, operation["selections"], parsed.fragments, "", errors, set()
+            )
+            for variable in sorted(operation["used"] - operation["defined"]):
+                errors.append(f"Variable '${variable}' is not defined")
+        return errors
+
+    def _validate_selections(
+        self,
+        parent_type: str,
+        selections: list[Selection],
+        fragments: dict[str, tuple[str, list[Selection]]],
+        path: str,
+        errors: list[str],
+        visiting: set[str],
+    ) -> None:
+        """Validate a selection set on a parent type, recursing into children."""
+        schema = self._schema
+        for selection in selections:
+            if isinstance(selection, _Field):
+                field_path = f"{path}.{selection.name}" if path else selection.name
+                location = f" (at {field_path})"
+
+                if selection.name == "__typename":
+                    if selection.selections:
+                        errors.append(
+                            f"Selections can't be made on '__typename'{location}"
+                        )
+                    continue
+
+                field = schema.get_field(parent_type, selection.name)
+                if field is None:
+                    errors.append(
+                        f"Field '{selection.name}' doesn't exist on type "
+                        f"'{parent_type}'{location}"
+                    )
+                    continue
+
+                type_ref, arguments, required = field
+                for argument in selection.arguments:
+                    if argument not in arguments:
+                        errors.append(
+                            f"Field '{selection.name}' doesn't accept argument "
+                            f"'{argument}'{location}"
+                        )
+                for argument in required:
+                    if argument not in selection.arguments:
+                        errors.append(
+                            f"Field '{selection.name}' is missing required "
+                            f"argument '{argument}'{location}"
+                        )
+
+                field_type = named_type(type_ref)
+                if schema.get_type_kind(field_type) in _COMPOSITE_KINDS:
+                    if not selection.selections:
+                        errors.append(
+                            f"Field '{selection.name}' of type '{field_type}' "
+                            f"must have a selection of subfields{location}"
+                        )
+                    else:
+                        self._validate_selections(
+                            field_type,
+                            selection.selections,
+                            fragments,
+                            field_path,
+                            errors,
+                            visiting,
+                        )
+                elif selection.selections:
+                    errors.append(
+                        f"Selections can't be made on field '{selection.name}' "
+                        f"of type '{field_type}'{location}"
+                    )
+
+            elif isinstance(selection, _InlineFragment):
+                condition = selection.type_condition or parent_type
+                if self._check_condition(condition, parent_type, path, errors):
+                    self._validate_selections(
+                        condition,
+                        selection.selections,
+                        fragments,
+                        path,
+                        errors,
+                        visiting,
+                    )
+
+            else:
+                fragment = fragments.get(selection.name)
+                if fragment is None:
+                    errors.append(
+                        f"Fragment '{selection.name}' was used, but not defined"
+                    )
+                    continue
+                if selection.name in visiting:
+                    errors.append(f"Fragment '{selection.name}' spreads itself")
+                    continue
+                condition, fragment_selections = fragment
+                if self._check_condition(condition, parent_type, path, errors):
+                    visiting.add(selection.name)
+                    self._validate_selections(
+                        condition,
+                        fragment_selections,
+                        fragments,
+                        path,
+                        errors,
+                        visiting,
+                    )
+                    visiting.discard(selection.name)
+
+    def _check_condition(
+        self, condition: str, parent_type: str, path: str, errors: list[str]
+    ) -> bool:
+        """Check that a fragment type condition can apply inside a parent type."""
+        location = f" (at {path})" if path else ""
+        if not self._schema.has_type(condition):
+            errors.append(
+                f"No such type '{condition}', so it can't be a fragment "
+                f"condition{location}"
+            )
+            return False
+        if not set(self._schema.get_possible_types(condition)) & set(
+            self._schema.get_possible_types(parent_type)
+        ):
+            errors.append(
+                f"Fragment on '{condition}' can't be spread inside "
+                f"'{parent_type}'{location}"
+            )
+            return False
+        return True
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get validator statistics.
+
+        Returns:
+            Dictionary with validator statistics
+        """
+        return {
+            "api_version": self._schema.api_version,
+            "cached_documents": len(self._results),
+            "max_cached": self._max_cached,
+        }
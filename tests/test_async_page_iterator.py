@@ -0,0 +1,104 @@
+"""Tests for the async page iterator."""
+
+import asyncio
+
+import pytest
+
+from shopify_partners_sdk.models.base import Connection, Edge, PageInfo
+from shopify_partners_sdk.pagination import AsyncNodeIterator, AsyncPageIterator
+
+
+class _Edge(Edge):
+    node: int
+
+
+class _Connection(Connection):
+    edges: list[_Edge]
+
+
+def _page(number: int, has_next: bool) -> _Connection:
+    return _Connection(
+        page_info=PageInfo(has_next_page=has_next, has_previous_page=False),
+        edges=[_Edge(cursor=f"c{number}", node=number)],
+    )
+
+
+class _FetchError(Exception):
+    pass
+
+
+def _fetcher(pages: int, fail_on: int = 0):
+    """Fetch function returning ``pages`` pages, raising on page ``fail_on``."""
+    calls = []
+
+    async def fetch(**args):
+        calls.append(args)
+        number = len(calls)
+        if number == fail_on:
+            raise _FetchError(f"page {number}")
+        return _page(number, number < pages)
+
+    return fetch, calls
+
+
+async def _collect(iterator) -> list[int]:
+    return [page.edges[0].node async for page in iterator]
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_iterates_all_pages_following_cursors(read_ahead):
+    fetch, calls = _fetcher(pages=3)
+
+    pages = asyncio.run(_collect(AsyncPageIterator(fetch, {}, read_ahead=read_ahead)))
+
+    assert pages == [1, 2, 3]
+    assert [call.get("after") for call in calls] == [None, "c1", "c2"]
+
+
+@pytest.mark.parametrize("read_ahead", [0, 2])
+def test_fetch_error_is_raised_after_earlier_pages(read_ahead):
+    fetch, _ = _fetcher(pages=5, fail_on=2)
+    received = []
+
+    async def consume():
+        iterator = AsyncPageIterator(fetch, {}, read_ahead=read_ahead)
+        with pytest.raises(_FetchError):
+            async for page in iterator:
+                received.append(page.edges[0].node)
+        # The iteration is over once the error was raised
+        with pytest.raises(StopAsyncIteration):
+            await iterator.__anext__()
+
+    asyncio.run(asyncio.wait_for(consume(), timeout=5))
+
+    assert received == [1]
+
+
+def test_node_iterator_raises_fetch_error():
+    fetch, _ = _fetcher(pages=3, fail_on=3)
+
+    async def consume():
+        nodes = []
+        with pytest.raises(_FetchError):
+            async for node in AsyncNodeIterator(
+                AsyncPageIterator(fetch, {}, read_ahead=1)
+            ):
+                nodes.append(node)
+        return nodes
+
+    assert asyncio.run(asyncio.wait_for(consume(), timeout=5)) == [1, 2]
+
+
+@pytest.mark.parametrize("read_ahead", [0, 1])
+def test_anext_after_aclose_ends_iteration(read_ahead):
+    fetch, _ = _fetcher(pages=10)
+
+    async def consume():
+        iterator = AsyncPageIterator(fetch, {}, read_ahead=read_ahead)
+        await iterator.__anext__()
+        await iterator.aclose()
+        with pytest.raises(StopAsyncIteration):
+            await iterator.__anext__()
+        assert not iterator.has_more_pages
+
+    asyncio.run(asyncio.wait_for(consume(), timeout=5))
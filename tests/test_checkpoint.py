@@ -0,0 +1,133 @@
+"""Tests for resumable, checkpointed pagination."""
+
+import os
+from pathlib import Path
+import stat
+
+import pytest
+
+from shopify_partners_sdk.models.base import Connection, Edge, PageInfo
+from shopify_partners_sdk.pagination import (
+    CheckpointStore,
+    FileCheckpointStore,
+    MemoryCheckpointStore,
+    PaginatedResult,
+    PaginationCheckpoint,
+    SQLiteCheckpointStore,
+)
+
+
+class _Edge(Edge):
+    node: int
+
+
+class _Connection(Connection):
+    edges: list[_Edge]
+
+
+class _FetchError(Exception):
+    pass
+
+
+def _fetcher(pages: int, fail_on: int = 0):
+    """Fetch function serving ``pages`` pages by cursor, failing on ``fail_on``."""
+    calls = []
+
+    def fetch(**args):
+        calls.append(args)
+        after = args.get("after")
+        number = int(after[1:]) + 1 if after else 1
+        if number == fail_on:
+            raise _FetchError(f"page {number}")
+        return _Connection(
+            page_info=PageInfo(has_next_page=number < pages, has_previous_page=False),
+            edges=[_Edge(cursor=f"c{number}", node=number)],
+        )
+
+    return fetch, calls
+
+
+def _result(fetch, store: CheckpointStore) -> PaginatedResult:
+    return PaginatedResult(fetch, {}, checkpoint_store=store, checkpoint_key="k")
+
+
+def test_page_is_committed_when_the_next_one_is_requested() -> None:
+    store = MemoryCheckpointStore()
+    fetch, _ = _fetcher(pages=3)
+    pages = _result(fetch, store).pages()
+
+    next(pages)
+    assert store.load_checkpoint("k") is None
+    next(pages)
+    assert store.load_checkpoint("k").cursor == "c1"
+    next(pages)
+    with pytest.raises(StopIteration):
+        next(pages)
+
+    checkpoint = store.load_checkpoint("k")
+    assert (checkpoint.pages, checkpoint.items, checkpoint.has_more) == (3, 3, False)
+
+
+def test_resumes_from_the_stored_cursor() -> None:
+    store = MemoryCheckpointStore()
+    store.save_checkpoint("k", PaginationCheckpoint(cursor="c2", pages=2, items=2))
+    fetch, calls = _fetcher(pages=4)
+
+    numbers = [page.edges[0].node for page in _result(fetch, store).pages()]
+
+    assert numbers == [3, 4]
+    assert calls[0]["after"] == "c2"
+    assert store.load_checkpoint("k").pages == 4
+
+
+def test_failed_fetch_leaves_the_checkpoint_resumable() -> None:
+    store = MemoryCheckpointStore()
+    fetch, _ = _fetcher(pages=4, fail_on=3)
+    received = []
+
+    with pytest.raises(_FetchError):
+        for page in _result(fetch, store).pages():
+            received.append(page.edges[0].node)
+
+    assert received == [1, 2]
+    assert store.load_checkpoint("k").cursor == "c2"
+
+    fetch, calls = _fetcher(pages=4)
+    numbers = [page.edges[0].node for page in _result(fetch, store).pages()]
+    assert numbers == [3, 4]
+    assert calls[0]["after"] == "c2"
+
+
+@pytest.mark.parametrize("store_type", [FileCheckpointStore, SQLiteCheckpointStore])
+def test_persistent_stores_round_trip(store_type: type, tmp_path: Path) -> None:
+    path = tmp_path / "checkpoints"
+    if store_type is SQLiteCheckpointStore:
+        path = tmp_path / "checkpoints.db"
+    store = store_type(path)
+
+    store.save_checkpoint("k", PaginationCheckpoint(cursor="c1", pages=1, items=5))
+    reopened = store_type(path)
+
+    assert (
+        reopened.load_checkpoint("k").to_dict() == store.load_checkpoint("k").to_dict()
+    )
+    reopened.delete("k")
+    assert reopened.load_checkpoint("k") is None
+
+
+def test_file_store_syncs_the_directory_after_replacing(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = FileCheckpointStore(tmp_path)
+    synced = []
+    fsync = os.fsync
+
+    def record(fd: int) -> None:
+        synced.append(stat.S_ISDIR(os.fstat(fd).st_mode))
+        fsync(fd)
+
+    monkeypatch.setattr(os, "fsync", record)
+    store.save("k", {"cursor": "c1"})
+
+    assert synced[-1] is True
+    assert list(tmp_path.iterdir()) == [store._path("k")]
@@ -0,0 +1,131 @@
+"""Tests for the client facades and the async base client."""
+
+import asyncio
+import json
+import logging
+
+import httpx
+import pytest
+
+from shopify_partners_sdk import AsyncShopifyPartnersClient, ShopifyPartnersClient
+from shopify_partners_sdk.client.async_base import AsyncBaseGraphQLClient
+from shopify_partners_sdk.client.base import BaseGraphQLClient
+from shopify_partners_sdk.client.rate_limiter import CostAwareRateLimiter
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.exceptions.auth import UnauthorizedError
+from shopify_partners_sdk.queries.fields import FieldSelector
+
+
+def _settings(**values: object) -> ShopifyPartnersSDKSettings:
+    return ShopifyPartnersSDKSettings(
+        api_version="2025-01",
+        entity_store=True,
+        rate_limit_strategy="cost",
+        **values,
+    )
+
+
+@pytest.mark.parametrize(
+    "client_type", [ShopifyPartnersClient, AsyncShopifyPartnersClient]
+)
+def test_facades_apply_settings(client_type: type) -> None:
+    client = client_type(1, "prtapi_test", settings=_settings())
+    settings = client._client.settings
+
+    assert settings.entity_store
+    assert settings.api_version == "2025-01"
+    assert settings.organization_id == 1
+    assert isinstance(client._client.rate_limiter, CostAwareRateLimiter)
+    assert client._client.entity_store is not None
+
+
+def test_explicit_api_version_overrides_settings() -> None:
+    client = ShopifyPartnersClient(1, "prtapi_test", "2025-07", settings=_settings())
+
+    assert client._client.settings.api_version == "2025-07"
+
+
+@pytest.mark.parametrize(
+    "client_type", [ShopifyPartnersClient, AsyncShopifyPartnersClient]
+)
+def test_from_settings(client_type: type) -> None:
+    client = client_type.from_settings(
+        _settings(organization_id=7, access_token="prtapi_test")
+    )
+
+    assert client._client.auth.organization_id == 7
+    assert client._client.settings.entity_store
+
+    with pytest.raises(ValueError, match="organization_id"):
+        client_type.from_settings(_settings())
+
+
+@pytest.mark.parametrize(
+    "client_type", [ShopifyPartnersClient, AsyncShopifyPartnersClient]
+)
+def test_facades_expose_organization_and_schema(client_type: type) -> None:
+    client = client_type(7, "prtapi_test", settings=_settings())
+
+    assert client.organization_id == 7
+    assert client.schema is client._field_based.schema
+    assert client.schema.get_argument_type("App", "events", "first") == "Int"
+
+    untyped = client_type(7, "prtapi_test", settings=_settings(use_schema=False))
+    assert untyped.schema is None
+
+
+def _async_client(handler) -> AsyncBaseGraphQLClient:
+    transport = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return AsyncBaseGraphQLClient(
+        1, "prtapi_test", ShopifyPartnersSDKSettings(), http_client=transport
+    )
+
+
+def test_async_client_executes_queries() -> None:
+    payloads = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        payloads.append(json.loads(request.content))
+        return httpx.Response(200, json={"data": {"app": {"id": "1"}}})
+
+    client = _async_client(handler)
+    result = asyncio.run(client.execute_query("query Q { app { id } }", None, "Q"))
+
+    assert result["data"] == {"app": {"id": "1"}}
+    assert payloads == [{"query": "query Q { app { id } }", "operationName": "Q"}]
+
+
+def test_async_client_maps_http_errors() -> None:
+    client = _async_client(lambda request: httpx.Response(401))
+
+    with pytest.raises(UnauthorizedError):
+        asyncio.run(client.execute_query("{ app { id } }"))
+
+
+def test_async_client_is_not_a_blocking_context_manager() -> None:
+    assert not issubclass(AsyncBaseGraphQLClient, BaseGraphQLClient)
+    client = AsyncBaseGraphQLClient(1, "prtapi_test")
+
+    with pytest.raises((TypeError, AttributeError)), client:  # type: ignore[attr-defined]
+        pass
+
+    async def run() -> None:
+        async with client:
+            pass
+
+    asyncio.run(run())
+    assert client._http_client.is_closed
+
+
+def test_field_based_queries_log_at_debug_level(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    client = ShopifyPartnersClient(1, "prtapi_test")
+    client._client.execute_query = lambda *args, **kwargs: {"data": {"app": None}}
+    fields = FieldSelector().add_field("id")
+
+    with caplog.at_level(logging.DEBUG, "shopify_partners_sdk"):
+        client.query("app", fields, id="1")
+
+    record = next(r for r in caplog.records if r.message == "Executing dynamic query")
+    assert record.query_name == "app"
@@ -0,0 +1,110 @@
+"""Tests for single-flight coalescing of identical queries."""
+
+import asyncio
+import gc
+import threading
+import time
+from typing import Any, Optional
+
+import pytest
+
+from shopify_partners_sdk.client.base import BaseGraphQLClient
+from shopify_partners_sdk.client.coalescing import (
+    AsyncSingleFlight,
+    operation_type,
+    request_key,
+)
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+
+MULTI_OPERATION = """
+query ReadApp { app(id: "1") { id } }
+mutation CreateCredit { appCreditCreate(appId: "1") { userErrors { message } } }
+"""
+
+
+@pytest.mark.parametrize(
+    ("query", "operation_name", "expected"),
+    [
+        ("{ app { id } }", None, "query"),
+        ("query Q { app { id } }", None, "query"),
+        ("# comment\nmutation M { a }", None, "mutation"),
+        ('query Q { a(s: "mutation {") }', None, "query"),
+        (MULTI_OPERATION, "ReadApp", "query"),
+        (MULTI_OPERATION, "CreateCredit", "mutation"),
+        (MULTI_OPERATION, None, None),
+        ("query Q { a } fragment F on App { id }", None, "query"),
+    ],
+)
+def test_operation_type(
+    query: str, operation_name: Optional[str], expected: Optional[str]
+) -> None:
+    assert operation_type(query, operation_name) == expected
+
+
+def test_selected_mutation_is_not_coalesced() -> None:
+    assert request_key("e", MULTI_OPERATION, None, "CreateCredit") is None
+    assert request_key("e", MULTI_OPERATION, None, "ReadApp") is not None
+
+
+def test_coalesced_callers_get_normalized_independent_copies() -> None:
+    settings = ShopifyPartnersSDKSettings(coalesce_requests=True, entity_store=True)
+    client = BaseGraphQLClient(1, "prtapi_test", settings)
+    release = threading.Event()
+
+    def send_query(*args: Any) -> dict[str, Any]:
+        release.wait(5)
+        app = {"id": "gid://partners/App/1", "name": "App"}
+        return {"data": {"a": app, "b": {"id": "gid://partners/App/1"}}}
+
+    client._send_query = send_query
+    results: list[dict[str, Any]] = []
+
+    def run() -> None:
+        results.append(client.execute_query("{ a { id name } b { id } }"))
+
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    while client._single_flight.coalesced < 2:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(results) == 3
+    for result in results:
+        # Normalized before sharing: the store holds both selections merged
+        assert result["data"]["b"] == {"id": "gid://partners/App/1"}
+    assert client.entity_store.get("gid://partners/App/1")["name"] == "App"
+    results[0]["data"]["a"]["name"] = "Changed"
+    assert results[1]["data"]["a"]["name"] == "App"
+    assert results[2]["data"]["a"]["name"] == "App"
+
+
+def test_error_of_abandoned_async_call_is_retrieved() -> None:
+    errors: list[dict[str, Any]] = []
+
+    async def fail() -> None:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def run() -> None:
+        asyncio.get_running_loop().set_exception_handler(
+            lambda loop, context: errors.append(context)
+        )
+        flight = AsyncSingleFlight()
+        caller = asyncio.ensure_future(flight.do("key", fail))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0.05)
+        gc.collect()
+
+    asyncio.run(run())
+
+    assert errors == []
+
+
+def test_coalescing_is_opt_in() -> None:
+    client = BaseGraphQLClient(1, "prtapi_test", ShopifyPartnersSDKSettings())
+
+    assert client._coalescing_key("{ app { id } }", None, None) is None
@@ -0,0 +1,107 @@
+"""Tests for the normalized entity store."""
+
+import time
+from typing import Any
+
+import pytest
+
+from shopify_partners_sdk import ShopifyPartnersClient
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.models import EntityStore
+from shopify_partners_sdk.queries.fields import FieldSelector
+
+APP_ID = "gid://partners/App/1"
+
+
+def _response(name: str) -> dict[str, Any]:
+    return {"app": {"id": APP_ID, "name": name}}
+
+
+def test_store_is_bounded_least_recently_used_first() -> None:
+    store = EntityStore(max_entities=3)
+    for number in range(10):
+        store.normalize({"transaction": {"id": f"gid://partners/Transaction/{number}"}})
+        # Keep the first transaction in use
+        store.get("gid://partners/Transaction/0")
+
+    assert len(store) == 3
+    assert "gid://partners/Transaction/0" in store
+    assert "gid://partners/Transaction/9" in store
+    assert store.get_stats()["evictions"] == 7
+
+
+def test_invalid_size_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        EntityStore(max_entities=0)
+
+
+def test_responses_do_not_share_objects_with_the_store() -> None:
+    store = EntityStore()
+    first = store.normalize(_response("Before"))
+    store.normalize(_response("After"))
+
+    assert first["app"]["name"] == "Before"
+    assert store.get(APP_ID) == {"id": APP_ID, "name": "After"}
+
+    store.get(APP_ID)["name"] = "Changed"
+    store.lookup(APP_ID, FieldSelector().add_field("name"))["name"] = "Changed"
+    assert store.get(APP_ID)["name"] == "After"
+
+
+def test_identical_objects_are_shared_within_a_response() -> None:
+    store = EntityStore()
+    data = store.normalize(
+        {"a": {"id": APP_ID, "name": "App"}, "b": [{"id": APP_ID, "name": "App"}]}
+    )
+
+    assert data["a"] is data["b"][0]
+
+
+def test_diverging_selections_of_one_object_are_kept_apart() -> None:
+    store = EntityStore()
+    edges = [{"cursor": str(number)} for number in range(1, 6)]
+    data = store.normalize(
+        {
+            "a0": {"id": APP_ID, "name": "App", "events": {"edges": edges}},
+            "a1": {"id": APP_ID, "events": {"edges": edges[:1]}},
+        }
+    )
+
+    assert len(data["a0"]["events"]["edges"]) == 5
+    assert data["a1"] == {"id": APP_ID, "events": {"edges": [{"cursor": "1"}]}}
+    # The store merges both occurrences, the later one winning
+    assert store.get(APP_ID) == {
+        "id": APP_ID,
+        "name": "App",
+        "events": {"edges": [{"cursor": "1"}]},
+    }
+
+
+def test_lookup_expires() -> None:
+    store = EntityStore()
+    store.normalize(_response("App"))
+    fields = FieldSelector().add_fields("id", "name")
+
+    assert store.lookup(APP_ID, fields, max_age=60) is not None
+    time.sleep(0.01)
+    assert store.lookup(APP_ID, fields, max_age=0.005) is None
+
+
+@pytest.mark.parametrize(("lookups", "served"), [(False, False), (True, True)])
+def test_cache_first_reads_are_opt_in(lookups: bool, served: bool) -> None:
+    client = ShopifyPartnersClient(organization_id=1, access_token="prtapi_test")
+    base = client._client
+    base._settings = ShopifyPartnersSDKSettings(
+        entity_store=True, entity_store_lookups=lookups
+    )
+    base._entity_store = EntityStore()
+    base._entity_store.normalize(_response("App"))
+
+    builder = client._field_based.query(
+        "app", FieldSelector().add_fields("id", "name"), id=APP_ID
+    )
+    stored = client._field_based._lookup_stored(builder)
+
+    assert client.entity_store is base._entity_store
+
+    assert (stored is not None) is served
@@ -0,0 +1,103 @@
+"""Tests for field selectors."""
+
+import copy
+import pickle
+
+from shopify_partners_sdk.queries.fields import (
+    CommonFields,
+    FieldSelector,
+    FrozenFieldSelector,
+)
+
+
+def _selector() -> tuple[FieldSelector, FieldSelector]:
+    node = FieldSelector().add_fields("id", "name")
+    root = FieldSelector().add_field("id").add_connection_field("events", node)
+    return root, node
+
+
+def test_fingerprint_is_memoized_until_modified():
+    root, _ = _selector()
+
+    first = root.fingerprint()
+
+    assert root.fingerprint() is first
+    root.add_field("name")
+    assert root.fingerprint() != first
+
+
+def test_fingerprint_follows_changes_to_nested_selections():
+    root, node = _selector()
+    before = root.fingerprint()
+
+    node.add_field("apiKey")
+
+    assert root.fingerprint() != before
+    assert root.fingerprint() == root.copy().fingerprint()
+
+
+def test_unrelated_changes_keep_the_memo():
+    root, _ = _selector()
+    first = root.fingerprint()
+
+    other, other_node = _selector()
+    other.add_field("name")
+    other_node.add_field("apiKey")
+
+    assert root.fingerprint() is first
+
+
+def test_shared_nested_selection_invalidates_every_parent():
+    shared = FieldSelector().add_field("id")
+    first = FieldSelector().add_nested_field("app", shared)
+    second = FieldSelector().add_nested_field("apps", shared)
+    before = (first.fingerprint(), second.fingerprint())
+
+    shared.add_field("name")
+
+    assert (first.fingerprint(), second.fingerprint()) != before
+    assert "name" in first.build_compact()
+    assert "name" in second.build_compact()
+
+
+def test_replaced_nested_selection_no_longer_invalidates():
+    old = FieldSelector().add_field("id")
+    root = FieldSelector().add_nested_field("app", old)
+    root.add_nested_field("app", FieldSelector().add_field("name"))
+    memo = root.fingerprint()
+
+    old.add_field("apiKey")
+
+    assert root.fingerprint() is memo
+
+
+def test_copies_track_nested_changes():
+    root, _ = _selector()
+    for clone in (root.copy(), copy.deepcopy(root), pickle.loads(pickle.dumps(root))):
+        before = clone.fingerprint()
+        events = clone._fields["events"]
+        events._fields["edges"]._fields["node"].add_field("apiKey")
+        assert clone.fingerprint() != before
+        assert clone.fingerprint() != root.fingerprint()
+
+    frozen = root.freeze()
+    assert pickle.loads(pickle.dumps(frozen)) is frozen
+
+
+def test_common_fields_are_mutable_by_default():
+    fields = CommonFields.basic_app()
+    fields.add_field("apiKey")
+
+    assert "apiKey" in fields.build_compact()
+    assert "apiKey" not in CommonFields.basic_app().build_compact()
+
+
+def test_frozen_common_fields_are_shared_and_unchanged_by_add():
+    shared = CommonFields.basic_app(frozen=True)
+
+    extended = shared.add_field("apiKey")
+
+    assert isinstance(shared, FrozenFieldSelector)
+    assert CommonFields.basic_app(frozen=True) is shared
+    assert "apiKey" not in shared.build_compact()
+    assert "apiKey" in extended.build_compact()
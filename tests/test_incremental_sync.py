@@ -0,0 +1,88 @@
+"""Tests for incremental app event sync."""
+
+from typing import Any, Optional
+
+from shopify_partners_sdk import ShopifyPartnersClient
+from shopify_partners_sdk.pagination import IncrementalSync, MemoryCheckpointStore
+from shopify_partners_sdk.queries.fields import FieldSelector
+from shopify_partners_sdk.schema import get_schema_index
+from shopify_partners_sdk.schema.validator import QueryValidator
+
+
+def _event(number: int) -> dict[str, Any]:
+    return {
+        "cursor": f"c{number}",
+        "node": {
+            "type": "CREDIT_APPLIED",
+            "occurredAt": f"2024-01-01T00:00:{number:02d}Z",
+        },
+    }
+
+
+def _client(pages: list[list[dict]], requests: list) -> ShopifyPartnersClient:
+    client = ShopifyPartnersClient(organization_id=1, access_token="prtapi_test")
+
+    def execute_raw(
+        query: str,
+        variables: Optional[dict[str, Any]] = None,
+        operation_name: Optional[str] = None,
+        priority: Any = None,
+    ) -> dict[str, Any]:
+        requests.append((query, variables, operation_name))
+        index = len(requests) - 1
+        return {
+            "data": {
+                "app": {
+                    "events": {
+                        "edges": pages[index],
+                        "pageInfo": {"hasNextPage": index + 1 < len(pages)},
+                    }
+                }
+            }
+        }
+
+    client.execute_raw = execute_raw
+    return client
+
+
+def test_app_events_pass_filters_as_typed_variables():
+    requests: list = []
+    client = _client([[_event(1), _event(2)], [_event(3)]], requests)
+    sync = IncrementalSync(client, MemoryCheckpointStore(), page_size=2)
+
+    events = list(
+        sync.app_events(
+            "gid://partners/App/1",
+            FieldSelector().add_field("type"),
+            types=["CREDIT_APPLIED"],
+        )
+    )
+
+    assert [event["occurredAt"][-3:-1] for event in events] == ["01", "02", "03"]
+    (first_query, first_vars, _), (second_query, second_vars, _) = requests
+    # Every page reuses one document; only the variables change
+    assert first_query == second_query
+    assert "CREDIT_APPLIED" not in first_query
+    assert first_vars["types"] == ["CREDIT_APPLIED"]
+    assert first_vars["after"] is None
+    assert second_vars["after"] == "c2"
+
+    validator = QueryValidator(get_schema_index("2025-04"))
+    assert validator.validate(first_query) == ()
+
+
+def test_app_events_resume_from_watermark():
+    requests: list = []
+    client = _client([[_event(1), _event(2)]], requests)
+    store = MemoryCheckpointStore()
+    fields = FieldSelector().add_field("type")
+    list(IncrementalSync(client, store).app_events("gid://partners/App/1", fields))
+
+    requests.clear()
+    client = _client([[_event(2), _event(3)]], requests)
+    events = list(
+        IncrementalSync(client, store).app_events("gid://partners/App/1", fields)
+    )
+
+    assert requests[0][1]["occurredAtMin"] == "2024-01-01T00:00:02Z"
+    assert [event["occurredAt"] for event in events] == ["2024-01-01T00:00:03Z"]
@@ -0,0 +1,156 @@
+"""Tests for the shared token bucket backends and the rate limit coordinator."""
+
+from collections.abc import Iterator
+from pathlib import Path
+import socket
+import stat
+
+import pytest
+
+from shopify_partners_sdk.client.base import BaseGraphQLClient
+from shopify_partners_sdk.client.coordinator import RateLimitCoordinator, main
+from shopify_partners_sdk.client.limiter_backends import (
+    FileLockBucketBackend,
+    SharedRateLimiter,
+    SocketBucketBackend,
+)
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.exceptions.auth import AuthenticationError
+
+SECRET = "s3cret"
+
+
+@pytest.fixture
+def coordinator() -> Iterator[RateLimitCoordinator]:
+    with RateLimitCoordinator(SECRET, port=0) as coordinator:
+        yield coordinator
+
+
+@pytest.fixture
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+def test_file_backend_shares_one_bucket(tmp_path: Path) -> None:
+    path = tmp_path / "bucket"
+    first, second = FileLockBucketBackend(path), FileLockBucketBackend(path)
+
+    assert first.reserve(2.0, rate=1.0, capacity=2.0) == (True, 0.0)
+    granted, wait_time = second.reserve(1.0, rate=1.0, capacity=2.0, max_wait=0.1)
+
+    assert not granted
+    assert wait_time == pytest.approx(1.0, abs=0.05)
+    second.refund(2.0, rate=1.0, capacity=2.0)
+    assert first.available(rate=1.0, capacity=2.0) == pytest.approx(2.0)
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+
+
+def test_default_bucket_files_are_private_and_per_organization(
+    cache_home: Path,
+) -> None:
+    settings = ShopifyPartnersSDKSettings(rate_limit_backend="file")
+
+    paths = {
+        organization_id: BaseGraphQLClient(
+            organization_id, "prtapi_test", settings
+        ).rate_limiter.backend.path
+        for organization_id in (1, 2)
+    }
+
+    assert paths[1] != paths[2]
+    assert paths[1].parent.is_relative_to(cache_home)
+    assert stat.S_IMODE(paths[1].parent.stat().st_mode) == 0o700
+
+
+def test_socket_backend_shares_buckets_per_key(
+    coordinator: RateLimitCoordinator,
+) -> None:
+    first = SocketBucketBackend(coordinator.address, SECRET, key="1")
+    second = SocketBucketBackend(coordinator.address, SECRET, key="1")
+    other = SocketBucketBackend(coordinator.address, SECRET, key="2")
+
+    assert first.reserve(2.0, rate=1.0, capacity=2.0) == (True, 0.0)
+    assert not second.reserve(1.0, rate=1.0, capacity=2.0, max_wait=0.1)[0]
+    assert other.reserve(2.0, rate=1.0, capacity=2.0) == (True, 0.0)
+
+    second.reset()
+    assert first.available(rate=1.0, capacity=2.0) == 2.0
+    for backend in (first, second, other):
+        backend.close()
+
+
+def test_client_socket_backend_uses_the_client_organization(
+    coordinator: RateLimitCoordinator,
+) -> None:
+    settings = ShopifyPartnersSDKSettings(
+        rate_limit_backend="socket",
+        rate_limit_coordinator=coordinator.address,
+        rate_limit_coordinator_secret=SECRET,
+    )
+    limiter = BaseGraphQLClient(42, "prtapi_test", settings).rate_limiter
+
+    assert isinstance(limiter, SharedRateLimiter)
+    assert limiter.try_acquire()
+    assert list(coordinator._buckets) == ["42"]
+
+
+def test_socket_backend_needs_the_secret(coordinator: RateLimitCoordinator) -> None:
+    with pytest.raises(ValueError):
+        SocketBucketBackend(coordinator.address, "")
+
+    backend = SocketBucketBackend(coordinator.address, "wrong", key="1")
+    with pytest.raises(AuthenticationError):
+        backend.reserve(1.0, rate=1.0, capacity=1.0)
+    assert coordinator._buckets == {}
+
+
+def test_coordinator_rejects_unauthenticated_commands(
+    coordinator: RateLimitCoordinator,
+) -> None:
+    host, _, port = coordinator.address.rpartition(":")
+    with socket.create_connection((host, int(port)), timeout=5) as connection:
+        connection.sendall(b"RESERVE k 1 1 1 -\n")
+        reply = connection.makefile("rb").readline()
+
+    assert reply.startswith(b"ERR")
+    assert coordinator._buckets == {}
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["DROP", "k"],
+        ["RESERVE", "k", "1"],
+        ["PEEK", "k", "x", "1"],
+        ["REFUND", "k", "1", "0", "1"],
+    ],
+)
+def test_invalid_commands_do_not_create_buckets(fields: list[str]) -> None:
+    coordinator = RateLimitCoordinator(SECRET, port=0)
+    try:
+        with pytest.raises(ValueError):
+            coordinator.handle_command(fields)
+        assert coordinator._buckets == {}
+    finally:
+        coordinator.shutdown()
+
+
+def test_coordinator_listens_on_localhost_and_needs_a_secret() -> None:
+    with pytest.raises(ValueError):
+        RateLimitCoordinator("", port=0)
+
+    coordinator = RateLimitCoordinator(SECRET, port=0)
+    coordinator.shutdown()
+    assert coordinator.address.startswith("127.0.0.1:")
+
+
+def test_coordinator_command_line_requires_a_secret(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.delenv("SHOPIFY_PARTNERS_RATE_LIMIT_COORDINATOR_SECRET", raising=False)
+    # No .env file to read a secret from
+    monkeypatch.chdir(tmp_path)
+
+    with pytest.raises(SystemExit):
+        main(["--port", "0"])
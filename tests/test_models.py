@@ -0,0 +1,103 @@
+"""Tests for parsing API responses into models."""
+
+from typing import Any, Optional
+
+import pytest
+
+from shopify_partners_sdk.models.objects import (
+    AppEvent,
+    AppEventConnection,
+    LegacyTransaction,
+    ReferralAdjustment,
+    RelationshipInstalled,
+    TaxTransaction,
+    TransactionConnection,
+)
+from shopify_partners_sdk.queries.fields import FieldSelector
+
+PAGE_INFO = {"hasNextPage": False, "hasPreviousPage": False}
+
+
+def _transaction(typename: Optional[str]) -> dict[str, Any]:
+    node = {
+        "id": "gid://partners/Transaction/1",
+        "createdAt": "2024-01-01T00:00:00Z",
+        "amount": {"amount": "1.00", "currencyCode": "USD"},
+    }
+    if typename is not None:
+        node["__typename"] = typename
+    return node
+
+
+def _app_event(typename: Optional[str]) -> dict[str, Any]:
+    node = {
+        "id": "gid://partners/AppEvent/1",
+        "app": {
+            "id": "gid://partners/App/1",
+            "apiKey": "key",
+            "name": "App",
+            "events": {"edges": [], "pageInfo": PAGE_INFO},
+        },
+        "shop": {
+            "id": "gid://partners/Shop/1",
+            "name": "Shop",
+            "myshopifyDomain": "https://shop.myshopify.com",
+        },
+        "occurredAt": "2024-01-01T00:00:00Z",
+        "type": "RELATIONSHIP_INSTALLED",
+    }
+    if typename is not None:
+        node["__typename"] = typename
+    return node
+
+
+def _connection(connection_type: type, nodes: list[dict[str, Any]]):
+    edges = [{"cursor": str(n), "node": node} for n, node in enumerate(nodes)]
+    return connection_type.model_validate({"edges": edges, "pageInfo": PAGE_INFO})
+
+
+def test_transactions_are_parsed_by_typename() -> None:
+    # These types have the same fields, so only __typename tells them apart
+    typenames = ["ReferralAdjustment", "LegacyTransaction", "TaxTransaction"]
+
+    connection = _connection(TransactionConnection, map(_transaction, typenames))
+
+    assert [type(node) for node in connection.transactions] == [
+        ReferralAdjustment,
+        LegacyTransaction,
+        TaxTransaction,
+    ]
+
+
+@pytest.mark.parametrize("typename", [None, "FutureTransaction"])
+def test_transactions_without_a_known_typename_fall_back(
+    typename: Optional[str],
+) -> None:
+    connection = _connection(TransactionConnection, [_transaction(typename)])
+
+    # The first member the fields fit, as without a discriminator
+    assert type(connection.transactions[0]) is TaxTransaction
+
+
+@pytest.mark.parametrize(
+    ("typename", "model"),
+    [
+        ("RelationshipInstalled", RelationshipInstalled),
+        (None, AppEvent),
+        ("FutureEvent", AppEvent),
+    ],
+)
+def test_app_events_are_parsed_by_typename(
+    typename: Optional[str], model: type
+) -> None:
+    connection = _connection(AppEventConnection, [_app_event(typename)])
+
+    assert type(connection.events[0]) is model
+
+
+def test_interface_fields_select_typename_once() -> None:
+    fields = FieldSelector().add_field("id")
+    fields.add_interface_field("AppSaleAdjustment", FieldSelector(["id"]))
+    fields.add_interface_field("TaxTransaction", FieldSelector(["id"]))
+
+    assert fields.build_compact().count("__typename") == 1
@@ -0,0 +1,105 @@
+"""Tests for the synchronous and prefetching page iterators."""
+
+import gc
+
+import pytest
+
+from shopify_partners_sdk.models.base import Connection, Edge, PageInfo
+from shopify_partners_sdk.pagination import (
+    MemoryCheckpointStore,
+    PaginatedResult,
+    PrefetchingPageIterator,
+)
+from shopify_partners_sdk.pagination.iterator import PageIterator
+
+
+class _Edge(Edge):
+    node: int
+
+
+class _Connection(Connection):
+    edges: list[_Edge]
+
+
+class _FetchError(Exception):
+    pass
+
+
+def _fetcher(pages: int, fail_on: int = 0):
+    """Fetch function returning ``pages`` pages, raising on page ``fail_on``."""
+    calls = []
+
+    def fetch(**args):
+        calls.append(args)
+        number = len(calls)
+        if number == fail_on:
+            raise _FetchError(f"page {number}")
+        return _Connection(
+            page_info=PageInfo(has_next_page=number < pages, has_previous_page=False),
+            edges=[_Edge(cursor=f"c{number}", node=number)],
+        )
+
+    return fetch, calls
+
+
+def test_prefetch_delivers_pages_in_order():
+    fetch, calls = _fetcher(pages=4)
+
+    with PrefetchingPageIterator(PageIterator(fetch, {}), depth=2) as pages:
+        numbers = [page.edges[0].node for page in pages]
+
+    assert numbers == [1, 2, 3, 4]
+    assert [call.get("after") for call in calls] == [None, "c1", "c2", "c3"]
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_fetch_error_is_raised_after_earlier_pages(prefetch: int):
+    fetch, _ = _fetcher(pages=5, fail_on=2)
+    received = []
+
+    pages = PaginatedResult(fetch, {}).pages(prefetch=prefetch)
+    with pytest.raises(_FetchError):
+        for page in pages:
+            received.append(page.edges[0].node)
+
+    assert received == [1]
+    with pytest.raises(StopIteration):
+        next(pages)
+
+
+def test_prefetch_commits_checkpoints_as_pages_are_consumed():
+    store = MemoryCheckpointStore()
+    fetch, _ = _fetcher(pages=3)
+
+    pages = PaginatedResult(
+        fetch, {}, checkpoint_store=store, checkpoint_key="k"
+    ).pages(prefetch=2)
+    next(pages)
+    assert store.load_checkpoint("k") is None
+    next(pages)
+    assert store.load_checkpoint("k").pages == 1
+    pages.close()
+
+
+def test_closing_node_iterator_stops_prefetch_worker():
+    fetch, _ = _fetcher(pages=1000)
+
+    with PaginatedResult(fetch, {}).nodes(prefetch=1) as nodes:
+        assert next(nodes) == 1
+        worker = nodes._page_iterator._worker
+
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+
+
+def test_abandoned_prefetching_iterator_stops_its_worker():
+    fetch, _ = _fetcher(pages=1000)
+
+    pages = PaginatedResult(fetch, {}).pages(prefetch=1)
+    next(pages)
+    worker = pages._worker
+    del pages
+    gc.collect()
+
+    worker.join(timeout=5)
+    assert not worker.is_alive()
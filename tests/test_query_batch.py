@@ -0,0 +1,132 @@
+"""Tests for batching root queries into aliased requests."""
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from shopify_partners_sdk import AsyncShopifyPartnersClient, ShopifyPartnersClient
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.mutations.custom_builders import CustomMutationBuilder
+from shopify_partners_sdk.queries import QueryBatch
+from shopify_partners_sdk.queries.fields import FieldSelector
+
+FIELDS = FieldSelector().add_fields("id", "name")
+
+
+def _client(**values: Any) -> ShopifyPartnersClient:
+    return ShopifyPartnersClient(
+        1, "prtapi_test", settings=ShopifyPartnersSDKSettings(**values)
+    )
+
+
+def _apps(client, *app_ids: str) -> QueryBatch:
+    return QueryBatch(
+        client._field_based.query("app", FIELDS, id=app_id) for app_id in app_ids
+    )
+
+
+def test_roots_are_aliased_with_namespaced_variables() -> None:
+    client = _client()
+    batch = _apps(client, "1", "2")
+    batch.add(client._field_based.query("publicApiVersions", FieldSelector(["handle"])))
+
+    query, variables = QueryBatch.build_query(batch.builders)
+
+    assert query == (
+        "query Batch($a0_id:ID!,$a1_id:ID!){a0:app(id:$a0_id){id name} "
+        "a1:app(id:$a1_id){id name} a2:publicApiVersions{handle}}"
+    )
+    assert variables == {"a0_id": "1", "a1_id": "2"}
+
+
+def test_documents_are_reused_for_new_values() -> None:
+    client = _client()
+
+    first, _ = QueryBatch.build_query(_apps(client, "1", "2").builders)
+    second, variables = QueryBatch.build_query(_apps(client, "3", "4").builders)
+
+    assert second is first
+    assert variables == {"a0_id": "3", "a1_id": "4"}
+
+
+def test_chunks_stay_under_the_size_and_cost_ceilings() -> None:
+    client = _client()
+    events = FieldSelector().add_field("type")
+    expensive = FieldSelector().add_connection_field("events", events, first=100)
+    batch = _apps(client, "1", "2", "3", "4", "5")
+    batch.add(client._field_based.query("app", expensive, id="6"))
+    batch.add(client._field_based.query("app", FIELDS, id="7"))
+
+    assert [len(chunk) for chunk in batch.chunks(max_size=2)] == [2, 2, 2, 1]
+    # Each plain lookup costs 1; the events lookup costs 103 on its own
+    assert [len(chunk) for chunk in batch.chunks(max_cost=10)] == [5, 1, 1]
+    with pytest.raises(ValueError):
+        batch.chunks(max_size=0)
+
+
+def test_split_response_returns_each_root_in_order() -> None:
+    builders = _apps(_client(), "1", "2", "3").builders
+
+    results = QueryBatch.split_response(
+        builders, {"a2": {"id": "3"}, "a0": {"id": "1"}, "a1": None}
+    )
+
+    assert results == [{"id": "1"}, None, {"id": "3"}]
+    assert QueryBatch.split_response(builders, None) == [None, None, None]
+
+
+def test_only_queries_can_be_batched() -> None:
+    with pytest.raises(TypeError):
+        QueryBatch().add(CustomMutationBuilder("appCreditCreate"))
+
+
+def _serve_apps(requests: list[dict[str, Any]]):
+    """Answer app lookups, batched or not, with the requested IDs."""
+
+    def execute(query: str, variables: dict[str, Any], **kwargs: Any) -> dict:
+        requests.append(variables)
+        if "id" in variables:
+            return {"data": {"app": {"id": variables["id"]}}}
+        return {
+            "data": {
+                name.removesuffix("_id"): {"id": value}
+                for name, value in variables.items()
+            }
+        }
+
+    return execute
+
+
+def test_query_many_sends_one_request_per_chunk() -> None:
+    client = _client(max_batch_size=2)
+    requests: list[dict[str, Any]] = []
+    client._client.execute_query = _serve_apps(requests)
+
+    apps = client.query_many("app", FIELDS, [{"id": str(n)} for n in range(5)])
+
+    assert apps == [{"id": str(n)} for n in range(5)]
+    assert requests == [
+        {"a0_id": "0", "a1_id": "1"},
+        {"a0_id": "2", "a1_id": "3"},
+        {"id": "4"},
+    ]
+
+
+def test_async_query_many_keeps_the_order() -> None:
+    client = AsyncShopifyPartnersClient(
+        1, "prtapi_test", settings=ShopifyPartnersSDKSettings(max_batch_size=2)
+    )
+    requests: list[dict[str, Any]] = []
+    serve = _serve_apps(requests)
+
+    async def execute(query: str, variables: dict[str, Any], **kwargs: Any) -> dict:
+        return serve(query, variables)
+
+    client._client.execute_query = execute
+    apps = asyncio.run(
+        client.query_many("app", FIELDS, [{"id": str(n)} for n in range(5)])
+    )
+
+    assert apps == [{"id": str(n)} for n in range(5)]
+    assert len(requests) == 3
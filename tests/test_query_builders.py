@@ -0,0 +1,149 @@
+"""Tests for the query and mutation builders."""
+
+import re
+
+import pytest
+
+from shopify_partners_sdk import ShopifyPartnersClient
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.exceptions.graphql import GraphQLValidationError
+from shopify_partners_sdk.mutations.custom_builders import CustomMutationBuilder
+from shopify_partners_sdk.queries.custom_builders import (
+    CustomConnectionQueryBuilder,
+    CustomQueryBuilder,
+)
+from shopify_partners_sdk.queries.fields import FieldSelector
+from shopify_partners_sdk.schema import get_schema_index
+
+_TOKEN_RE = re.compile(r'\.\.\.|"[^"]*"|[$\w.]+|[^\s\w]')
+
+
+def _tokens(document: str) -> list[str]:
+    return _TOKEN_RE.findall(document)
+
+
+def _app_fields() -> FieldSelector:
+    event = FieldSelector().add_field("type").add_field("occurredAt")
+    charge = FieldSelector().add_money_field("amount")
+    return (
+        FieldSelector()
+        .add_fields("id", "name")
+        .add_connection_field("events", event, first=10, types="CREDIT_APPLIED")
+        .add_interface_field("AppSubscriptionCharge", charge)
+    )
+
+
+def test_query_is_minified_by_default() -> None:
+    builder = CustomQueryBuilder("app", _app_fields()).add_variable("id", "1")
+
+    assert builder.build_query() == (
+        "query($id:ID!){app(id:$id){id name events(first:10,"
+        'types:"CREDIT_APPLIED"){edges{cursor node{type occurredAt}}'
+        "pageInfo{hasNextPage hasPreviousPage}}__typename "
+        "... on AppSubscriptionCharge{amount{amount currencyCode}}}}"
+    )
+
+
+@pytest.mark.parametrize(
+    "builder",
+    [
+        CustomQueryBuilder("app", _app_fields(), "App").add_variable("id", "1"),
+        CustomConnectionQueryBuilder("transactions").add_variable("first", 5),
+        CustomMutationBuilder("appCreditCreate").add_variable("appId", "1"),
+    ],
+)
+def test_minified_and_pretty_documents_are_equivalent(builder) -> None:
+    build = getattr(builder, "build_query", None) or builder.build_mutation
+
+    minified, pretty = build(), build(pretty=True)
+
+    assert "\n" not in minified
+    assert "\n" in pretty
+    assert len(minified) < len(pretty)
+    assert _tokens(minified) == _tokens(pretty)
+
+
+def test_compact_selection_matches_the_indented_one() -> None:
+    fields = _app_fields()
+
+    assert _tokens(fields.build_compact()) == _tokens(fields.build())
+    assert fields.freeze().build_compact() == fields.build_compact()
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_client_sends_the_configured_document_mode(pretty: bool) -> None:
+    client = ShopifyPartnersClient(
+        1, "prtapi_test", settings=ShopifyPartnersSDKSettings(pretty_queries=pretty)
+    )
+    sent: list[str] = []
+    client._client.execute_query = lambda query, *args, **kwargs: (
+        sent.append(query) or {"data": {"app": None}}
+    )
+
+    client.query("app", FieldSelector().add_fields("id", "name"), id="1")
+
+    assert ("\n" in sent[0]) is pretty
+
+
+def _client(**values: object) -> ShopifyPartnersClient:
+    settings = ShopifyPartnersSDKSettings(api_version="2025-04", **values)
+    return ShopifyPartnersClient(1, "prtapi_test", settings=settings)
+
+
+def test_variable_types_come_from_the_schema() -> None:
+    field_based = _client()._field_based
+    query = field_based.query(
+        "transactions", FieldSelector().add_field("id"), first=5, types=["X"]
+    )
+    mutation = field_based.mutation(
+        "appCreditCreate", None, appId="1", amount={"amount": "1"}
+    )
+
+    assert query._variable_signature() == (
+        ("first", "Int"),
+        ("types", "[TransactionType!]"),
+    )
+    assert mutation._variable_signature() == (
+        ("appId", "ID!"),
+        ("amount", "MoneyInput!"),
+    )
+
+
+def test_variable_types_are_inferred_without_a_schema() -> None:
+    field_based = _client(use_schema=False)._field_based
+    query = field_based.query(
+        "transactions", FieldSelector().add_field("id"), types=["X"]
+    )
+    mutation = field_based.mutation("appCreditCreate", None, amount={"amount": "1"})
+
+    assert query._variable_signature() == (("types", "[String]"),)
+    assert mutation._variable_signature() == (("amount", "AppCreditCreateInput!"),)
+
+
+@pytest.mark.parametrize(
+    ("root_field", "variables", "message"),
+    [
+        ("transactions", {"frist": 5}, "doesn't accept argument 'frist'"),
+        ("apps", {"first": 5}, "Field 'apps' doesn't exist"),
+    ],
+)
+def test_unknown_root_fields_and_arguments_fail_before_sending(
+    root_field: str, variables: dict, message: str
+) -> None:
+    client = _client()
+    client._client.execute_query = pytest.fail
+
+    with pytest.raises(GraphQLValidationError, match=message) as error:
+        client.query(root_field, FieldSelector().add_field("id"), **variables)
+
+    assert "API version 2025-04" in str(error.value)
+
+
+def test_schema_follows_the_api_version() -> None:
+    assert _client().schema is get_schema_index("2025-04")
+
+    builder = CustomMutationBuilder("eventsinkCreate").add_variable("input", {})
+    with pytest.raises(GraphQLValidationError):
+        builder.with_schema(get_schema_index("2024-10")).build_mutation()
+    builder.with_schema(get_schema_index("unstable"))
+    assert "$input:EventsinkCreateInput!" in builder.build_mutation()
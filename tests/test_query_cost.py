@@ -0,0 +1,120 @@
+"""Tests for query cost estimation and splitting expensive queries."""
+
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from shopify_partners_sdk import AsyncShopifyPartnersClient, ShopifyPartnersClient
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.exceptions.validation import QueryCostExceededError
+from shopify_partners_sdk.queries.cost import estimate_cost, max_page_size_within
+from shopify_partners_sdk.queries.fields import FieldSelector
+
+
+def _client(max_query_cost: Optional[int] = None, **values: Any):
+    settings = ShopifyPartnersSDKSettings(max_query_cost=max_query_cost, **values)
+    return ShopifyPartnersClient(1, "prtapi_test", settings=settings)
+
+
+def _transactions(client, first: int = 250, **variables: Any):
+    node = FieldSelector().add_field("id").add_money_field("netAmount")
+    edges = FieldSelector(["cursor"]).add_nested_field("node", node)
+    fields = FieldSelector().add_nested_field("edges", edges)
+    fields.add_nested_field("pageInfo", FieldSelector(["hasNextPage"]))
+    return client._field_based.query("transactions", fields, first=first, **variables)
+
+
+def test_estimate_cost_multiplies_nested_page_sizes() -> None:
+    field_based = _client()._field_based
+    events = FieldSelector().add_field("type")
+    app = FieldSelector().add_connection_field("events", events, first=100)
+
+    # app object + events connection + 100 event nodes
+    assert estimate_cost(field_based.query("app", app, id="1")) == 103
+    # connection + 250 transaction nodes, each with a Money object
+    assert estimate_cost(_transactions(_client())) == 2 + 250 * 2
+
+
+def test_estimate_cost_without_schema_uses_the_selection() -> None:
+    events = FieldSelector().add_field("type")
+    app = FieldSelector().add_connection_field("events", events, first=10)
+    builder = _client()._field_based.query("app", app, id="1")
+
+    assert estimate_cost(builder, schema=None) == 13
+
+
+@pytest.mark.parametrize(("budget", "page_size"), [(100, 49), (4, 1), (3, None)])
+def test_max_page_size_within(budget: int, page_size: Optional[int]) -> None:
+    assert max_page_size_within(_transactions(_client()), budget) == page_size
+
+
+def _serve_transactions(total: int, requests: list[dict[str, Any]]):
+    """Answer transaction page queries from ``total`` transactions."""
+
+    def execute(query: str, variables: dict[str, Any], **kwargs: Any) -> dict:
+        requests.append(variables)
+        start = int(variables.get("after") or 0)
+        end = min(start + variables["first"], total)
+        edges = [
+            {"cursor": str(number + 1), "node": {"id": str(number)}}
+            for number in range(start, end)
+        ]
+        page_info = {"hasNextPage": end < total}
+        return {"data": {"transactions": {"edges": edges, "pageInfo": page_info}}}
+
+    return execute
+
+
+@pytest.mark.parametrize(
+    ("total", "pages", "received"), [(1000, [49] * 5 + [5], 250), (60, [49, 49], 60)]
+)
+def test_expensive_query_is_split_into_pages(
+    total: int, pages: list[int], received: int
+) -> None:
+    client = _client(max_query_cost=100)
+    requests: list[dict[str, Any]] = []
+    client._client.execute_query = _serve_transactions(total, requests)
+
+    data = client._field_based.execute_query_builder(_transactions(client))
+
+    edges = data["transactions"]["edges"]
+    assert [request["first"] for request in requests] == pages
+    assert [edge["node"]["id"] for edge in edges] == [str(n) for n in range(received)]
+    assert requests[1]["after"] == "49"
+
+
+def test_async_client_splits_the_same_way() -> None:
+    client = AsyncShopifyPartnersClient(
+        1, "prtapi_test", settings=ShopifyPartnersSDKSettings(max_query_cost=100)
+    )
+    requests: list[dict[str, Any]] = []
+    serve = _serve_transactions(1000, requests)
+
+    async def execute(query: str, variables: dict[str, Any], **kwargs: Any) -> dict:
+        return serve(query, variables)
+
+    client._client.execute_query = execute
+    data = asyncio.run(client._field_based.execute_query_builder(_transactions(client)))
+
+    assert [request["first"] for request in requests] == [49] * 5 + [5]
+    assert len(data["transactions"]["edges"]) == 250
+
+
+def test_expensive_query_is_rejected_when_splitting_is_disabled() -> None:
+    client = _client(max_query_cost=100, split_expensive_queries=False)
+
+    with pytest.raises(QueryCostExceededError):
+        client._field_based.execute_query_builder(_transactions(client))
+
+
+def test_expensive_nested_connection_is_rejected() -> None:
+    client = _client(max_query_cost=100)
+    events = FieldSelector().add_field("type")
+    app = FieldSelector().add_connection_field("events", events, first=250)
+
+    # Only a root connection can be split into pages
+    with pytest.raises(QueryCostExceededError):
+        client._field_based.execute_query_builder(
+            client._field_based.query("app", app, id="1")
+        )
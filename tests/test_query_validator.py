@@ -0,0 +1,93 @@
+"""Tests for offline query validation."""
+
+import pytest
+
+from shopify_partners_sdk import ShopifyPartnersClient
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.exceptions.graphql import (
+    GraphQLMultipleErrors,
+    GraphQLSyntaxError,
+    GraphQLValidationError,
+)
+from shopify_partners_sdk.queries.fields import FieldSelector
+from shopify_partners_sdk.schema import QueryValidator, get_schema_index
+
+
+@pytest.fixture
+def validator() -> QueryValidator:
+    return QueryValidator(get_schema_index("2025-04"))
+
+
+@pytest.mark.parametrize(
+    ("document", "error"),
+    [
+        (
+            '{ app(id: "1") { nmae } }',
+            "Field 'nmae' doesn't exist on type 'App' (at app.nmae)",
+        ),
+        ("{ app { id } }", "Field 'app' is missing required argument 'id' (at app)"),
+        (
+            '{ app(id: "1", foo: 1) { id } }',
+            "Field 'app' doesn't accept argument 'foo' (at app)",
+        ),
+        (
+            '{ app(id: "1") }',
+            "Field 'app' of type 'App' must have a selection of subfields (at app)",
+        ),
+        (
+            '{ app(id: "1") { name { x } } }',
+            "Selections can't be made on field 'name' of type 'String' (at app.name)",
+        ),
+        ("query($id: ID!) { app(id: $x) { id } }", "Variable '$x' is not defined"),
+        (
+            "{ transactions { edges { node { ... on App { id } } } } }",
+            "Fragment on 'App' can't be spread inside 'Transaction' "
+            "(at transactions.edges.node)",
+        ),
+        ('{ app(id: "1" { id }', "Syntax Error: Expected a name, found '{'"),
+    ],
+)
+def test_diagnostics(validator: QueryValidator, document: str, error: str) -> None:
+    assert validator.validate(document) == (error,)
+
+
+def test_interface_selections_built_by_field_selectors_are_valid(
+    validator: QueryValidator,
+) -> None:
+    adjustment = FieldSelector().add_field("id").add_money_field("netAmount")
+    node = FieldSelector().add_field("id")
+    node.add_interface_field("AppSaleAdjustment", adjustment)
+    document = "{ transactions(first: 1) { edges { node { %s } } } }"
+
+    assert validator.validate(document % node.build_compact()) == ()
+    assert validator.validate(document % node.build()) == ()
+
+
+def test_results_are_cached_per_document(validator: QueryValidator) -> None:
+    document = '{ app(id: "1") { nmae } }'
+
+    first = validator.validate(document)
+
+    assert validator.validate(document) is first
+
+
+def test_assert_valid_raises_by_error_count(validator: QueryValidator) -> None:
+    validator.assert_valid('{ app(id: "1") { id name } }')
+
+    with pytest.raises(GraphQLValidationError):
+        validator.assert_valid('{ app(id: "1") { nmae } }')
+    with pytest.raises(GraphQLMultipleErrors):
+        validator.assert_valid('{ app(id: "1") { nmae apiKee } }')
+    with pytest.raises(GraphQLSyntaxError):
+        validator.assert_valid("{ app(")
+
+
+def test_client_rejects_invalid_queries_before_the_rate_limiter() -> None:
+    settings = ShopifyPartnersSDKSettings(api_version="2025-04", validate_queries=True)
+    client = ShopifyPartnersClient(1, "prtapi_test", settings=settings)
+    limiter = client._client.rate_limiter
+    limiter.acquire = pytest.fail
+    client._client._send_query = pytest.fail
+
+    with pytest.raises(GraphQLValidationError, match="nmae"):
+        client.execute_raw('{ app(id: "1") { nmae } }')
@@ -0,0 +1,356 @@
+"""Tests for the rate limiters."""
+
+import asyncio
+import threading
+import time
+from typing import Any, Union
+
+import pytest
+import requests
+
+from shopify_partners_sdk.client import rate_limiter as rate_limiter_module
+from shopify_partners_sdk.client.async_base import AsyncBaseGraphQLClient
+from shopify_partners_sdk.client.base import BaseGraphQLClient
+from shopify_partners_sdk.client.rate_limiter import (
+    AdaptiveRateLimiter,
+    CostAwareRateLimiter,
+    RateLimiter,
+    RequestPriority,
+    _RequestStats,
+    create_rate_limiter,
+)
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+from shopify_partners_sdk.exceptions.rate_limit import (
+    RateLimitExceededError,
+    RateLimitServerError,
+)
+
+
+def _extensions(available: float = 100.0, actual: float = 10.0) -> dict[str, Any]:
+    return {
+        "cost": {
+            "actualQueryCost": actual,
+            "throttleStatus": {
+                "maximumAvailable": 100.0,
+                "currentlyAvailable": available,
+                "restoreRate": 0.0,
+            },
+        }
+    }
+
+
+def _settings() -> ShopifyPartnersSDKSettings:
+    return ShopifyPartnersSDKSettings(
+        rate_limit_strategy="cost", rate_limit_per_second=10.0
+    )
+
+
+def _synced_limiter(
+    client: Union[BaseGraphQLClient, AsyncBaseGraphQLClient],
+) -> CostAwareRateLimiter:
+    limiter = client.rate_limiter
+    assert isinstance(limiter, CostAwareRateLimiter)
+    limiter.update_from_extensions(_extensions(actual=10.0))
+    limiter.update_from_extensions(_extensions(actual=10.0))
+    return limiter
+
+
+def test_settle_releases_the_reserved_cost() -> None:
+    limiter = CostAwareRateLimiter(rate_limit=1000.0)
+    limiter.update_from_extensions(_extensions(actual=40.0))
+
+    reserved = limiter.acquire(timeout=1)
+    # The expected cost moving on must not change what is released
+    limiter.update_from_extensions(_extensions(actual=90.0))
+    limiter.settle(reserved)
+
+    assert reserved > 0
+    assert limiter.get_stats()["in_flight_cost"] == 0.0
+
+
+@pytest.mark.parametrize(
+    "error",
+    [requests.ConnectionError("down"), RateLimitServerError(retry_after=None)],
+)
+def test_failed_requests_release_their_cost(error: Exception) -> None:
+    client = BaseGraphQLClient(1, "prtapi_test", _settings())
+    limiter = _synced_limiter(client)
+
+    def fail(payload: dict[str, Any]) -> dict[str, Any]:
+        raise error
+
+    client._execute_http_request = fail
+    for _ in range(12):
+        with pytest.raises(type(error)):
+            client._execute_request_with_rate_limiting({"query": "{ __typename }"})
+
+    assert limiter.get_stats()["in_flight_cost"] == 0.0
+    limiter.settle(limiter.acquire(timeout=1))
+
+
+def test_responses_without_cost_release_their_cost() -> None:
+    client = BaseGraphQLClient(1, "prtapi_test", _settings())
+    limiter = _synced_limiter(client)
+    client._execute_http_request = lambda payload: {"data": {}}
+
+    for _ in range(12):
+        client._execute_request_with_rate_limiting({"query": "{ __typename }"})
+
+    assert limiter.get_stats()["in_flight_cost"] == 0.0
+
+
+def test_failed_async_requests_release_their_cost() -> None:
+    client = AsyncBaseGraphQLClient(1, "prtapi_test", _settings())
+    limiter = _synced_limiter(client)
+
+    async def fail(payload: dict[str, Any]) -> dict[str, Any]:
+        raise requests.Timeout("slow")
+
+    client._execute_http_request = fail
+
+    async def run() -> None:
+        for _ in range(12):
+            with pytest.raises(requests.Timeout):
+                await client._execute_request_with_rate_limiting(
+                    {"query": "{ __typename }"}
+                )
+
+    asyncio.run(run())
+
+    assert limiter.get_stats()["in_flight_cost"] == 0.0
+
+
+def _adaptive(**values: Any) -> AdaptiveRateLimiter:
+    return AdaptiveRateLimiter(
+        rate_limit=8.0, floor=1.0, ceiling=8.0, increase=0.5, decrease=0.5, **values
+    )
+
+
+def test_adaptive_limiter_backs_off_once_per_throttle_event() -> None:
+    limiter = _adaptive()
+
+    limiter.record_throttle()
+    # Responses to requests already in flight report the same event
+    limiter.record_throttle()
+    assert limiter.rate_limit == 4.0
+    assert limiter.throttle_count == 1
+
+    for _ in range(5):
+        limiter._last_decrease = float("-inf")
+        limiter.record_throttle()
+    assert limiter.rate_limit == limiter.floor == 1.0
+
+
+def test_adaptive_limiter_recovers_additively_up_to_the_ceiling() -> None:
+    limiter = _adaptive()
+    limiter.record_throttle()
+
+    limiter.record_success()
+    assert limiter.rate_limit == 4.5
+    for _ in range(20):
+        limiter.record_success()
+    assert limiter.rate_limit == limiter.ceiling == 8.0
+
+
+def test_adaptive_limiter_honours_retry_after() -> None:
+    limiter = _adaptive()
+
+    limiter.record_throttle(retry_after=2.0)
+
+    with pytest.raises(RateLimitExceededError):
+        limiter.acquire(timeout=0.05)
+
+
+def test_adaptive_limiters_are_shared_per_organization() -> None:
+    settings = ShopifyPartnersSDKSettings(rate_limit_strategy="adaptive")
+
+    first = BaseGraphQLClient(101, "prtapi_test", settings).rate_limiter
+    same = BaseGraphQLClient(101, "prtapi_test", settings).rate_limiter
+    other = BaseGraphQLClient(102, "prtapi_test", settings).rate_limiter
+
+    assert isinstance(first, AdaptiveRateLimiter)
+    assert first is same
+    assert first is not other
+    assert create_rate_limiter(settings, "101") is first
+
+
+def _drained(rate_limit: float = 10.0, **values: Any) -> RateLimiter:
+    limiter = RateLimiter(rate_limit, ShopifyPartnersSDKSettings(**values))
+    assert limiter.try_acquire(rate_limit)
+    return limiter
+
+
+def test_callers_get_consecutive_slots_and_sleep_outside_the_lock(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    limiter = _drained()
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        assert not limiter._lock.locked()
+        sleeps.append(seconds)
+
+    monkeypatch.setattr(rate_limiter_module.time, "sleep", sleep)
+    for _ in range(4):
+        limiter.acquire(priority=RequestPriority.INTERACTIVE)
+
+    # Each caller is queued behind the ones that called before it
+    assert sleeps == pytest.approx([0.1, 0.2, 0.3, 0.4], abs=0.02)
+
+
+def test_deadline_that_cannot_be_met_reserves_nothing() -> None:
+    limiter = _drained()
+
+    with pytest.raises(RateLimitExceededError) as error:
+        limiter.acquire(deadline=time.monotonic() + 0.05)
+
+    assert error.value.retry_after == pytest.approx(0.1, abs=0.02)
+    assert limiter.blocked_requests == 1
+    # The next caller is not queued behind the failed one
+    assert limiter.reserve(1).delay == pytest.approx(0.1, abs=0.02)
+
+
+def _acquire_in_thread(
+    limiter: RateLimiter, priority: RequestPriority, granted: list[RequestPriority]
+) -> threading.Thread:
+    def run() -> None:
+        limiter.acquire(priority=priority)
+        granted.append(priority)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_higher_priority_requests_are_served_first() -> None:
+    limiter = _drained(rate_limit=20.0)
+    granted: list[RequestPriority] = []
+
+    threads = [_acquire_in_thread(limiter, RequestPriority.BULK, granted)]
+    time.sleep(0.01)
+    threads.append(_acquire_in_thread(limiter, RequestPriority.NORMAL, granted))
+    for thread in threads:
+        thread.join(5)
+
+    assert granted == [RequestPriority.NORMAL, RequestPriority.BULK]
+
+
+def test_bulk_requests_are_not_starved() -> None:
+    limiter = _drained(rate_limit=20.0, rate_limit_max_deferral=0.2)
+    granted: list[RequestPriority] = []
+    stop = threading.Event()
+
+    def keep_busy() -> None:
+        while not stop.is_set():
+            limiter.acquire(priority=RequestPriority.NORMAL)
+
+    busy = [threading.Thread(target=keep_busy) for _ in range(3)]
+    for thread in busy:
+        thread.start()
+    time.sleep(0.05)
+
+    start = time.monotonic()
+    _acquire_in_thread(limiter, RequestPriority.BULK, granted).join(5)
+    waited = time.monotonic() - start
+    stop.set()
+    for thread in busy:
+        thread.join(5)
+
+    # The bulk request joins the queue after max_deferral, so it waits for
+    # that plus the normal requests already queued
+    assert granted == [RequestPriority.BULK]
+    assert 0.2 <= waited < 0.6
+
+
+def test_reservations_are_due_in_order() -> None:
+    limiter = _drained()
+
+    first, second = limiter.reserve(5), limiter.reserve(5)
+    # More than the bucket capacity can be reserved at once
+    large = limiter.reserve(25)
+
+    assert first.delay == pytest.approx(0.5, abs=0.02)
+    assert second.delay == pytest.approx(1.0, abs=0.02)
+    assert large.delay == pytest.approx(3.5, abs=0.02)
+    assert not first.ready
+    assert first.state == "pending"
+
+
+def test_cancelled_reservations_return_their_tokens() -> None:
+    limiter = _drained()
+    reservation = limiter.reserve(5)
+
+    reservation.cancel()
+    reservation.cancel()
+
+    assert reservation.state == "cancelled"
+    assert limiter.reserve(5).delay == pytest.approx(0.5, abs=0.02)
+    with pytest.raises(ValueError):
+        reservation.commit()
+    with pytest.raises(ValueError):
+        reservation.wait()
+
+
+def test_committed_reservations_cannot_be_cancelled() -> None:
+    limiter = RateLimiter(10.0)
+    reservation = limiter.reserve(2)
+
+    assert reservation.ready
+    reservation.wait()
+
+    assert reservation.state == "committed"
+    with pytest.raises(ValueError):
+        reservation.cancel()
+    assert limiter.available_tokens == pytest.approx(8.0, abs=0.1)
+
+
+def test_acquire_multiple_is_all_or_nothing() -> None:
+    limiter = _drained()
+
+    with pytest.raises(RateLimitExceededError):
+        limiter.acquire_multiple(5, timeout=0.1)
+
+    assert limiter.reserve(1).delay == pytest.approx(0.1, abs=0.02)
+    limiter.reset()
+    limiter.acquire_multiple(10, timeout=0.1)
+    assert limiter.available_tokens < 1.0
+
+
+def test_statistics_use_constant_memory() -> None:
+    limiter = RateLimiter(1_000_000.0)
+    stats = limiter._stats
+    sizes = (len(stats._slot_ids), len(stats._waits))
+
+    for _ in range(5000):
+        assert limiter.try_acquire()
+
+    assert (len(stats._slot_ids), len(stats._waits)) == sizes
+    assert limiter.total_requests == 5000
+    assert limiter.get_stats()["current_rate"] == 5000
+
+
+def test_rates_cover_only_the_window() -> None:
+    stats = _RequestStats(window=0.1, slots=10)
+    for _ in range(3):
+        stats.record_request()
+    stats.record_blocked()
+
+    assert stats.request_rate == pytest.approx(30.0)
+    assert stats.blocked_rate == pytest.approx(10.0)
+    time.sleep(0.15)
+    assert stats.request_rate == stats.blocked_rate == 0.0
+    assert (stats.total_requests, stats.blocked_requests) == (3, 1)
+
+
+def test_wait_percentiles_use_the_most_recent_samples() -> None:
+    stats = _RequestStats(sample_size=100)
+    for wait_time in range(1000):
+        stats.record_request(float(wait_time))
+
+    percentiles = stats.wait_percentiles()
+
+    assert percentiles["wait_max"] == 999.0
+    assert percentiles["wait_p50"] == 949.0
+    assert percentiles["wait_p99"] == 998.0
+    stats.reset()
+    assert stats.wait_percentiles()["wait_max"] == 0.0
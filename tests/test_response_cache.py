@@ -0,0 +1,236 @@
+"""Tests for the response cache and its use by the clients."""
+
+import asyncio
+from pathlib import Path
+import stat
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from shopify_partners_sdk.client import cache as cache_module
+from shopify_partners_sdk.client.async_base import AsyncBaseGraphQLClient
+from shopify_partners_sdk.client.base import BaseGraphQLClient
+from shopify_partners_sdk.client.cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    SQLiteCacheBackend,
+    create_response_cache,
+)
+from shopify_partners_sdk.config import ShopifyPartnersSDKSettings
+
+ENDPOINT = "https://partners.shopify.com/1/api/2025-01/graphql.json"
+QUERY = "query Apps { publicApiVersions { handle } }"
+RESPONSE = {"data": {"publicApiVersions": [{"handle": "2025-01"}]}}
+
+
+class _Clock:
+    """Wall clock the cache module reads, moved by the tests."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock.time)
+    return clock
+
+
+def _key(cache: ResponseCache, query: str = QUERY, token: str = "prtapi_a") -> str:
+    key = cache.key(ENDPOINT, query, None, None, token)
+    assert key is not None
+    return key
+
+
+def test_responses_expire_after_their_ttl(clock: _Clock) -> None:
+    cache = ResponseCache(MemoryCacheBackend(), ttl=10.0, ttls={"Apps": 60.0})
+    key = _key(cache)
+    other = _key(cache, "{ app(id: 1) { id } }")
+
+    cache.set(key, RESPONSE, QUERY, "Apps")
+    cache.set(other, RESPONSE, "{ app(id: 1) { id } }", None)
+    clock.now += 30.0
+
+    # The per-operation TTL overrides the default one
+    assert cache.get(key) == (RESPONSE, True)
+    assert cache.get(other) is None
+    clock.now += 31.0
+    assert cache.get(key) is None
+    assert cache.get_stats()["misses"] == 2
+
+
+def test_stale_responses_are_served_while_revalidating(clock: _Clock) -> None:
+    cache = ResponseCache(MemoryCacheBackend(), ttl=10.0, stale_while_revalidate=5.0)
+    key = _key(cache)
+    cache.set(key, RESPONSE, QUERY, None)
+
+    clock.now += 12.0
+    assert cache.get(key) == (RESPONSE, False)
+    assert cache.start_refresh(key)
+    assert not cache.start_refresh(key)
+    cache.finish_refresh(key)
+
+    clock.now += 5.0
+    assert cache.get(key) is None
+    assert cache.get_stats()["stale_hits"] == 1
+
+
+def test_client_refreshes_stale_responses_in_the_background(clock: _Clock) -> None:
+    settings = ShopifyPartnersSDKSettings(
+        response_cache="memory",
+        response_cache_ttl=10.0,
+        response_cache_stale_while_revalidate=60.0,
+    )
+    client = BaseGraphQLClient(1, "prtapi_test", settings)
+    key = client._cache_key(QUERY, None, None)
+    sent: list[str] = []
+
+    def send(query: str, *args: Any) -> dict[str, Any]:
+        sent.append(query)
+        return {"data": {"publicApiVersions": [{"handle": str(len(sent))}]}}
+
+    client._send_query = send
+    first = client.execute_query(QUERY)
+    clock.now += 20.0
+
+    # The stale response is returned at once and refreshed behind it
+    assert client.execute_query(QUERY) == first
+    deadline = time.monotonic() + 5
+    while client._response_cache.get(key)[0] == first:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert client._response_cache.get(key) == (
+        {"data": {"publicApiVersions": [{"handle": "2"}]}},
+        True,
+    )
+    assert len(sent) == 2
+
+
+def test_memory_backend_evicts_least_recently_used_entries() -> None:
+    backend = MemoryCacheBackend(max_bytes=10)
+    servable = time.time() + 60.0
+    for key in "abc":
+        backend.set(key, ("xxxx", servable, servable))
+        if key == "b":
+            backend.get("a")
+
+    assert backend.size == 8
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+
+    backend.set("big", ("x" * 11, servable, servable))
+    assert backend.get("big") is None
+    assert backend.size == 8
+
+
+def test_mutations_are_not_cached() -> None:
+    cache = ResponseCache(MemoryCacheBackend())
+    mutation = "mutation { appSubscriptionCreate { id } }"
+
+    assert cache.key(ENDPOINT, mutation, None, None, "prtapi_a") is None
+
+    client = BaseGraphQLClient(
+        1, "prtapi_test", ShopifyPartnersSDKSettings(response_cache="memory")
+    )
+    sent: list[str] = []
+    client._send_query = lambda query, *args: sent.append(query) or {"data": {}}
+    client.execute_query(mutation)
+    client.execute_query(mutation)
+
+    assert len(sent) == 2
+    assert client._response_cache.get_stats()["misses"] == 0
+
+
+def test_cache_keys_depend_on_the_access_token() -> None:
+    cache = ResponseCache(MemoryCacheBackend())
+
+    assert _key(cache, token="prtapi_a") == _key(cache, token="prtapi_a")
+    assert _key(cache, token="prtapi_a") != _key(cache, token="prtapi_b")
+    assert "prtapi_a" not in _key(cache, token="prtapi_a")
+
+
+def test_clients_with_other_tokens_do_not_share_responses() -> None:
+    settings = ShopifyPartnersSDKSettings(response_cache="memory")
+    first = BaseGraphQLClient(1, "prtapi_a", settings)
+    second = BaseGraphQLClient(1, "prtapi_b", settings)
+    second._response_cache = first._response_cache
+    sent: list[str] = []
+    for client in (first, second):
+        client._send_query = lambda query, *args: sent.append(query) or RESPONSE
+
+    first.execute_query(QUERY)
+    second.execute_query(QUERY)
+
+    assert len(sent) == 2
+
+
+def test_default_sqlite_cache_is_private(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache = create_response_cache(ShopifyPartnersSDKSettings(response_cache="sqlite"))
+    assert cache is not None
+    key = _key(cache)
+
+    cache.set(key, RESPONSE, QUERY, None)
+    path = cache.backend._path
+
+    try:
+        assert path.is_relative_to(tmp_path)
+        assert stat.S_IMODE(path.parent.stat().st_mode) == 0o700
+        assert stat.S_IMODE(path.stat().st_mode) == 0o600
+        assert cache.get(key) == (RESPONSE, True)
+    finally:
+        cache.close()
+
+
+class _RecordingBackend(SQLiteCacheBackend):
+    """SQLite backend recording the threads its operations run on."""
+
+    def __init__(self, path: Path) -> None:
+        super().__init__(path)
+        self.threads: list[int] = []
+
+    def get(self, key: str):
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key: str, entry) -> None:
+        self.threads.append(threading.get_ident())
+        super().set(key, entry)
+
+
+def test_async_client_runs_sqlite_operations_off_the_event_loop(
+    tmp_path: Path,
+) -> None:
+    client = AsyncBaseGraphQLClient(
+        1, "prtapi_test", ShopifyPartnersSDKSettings(response_cache="memory")
+    )
+    backend = _RecordingBackend(tmp_path / "responses.sqlite")
+    client._response_cache = ResponseCache(backend)
+    loop_threads: list[int] = []
+
+    async def send(query: str, *args: Any) -> dict[str, Any]:
+        loop_threads.append(threading.get_ident())
+        return RESPONSE
+
+    client._send_query = send
+
+    async def run() -> list[dict[str, Any]]:
+        return [await client.execute_query(QUERY) for _ in range(2)]
+
+    try:
+        assert asyncio.run(run()) == [RESPONSE, RESPONSE]
+    finally:
+        backend.close()
+
+    # Miss, store, hit
+    assert len(backend.threads) == 3
+    assert loop_threads[0] not in backend.threads
@@ -0,0 +1,47 @@
+"""Tests for schema index artifacts."""
+
+from pathlib import Path
+
+import pytest
+
+from shopify_partners_sdk.schema import SchemaIndex, load_artifact, write_artifact
+from shopify_partners_sdk.schema.artifact import MAGIC
+from shopify_partners_sdk.schema.loader import SOURCE_SCHEMA_DIR
+
+INTROSPECTION = SOURCE_SCHEMA_DIR / "2025-04" / "introspection.json"
+
+
+def _tables(index: SchemaIndex) -> dict:
+    data = index.to_data()
+    return {**data, "types": dict(data["types"])}
+
+
+def test_artifact_round_trip(tmp_path: Path) -> None:
+    index = SchemaIndex.from_file(INTROSPECTION, "2025-04")
+    path = tmp_path / "schema.idx"
+    write_artifact(index, path)
+
+    loaded = load_artifact(path, "2025-04")
+
+    assert _tables(loaded) == _tables(index)
+    assert loaded.get_argument_type(
+        "QueryRoot", "transactions", "types"
+    ) == index.get_argument_type("QueryRoot", "transactions", "types")
+
+
+def test_artifact_is_plain_json_after_preamble(tmp_path: Path) -> None:
+    path = tmp_path / "schema.idx"
+    write_artifact(SchemaIndex.from_file(INTROSPECTION), path)
+
+    content = path.read_bytes()
+
+    assert content.startswith(MAGIC)
+    assert b'"query_type":"QueryRoot"' in content
+
+
+def test_incompatible_artifact_is_rejected(tmp_path: Path) -> None:
+    path = tmp_path / "schema.idx"
+    path.write_bytes(MAGIC + b"\x01\x00\x00\x00\x00")
+
+    with pytest.raises(ValueError, match="Incompatible"):
+        load_artifact(path)
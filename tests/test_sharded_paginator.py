@@ -0,0 +1,128 @@
+"""Tests for time-window sharded pagination."""
+
+from datetime import datetime, timedelta, timezone
+import threading
+import time
+
+import pytest
+
+from shopify_partners_sdk.models.base import Connection, Edge, PageInfo
+from shopify_partners_sdk.pagination import ShardedPaginator
+from shopify_partners_sdk.pagination.sharded import _parse_datetime
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class _Edge(Edge):
+    node: dict
+
+
+class _Connection(Connection):
+    edges: list[_Edge]
+
+
+class _FetchError(Exception):
+    pass
+
+
+def _records(count: int, step: timedelta) -> list[dict]:
+    return [
+        {
+            "id": f"gid://partners/Transaction/{i}",
+            "createdAt": (START + step * i).isoformat().replace("+00:00", "Z"),
+        }
+        for i in range(count)
+    ]
+
+
+class _Source:
+    """Fake date-filterable connection sorted by createdAt."""
+
+    def __init__(self, records: list[dict], fail_after: int = 0) -> None:
+        self.records = records
+        self.fail_after = fail_after
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, first, createdAtMin, createdAtMax, after=None, **_):
+        with self.lock:
+            self.calls += 1
+            calls = self.calls
+        if self.fail_after and calls > self.fail_after:
+            raise _FetchError("fetch failed")
+        low, high = _parse_datetime(createdAtMin), _parse_datetime(createdAtMax)
+        matching = [
+            record
+            for record in self.records
+            if low <= _parse_datetime(record["createdAt"]) <= high
+        ]
+        offset = int(after) if after else 0
+        page = matching[offset : offset + first]
+        return _Connection(
+            page_info=PageInfo(
+                has_next_page=offset + first < len(matching),
+                has_previous_page=False,
+            ),
+            edges=[
+                _Edge(cursor=str(offset + index + 1), node=record)
+                for index, record in enumerate(page)
+            ],
+        )
+
+
+def _paginator(source, count, step, **kwargs) -> ShardedPaginator:
+    return ShardedPaginator(
+        source, {}, start=START, end=START + step * (count - 1), **kwargs
+    )
+
+
+@pytest.mark.parametrize("adaptive", [False, True])
+def test_yields_every_node_once_in_order(adaptive):
+    # Window bounds fall exactly on records, which both windows then return
+    records = _records(97, timedelta(hours=1))
+    paginator = _paginator(
+        _Source(records),
+        97,
+        timedelta(hours=1),
+        shards=4,
+        page_size=5,
+        adaptive=adaptive,
+    )
+
+    nodes = list(paginator.nodes())
+
+    assert nodes == records
+    assert (paginator.windows_split > 0) == adaptive
+
+
+def test_early_break_stops_fetching():
+    source = _Source(_records(2000, timedelta(minutes=1)))
+    paginator = _paginator(
+        source,
+        2000,
+        timedelta(minutes=1),
+        shards=4,
+        page_size=10,
+        adaptive=False,
+        window_buffer=1,
+    )
+
+    for index, _ in enumerate(paginator.nodes()):
+        if index == 15:
+            break
+    time.sleep(0.5)
+    calls = source.calls
+    time.sleep(0.5)
+
+    assert source.calls == calls
+    assert calls < 20
+
+
+def test_fetch_error_is_raised():
+    source = _Source(_records(500, timedelta(minutes=1)), fail_after=6)
+    paginator = _paginator(
+        source, 500, timedelta(minutes=1), shards=4, page_size=10, adaptive=False
+    )
+
+    with pytest.raises(_FetchError):
+        list(paginator.nodes())